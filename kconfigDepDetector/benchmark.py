@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""性能测试脚本, 用于观察各处理阶段的耗时随输入规模的变化
+
+用法: python3 benchmark.py [测试项 ...], 不指定测试项时运行全部测试
+测试项包括:
+    * help: 预处理词法分析器处理长help文本的耗时,
+            help行数翻倍时耗时应近似翻倍(线性), 而不是变为4倍(平方)
+    * expr: 语法分析器处理长depends表达式的耗时, 同样应为线性
+    * startup: check_kconfig_dep.py的启动耗时(子进程, 取多次运行的最小值),
+               -h只包含导入时间, check为已有解析结果时检查200个配置项的完整耗时,
+               只需要导入检查阶段, 不应构建预处理和Kconfig的分析器
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from tools import config_yacc
+from tools import preprocess
+
+
+def help_kconfig(lines):
+    """ 生成包含一段长help文本的Kconfig文件内容
+    参数:
+        lines: help文本行数
+    """
+    data = "config BENCH_A\n\tbool \"bench a\"\n\thelp\n"
+    for i in range(lines):
+        data += "\t  help text line {} of a very long help block.\n".format(i)
+    data += "\nconfig BENCH_B\n\tbool \"bench b\"\n"
+    return data
+
+
+def bench_help():
+    print("{:<40}".format("[Benchmark help]") + "lines / seconds / us per line")
+    last = None
+    for lines in (2000, 4000, 8000, 16000):
+        data = help_kconfig(lines)
+        begin = time.perf_counter()
+        preprocess.lex_file('', '/bench/Kconfig', data)
+        cost = time.perf_counter() - begin
+        ratio = '' if last is None else "x{:.2f}".format(cost / last)
+        print("{:<40}".format("") + "{:>6} {:>10.4f} {:>8.2f} {}".format(lines, cost, cost / lines * 1e6, ratio))
+        last = cost
+
+
+def expr_kconfig(terms):
+    """ 生成包含一条很长的depends表达式的Kconfig文件内容
+    参数:
+        terms: 表达式中的配置项数量
+    """
+    data = "path \"/Kconfig\"\nconfig BENCH_A\n\tbool \"bench a\"\n\tdepends on BENCH_0"
+    for i in range(1, terms):
+        data += " && BENCH_{}".format(i) if i % 2 else " || !BENCH_{}".format(i)
+    data += "\n\tdefault y\nendpath\n"
+    return data
+
+
+def bench_expr():
+    print("{:<40}".format("[Benchmark expr]") + "terms / seconds / us per term")
+    last = None
+    for terms in (2000, 4000, 8000, 16000):
+        data = expr_kconfig(terms)
+        begin = time.perf_counter()
+        with config_yacc.KconfigParser() as kconfig:
+            kconfig.parse(data)
+        cost = time.perf_counter() - begin
+        ratio = '' if last is None else "x{:.2f}".format(cost / last)
+        print("{:<40}".format("") + "{:>6} {:>10.4f} {:>8.2f} {}".format(terms, cost, cost / terms * 1e6, ratio))
+        last = cost
+
+
+def startup_kconfig(configs):
+    """ 生成包含configs个配置项的预处理结果, 相邻配置项之间存在依赖
+    参数:
+        configs: 配置项数量
+    """
+    data = "path \"/Kconfig\"\n"
+    for i in range(configs):
+        data += "config BENCH_{}\n\tbool \"bench {}\"\n".format(i, i)
+        if i > 0:
+            data += "\tdepends on BENCH_{}\n".format(i - 1)
+        data += "\tdefault y\n"
+    data += "endpath\n"
+    return data
+
+
+def run_best(args, cwd, times=10):
+    """ 多次运行子进程, 返回最短耗时 """
+    best = None
+    for i in range(times):
+        begin = time.perf_counter()
+        subprocess.run(args, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        cost = time.perf_counter() - begin
+        best = cost if best is None else min(best, cost)
+    return best
+
+
+def bench_startup():
+    print("{:<40}".format("[Benchmark startup]") + "step / milliseconds")
+    home = os.path.dirname(os.path.abspath(__file__))
+    folder = tempfile.mkdtemp()
+    try:
+        # 在临时目录中准备bench版本x86架构的解析结果和待检查的配置文件
+        prefix = os.path.join(folder, 'bench-x86', 'bench_x86')
+        os.mkdir(os.path.dirname(prefix))
+        with open(prefix + '.Kconfig', 'w') as file:
+            file.write(startup_kconfig(200))
+        with open(os.devnull, 'w') as null:
+            stdout = sys.stdout
+            sys.stdout = null
+            try:
+                config_yacc.ParseKconfig(prefix + '.Kconfig', prefix + '_config.json', prefix + '_dep.json', False)
+            finally:
+                sys.stdout = stdout
+        check_file = os.path.join(folder, 'bench.config')
+        with open(check_file, 'w') as file:
+            file.write(''.join("CONFIG_BENCH_{}=y\n".format(i) for i in range(200)))
+
+        steps = [
+            ('python', [sys.executable, '-c', 'pass']),
+            ('import tools', [sys.executable, '-c', 'import tools']),
+            ('-h', [sys.executable, os.path.join(home, 'check_kconfig_dep.py'), '-h']),
+            ('check', [sys.executable, os.path.join(home, 'check_kconfig_dep.py'), '-c', check_file,
+                       '-v', 'bench', '-s', folder, '-o', folder, '-a', 'x86']),
+        ]
+        for (name, args) in steps:
+            cost = run_best(args, home)
+            print("{:<40}".format("") + "{:<14} {:>8.1f}".format(name, cost * 1000))
+    finally:
+        shutil.rmtree(folder)
+
+
+BENCHMARKS = {
+    'help': bench_help,
+    'expr': bench_expr,
+    'startup': bench_startup,
+}
+
+
+def main():
+    names = sys.argv[1:] if len(sys.argv) > 1 else list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print('benchmark.py [' + '|'.join(BENCHMARKS) + '] ...')
+            sys.exit(2)
+        BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    main()
@@ -48,9 +48,17 @@ import sys
 # import kconfigDepDetector.tools
 from tools import check_folder
 from tools import check_file_data
-from tools import preprocessing
+from tools import preprocessing_archs
+from tools import preprocess_parse
 from tools import parse
 from tools import check
+from tools import batch_check
+from tools import check_baseline
+from tools import recheck
+from tools import build_knowledge
+from tools import build_expr
+from tools import get_expr_path
+from tools import PROGRESS
 
 
 def print_result(save_file):
@@ -119,62 +127,203 @@ def print_result(save_file):
         print("No error detected!")
 
 
-def umain(linux, tag, arch, configPath, save_folder=''):
+def parse_edit(line):
+    """ 解析配置项修改, 格式为NAME=VALUE, 多个以逗号分隔, CONFIG_前缀可省略, VALUE为空时删除该配置项
+
+    Args:
+        line (str): 修改内容
+
+    Returns:
+        dict: {配置项名称 : 新取值}, 删除时取值为None
+    """
+    changes = {}
+    for item in line.split(','):
+        item = item.strip()
+        if len(item) == 0:
+            continue
+        (name, value) = item.split('=', 1) if '=' in item else (item, '')
+        name = name.strip()
+        if name[0:7] == 'CONFIG_':
+            name = name[7:]
+        value = value.strip()
+        changes[name] = value if len(value) > 0 else None
+    return changes
+
+
+def print_change(result):
+    """ 终端打印重新检查后错误的变化 """
+    for key in ('added', 'removed', 'changed'):
+        if len(result[key]) > 0:
+            print("{:<40}".format("[Recheck " + key + "]") + ' '.join(result[key]))
+
+
+def check_knowledge(db, config, config_dep):
+    """ 已有的知识库可以直接使用: 文件不为空且不早于解析结果
+        知识库为SQLite文件, 不能使用check_file_data按文本读取
+
+    Args:
+        db (str): 知识库文件路径
+        config (str): 生成知识库的_config.json文件路径
+        config_dep (str): 生成知识库的_dep.json文件路径
+
+    Returns:
+        bool: 知识库可以直接使用
+    """
+    if not (os.path.isfile(db) and os.path.getsize(db) > 0):
+        return False
+    return os.path.getmtime(db) >= max(os.path.getmtime(config), os.path.getmtime(config_dep))
+
+
+def get_config_files(configPath):
+    """ 批量检查时目录下的待检查文件, 按文件名排序 """
+    return [os.path.join(configPath, name) for name in sorted(os.listdir(configPath))
+            if os.path.isfile(os.path.join(configPath, name))]
+
+
+def get_save_files(folder, tag, arch, configPath):
+    """ 检查结果文件, 批量检查时为每个文件生成tag_arch_文件名_error.json """
+    if os.path.isdir(configPath):
+        return [folder + tag + '_' + arch + '_' + os.path.basename(path) + '_error.json'
+                for path in get_config_files(configPath)]
+    return [folder + tag + '_' + arch + '_error.json']
+
+
+def umain(linux, tag, arch, configPath, save_folder='', jobs=1, cache=None, discover='walk', git=False, progress=None, kb=False,
+          fused=False, keep=False, simplify=False, help=True, edit=None):
     """检查内核配置文件主函数
 
     Args:
         linux (str): 内核源码路径
         tag (str): 内核版本号
-        arch (str): 体系架构
-        configPath (str): 待检查内核配置文件路径
+        arch (str): 体系架构, 多个架构以逗号分隔, 例如x86,arm64
+        configPath (str): 待检查内核配置文件路径, 为目录时批量检查其中的所有文件
         save_folder (str, optional): 输出结果路径. Defaults to ''默认当前路径
+        jobs (int, optional): 预处理阶段词法分析以及解析阶段的进程数. Defaults to 1
+        cache (str, optional): 预处理词法分析缓存文件路径. Defaults to None不使用缓存
+        discover (str, optional): Kconfig文件发现方式, walk或source. Defaults to 'walk'
+        git (bool, optional): linux为git仓库, 直接读取tag版本的Kconfig文件而不需要检出. Defaults to False
+        progress (str, optional): 以JSON lines格式输出处理进度的文件, '-'为标准错误. Defaults to None不输出
+        kb (bool, optional): 生成SQLite知识库tag_arch.db, 检查时按需读取配置项. Defaults to False
+        fused (bool, optional): 预处理与解析同时进行, 不生成.Kconfig文件. Defaults to False
+        keep (bool, optional): 融合模式下仍然生成.Kconfig文件, 用于调试. Defaults to False
+        simplify (bool, optional): 解析时化简预编译的依赖表达式, 检查结果不变. Defaults to False
+        help (bool, optional): 解析时保存help文本, False时由get_help按需生成help文件. Defaults to True
+        edit (str, optional): 检查后修改配置项并重新检查, 格式见parse_edit, '-'为从标准输入逐行读取. Defaults to None
     """
+    if progress is not None:
+        PROGRESS.open_stream(progress)
     
+    # 多个架构以逗号分隔
+    archs = arch.split(',')
+
     # 检测保存文件夹是否存在
     home = os.getcwd()
-    if len(save_folder) == 0:
-        folder = check_folder(home + save_folder, tag, arch)
-    else:
-        folder = check_folder(save_folder, tag, arch)
-    
-    # 删除同一版本历史检查结果
-    save_file = folder + tag + '_' + arch + '_error.json'
-    if os.path.exists(save_file):
-        os.remove(save_file)
+    folders = {}
+    for arch in archs:
+        if len(save_folder) == 0:
+            folder = check_folder(home + save_folder, tag, arch)
+        else:
+            folder = check_folder(save_folder, tag, arch)
+        folders[arch] = folder
+
+        # 删除同一版本历史检查结果
+        for save_file in get_save_files(folder, tag, arch, configPath):
+            if os.path.exists(save_file):
+                os.remove(save_file)
 
     # 终端打印中间处理过程
     display = True
     
-    # 预处理阶段
-    Kconfig = folder + tag + '_' + arch + '.Kconfig'
-    if check_file_data(Kconfig):
-        print("{:<40}".format("[Have preprocessing]") + "file => " + Kconfig)
-    else:
-        preprocessing(linux, arch, Kconfig, display)
-        print("{:<40}".format("[Preprocessing end]") + "file => " + Kconfig)
-
-    # Kconfig解析器
-    config = folder + tag + '_' + arch + '_config.json'
-    config_dep = folder + tag + '_' + arch + '_dep.json'
-    if check_file_data(config) and check_file_data(config_dep):
-        print("{:<40}".format("[Kconfig has been parsed!]") + "file => " + config)
-        print("{:<40}".format("") + "file => " + config)
-    else:
-        parse(Kconfig, config, config_dep, display)
+    # 预处理阶段, 多个架构一次完成, 共用词法分析结果
+    targets = []
+    for arch in archs:
+        folder = folders[arch]
+        Kconfig = folder + tag + '_' + arch + '.Kconfig'
+        if fused:
+            # 融合模式, 只处理未解析的架构
+            config = folder + tag + '_' + arch + '_config.json'
+            config_dep = folder + tag + '_' + arch + '_dep.json'
+            if not (check_file_data(config) and check_file_data(config_dep)):
+                targets.append(arch)
+        elif check_file_data(Kconfig):
+            print("{:<40}".format("[Have preprocessing]") + "file => " + Kconfig)
+        else:
+            targets.append(arch)
+    if fused and len(targets) > 0:
+        # 跳过help文本时get_help需要重新分析.Kconfig文件, 同样保留
+        Kconfigs = [folders[arch] + tag + '_' + arch + '.Kconfig' if keep or not help else None for arch in targets]
+        configs = [folders[arch] + tag + '_' + arch + '_config.json' for arch in targets]
+        config_deps = [folders[arch] + tag + '_' + arch + '_dep.json' for arch in targets]
+        preprocess_parse(linux, targets, Kconfigs, configs, config_deps, display, jobs, cache, discover,
+                         tag if git else None, simplify, help)
+    elif len(targets) > 0:
+        Kconfigs = [folders[arch] + tag + '_' + arch + '.Kconfig' for arch in targets]
+        preprocessing_archs(linux, targets, Kconfigs, display, jobs, cache, discover, tag if git else None)
+        for Kconfig in Kconfigs:
+            print("{:<40}".format("[Preprocessing end]") + "file => " + Kconfig)
 
-    # 检查配置文件
-    check(config_dep, config, configPath, save_file)
-    
-    # 终端打印输出结果
-    print_result(save_file)
+    for arch in archs:
+        folder = folders[arch]
+        Kconfig = folder + tag + '_' + arch + '.Kconfig'
+        save_file = folder + tag + '_' + arch + '_error.json'
+
+        # Kconfig解析器
+        config = folder + tag + '_' + arch + '_config.json'
+        config_dep = folder + tag + '_' + arch + '_dep.json'
+        parsed = True
+        if fused and arch in targets:
+            pass
+        elif check_file_data(config) and check_file_data(config_dep):
+            print("{:<40}".format("[Kconfig has been parsed!]") + "file => " + config)
+            print("{:<40}".format("") + "file => " + config)
+            parsed = False
+            # 早期版本的解析结果没有预编译的依赖表达式
+            if not check_file_data(get_expr_path(config_dep)):
+                build_expr(config_dep, simplify)
+        else:
+            parse(Kconfig, config, config_dep, display, jobs, simplify, help)
+
+        # 知识库, 增量检查需要遍历全部配置项, 仍然读取json文件
+        if kb:
+            db = folder + tag + '_' + arch + '.db'
+            # 本次重新解析或解析结果更新时重新生成知识库
+            if parsed or not check_knowledge(db, config, config_dep):
+                build_knowledge(config, config_dep, db)
+            if edit is None or os.path.isdir(configPath):
+                config = config_dep = db
+
+        # 检查配置文件
+        if os.path.isdir(configPath):
+            # 批量检查, 只打印存在错误的文件数量
+            save_files = get_save_files(folder, tag, arch, configPath)
+            failed = batch_check(config_dep, config, get_config_files(configPath), save_files)
+            count = len([item for item in save_files if os.path.exists(item)])
+            print("{:<40}".format("[Batch check end]") + "{} of {} files have errors".format(count, len(save_files)))
+            if len(failed) > 0:
+                print("{:<40}".format("[Batch check failed]") + "{} files => ".format(len(failed)) + ' '.join(failed))
+            continue
+        if edit is None:
+            check(config_dep, config, configPath, save_file)
+        else:
+            check_baseline(config_dep, config, configPath, save_file)
+            lines = sys.stdin if edit == '-' else [edit]
+            for line in lines:
+                changes = parse_edit(line)
+                if len(changes) > 0:
+                    print_change(recheck(changes, save_file))
+        
+        # 终端打印输出结果
+        print_result(save_file)
+
+    PROGRESS.close_stream()
 
 
 def main():
     argv = sys.argv[1:]
     try:
-        opts, args = getopt.getopt(argv, "hc:v:s:o:a:", ["check=","version=","src=","arch"])
+        opts, args = getopt.getopt(argv, "hc:v:s:o:a:j:k:d:gp:bfKSNe:", ["check=","version=","src=","arch","jobs=","cache=","discover=","git","progress=","kb","fused","keep-kconfig","simplify","no-help","edit="])
     except getopt.GetoptError:
-        print('check_kconfig_dep.py -c <checkfile> -v <kernelversion> -s <sourcecode> -o <output> -a <arch>')
+        print('check_kconfig_dep.py -c <checkfile> -v <kernelversion> -s <sourcecode> -o <output> -a <arch> -j <jobs> -k <cache> -d <walk|source> -g -p <progress> -b -f -K -S -N -e <edit>')
         sys.exit(2)
         
     tmpdir = os.getcwd()
@@ -191,10 +340,32 @@ def main():
         arch = localarch
     # 输出路径
     save_folder=''
+    # 预处理、解析进程数
+    jobs = 1
+    # 词法分析缓存文件
+    cache = None
+    # Kconfig文件发现方式
+    discover = 'walk'
+    # 从git仓库读取源码
+    git = False
+    # 进度流文件
+    progress = None
+    # 使用知识库
+    kb = False
+    # 融合预处理与解析
+    fused = False
+    # 融合模式下保留.Kconfig文件
+    keep = False
+    # 化简预编译的依赖表达式
+    simplify = False
+    # 解析时跳过help文本
+    help = True
+    # 检查后修改的配置项
+    edit = None
 
     for opt, arg in opts:
         if opt == '-h':
-            print ('checkKconfigDep.py -c <checkfile> -v <kernelversion> -s <sourcecode> -o <output> -a <arch>')
+            print ('checkKconfigDep.py -c <checkfile> -v <kernelversion> -s <sourcecode> -o <output> -a <arch> -j <jobs> -k <cache> -d <walk|source> -g -p <progress> -b -f -K -S -N -e <edit>')
             sys.exit()
         elif opt in ("-c", "--checkfile"):
             configPath = arg
@@ -206,8 +377,33 @@ def main():
             arch = arg
         elif opt in ("-o", "--output"):
             save_folder = arg+'/'
+        elif opt in ("-j", "--jobs"):
+            jobs = int(arg)
+        elif opt in ("-k", "--cache"):
+            cache = arg
+        elif opt in ("-d", "--discover"):
+            if arg not in ('walk', 'source'):
+                print('check_kconfig_dep.py -c <checkfile> -v <kernelversion> -s <sourcecode> -o <output> -a <arch> -j <jobs> -k <cache> -d <walk|source> -g -p <progress> -b -f -K -S -N -e <edit>')
+                sys.exit(2)
+            discover = arg
+        elif opt in ("-g", "--git"):
+            git = True
+        elif opt in ("-p", "--progress"):
+            progress = arg
+        elif opt in ("-b", "--kb"):
+            kb = True
+        elif opt in ("-f", "--fused"):
+            fused = True
+        elif opt in ("-K", "--keep-kconfig"):
+            keep = True
+        elif opt in ("-S", "--simplify"):
+            simplify = True
+        elif opt in ("-N", "--no-help"):
+            help = False
+        elif opt in ("-e", "--edit"):
+            edit = arg
     
-    umain(linux, tag, arch, configPath, save_folder)
+    umain(linux, tag, arch, configPath, save_folder, jobs, cache, discover, git, progress, kb, fused, keep, simplify, help, edit)
 
 
 if __name__ == '__main__':
@@ -32,19 +32,22 @@ def get_help(SourcePath, SavePath):
     """获取内核配置项help信息
 
     Args:
-        SourcePath (str): 内核源码路径
+        SourcePath (str): 解析生成的_config.json文件路径, 也可以是知识库文件(.db)
         SavePath (str): 输出结果路径
     """
-    data = tools.load_json(SourcePath)
     ConfigPath = {}
+    if SourcePath.endswith('.db'):
+        data = tools.KnowledgeBase(SourcePath).all_help()
+    else:
+        # 解析时跳过help的结果在这里按需生成help文件
+        data = tools.load_help(SourcePath)
+        if data is None:
+            return
     for item in data:
-        ConfigPath[item] = []
-        for ptr in data[item]:
-            help = ptr['help'].replace('\n\t\t', '').replace('\t\t', '')
-            ConfigPath[item].append(help)
+        ConfigPath[item] = [help.replace('\n\t\t', '').replace('\t\t', '') for help in data[item]]
 
     print("{:<40}".format("[Prepare write ConfigHelp]") + "file => " + SavePath)
-    tools.write_json_file(ConfigPath, SavePath)
+    tools.write_json(ConfigPath, SavePath)
 
 
 if __name__ == '__main__':
@@ -10,7 +10,7 @@
 # See the Mulan PSL v2 for more details.
 # **********************************************************************/
 """此文件用于生成配置项的父类或子类配置项
-函数依赖于main.py生成的dep.json文件
+函数依赖于main.py生成的dep.json文件, 也可以使用知识库文件(.db)
 
 这里的子类配置从作用角度出发
 一切会对当前配置产生影响的配置项均认为是其父类配置项
@@ -27,8 +27,11 @@ def get_kid(config_dep, save):
         config_dep (str): 待查询配置项名称
         save (str): 子类配置项集合输出文件
     """
-    dep_data = tools.load_json(config_dep)
-    jsondata = tools.make_dict(dep_data, True)
+    if config_dep.endswith('.db'):
+        jsondata = tools.KnowledgeBase(config_dep).all_edge('father', True)
+    else:
+        dep_data = tools.load_dep(config_dep)
+        jsondata = tools.make_dict(dep_data, True)
     print("{:<40}".format("[Prepare write ConfigPath]") + "file => " + save)
     tools.write_json(jsondata, save)
 
@@ -40,8 +43,11 @@ def get_father(config_dep, save):
         config_dep (str): 待查询配置项名称
         save (str): 父类配置项集合输出文件
     """
-    dep_data = tools.load_json(config_dep)
-    jsondata = tools.make_dict(dep_data, False)
+    if config_dep.endswith('.db'):
+        jsondata = tools.KnowledgeBase(config_dep).all_edge('father', False)
+    else:
+        dep_data = tools.load_dep(config_dep)
+        jsondata = tools.make_dict(dep_data, False)
     print("{:<40}".format("[Prepare write ConfigPath]") + "file => " + save)
     tools.write_json(jsondata, save)
 
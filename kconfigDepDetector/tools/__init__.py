@@ -11,27 +11,88 @@
 # **********************************************************************/
 __all__ = ['preprocess.py', 'config_yacc.py', 'check.py']
 
+import importlib
 import os
 
 from .check import Checker
-from .config_yacc import ParseKconfig
-from .preprocess import preprocessing as inner_preprocessing
+from .expr import get_expr_path
+from .progress import PROGRESS
 from .utils import load_Kconfig as inner_load_Kconfig
 from .utils import load_json as inner_load_json
+from .utils import load_dep as inner_load_dep
+from .utils import load_config as inner_load_config
+from .utils import expand_dep as inner_expand_dep
 from .utils import write_json_file as inner_write_json_file
 from .utils import get_word as inner_get_word
 from .utils import dict_add_item as inner_dict_add_item
 
+# 预处理和语法分析阶段在第一次使用时才导入, 导入时会构建对应的ply词法分析器和语法分析器
+# 已有解析结果时只需要检查阶段, 不需要构建预处理和Kconfig的分析器
+LAZY = {
+    'ParseKconfig': ('.config_yacc', 'ParseKconfig'),
+    'KnowledgeBase': ('.knowledge', 'KnowledgeBase'),
+}
 
-def preprocessing(root, target, file, display) -> None:
+
+def __getattr__(name):
+    if name not in LAZY:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    (module, attr) = LAZY[name]
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def preprocessing(root, target, file, display, jobs=1, cache=None, discover='walk', rev=None) -> None:
     """ 预处理，解决ply包需要在同路径下调度parser的问题
     参数：
         root: 内核源码路径
         target: 体系架构
         file: 预处理后生成.Kconfig文件
         display: 终端打印开关
+        jobs: 词法分析进程数, 默认单进程
+        cache: 词法分析缓存文件路径, 默认不使用缓存
+        discover: Kconfig文件发现方式, walk遍历源码目录, source只沿source语句查找
+        rev: git版本, 指定时root为git仓库, 不需要检出即可读取该版本的Kconfig文件
+    """
+    from .preprocess import preprocessing as inner_preprocessing
+    inner_preprocessing(root, target, file, display, jobs, cache, discover, rev)
+
+
+def preprocessing_archs(root, targets, files, display, jobs=1, cache=None, discover='walk', rev=None) -> None:
+    """ 一次预处理多个体系架构, 与架构无关的Kconfig文件只进行一次词法分析
+    参数：
+        targets: 体系架构列表
+        files: 与targets对应的.Kconfig文件列表
+        其余参数与preprocessing相同
     """
-    inner_preprocessing(root, target, file, display)
+    from .preprocess import preprocessing_archs as inner_preprocessing_archs
+    inner_preprocessing_archs(root, targets, files, display, jobs, cache, discover, rev)
+
+
+def preprocess_parse(root, targets, files, configs, config_deps, display, jobs=1, cache=None, discover='walk', rev=None,
+                     simplify=False, help=True) -> None:
+    """ 融合模式, 预处理输出的token直接用于语法分析, 不需要写入并重新分析.Kconfig文件
+    参数：
+        targets: 体系架构列表
+        files: 与targets对应的.Kconfig文件列表, 元素为None时不生成.Kconfig文件
+        configs: 与targets对应的*_config.json文件路径列表
+        config_deps: 与targets对应的*_config_dep.json文件路径列表
+        simplify: 化简预编译的依赖表达式
+        help: 为False时跳过help文本
+        其余参数与preprocessing相同
+    """
+    from .config_yacc import ParseKconfig
+    from .preprocess import preprocessing_archs as inner_preprocessing_archs
+    outputs = {}
+    for (target, file, config, config_dep) in zip(targets, files, configs, config_deps):
+        outputs[target] = (file, config, config_dep)
+
+    def consume(target, tokens):
+        (file, config, config_dep) = outputs[target]
+        ParseKconfig(file, config, config_dep, display, tokens, simplify=simplify, help=help)
+
+    inner_preprocessing_archs(root, targets, files, display, jobs, cache, discover, rev, consume)
 
 
 def load_Kconfig(path) -> str:
@@ -42,6 +103,40 @@ def load_json(path):
     return inner_load_json(path)
 
 
+def load_dep(path):
+    """ 读取_dep.json, 组条件合并到每个配置项的dep中, 返回值与早期格式一致 """
+    return inner_load_dep(path)
+
+
+def load_config(path):
+    """ 读取_config.json, 组信息序号替换为组信息, 返回值与早期格式一致 """
+    return inner_load_config(path)
+
+
+def load_help(config_path, Kconfig=None) -> dict:
+    """ 读取配置项的help文本{配置项名称 : [help]}
+        解析时跳过help的结果在第一次读取时重新分析.Kconfig文件, 生成tag_arch_config_help.json,
+        .Kconfig文件不存在时(融合模式未保留)无法生成, 返回None
+    参数:
+        config_path: *_config.json文件路径
+        Kconfig: 预处理后的文件路径, 默认为同一目录下的tag_arch.Kconfig
+    """
+    from .utils import get_help_path
+    from .utils import load_help as inner_load_help
+    result = inner_load_help(config_path)
+    if result is None:
+        if Kconfig is None:
+            Kconfig = config_path[:-len('_config.json')] + '.Kconfig'
+        if not check_file_data(Kconfig):
+            print("{:<40}".format("[WARMING]") + "No help text, " + config_path + " was parsed with -N and " + Kconfig +
+                  " not found, delete the parse results and parse again")
+            return None
+        from .config_yacc import ParseHelp
+        ParseHelp(Kconfig, get_help_path(config_path))
+        result = inner_load_help(config_path)
+    return result
+
+
 def check_file_data(path) -> bool:
     """ 检查文件是否存在且文件内部是否有数据
     参数:
@@ -82,16 +177,20 @@ def write_json(data, save_file) -> None:
     inner_write_json_file(data, save_file)
 
 
-def parse(Kconfig, config, config_dep, display) -> None:
+def parse(Kconfig, config, config_dep, display, jobs=1, simplify=False, help=True) -> None:
     """ 解析Kconfig
     参数:
         Kconfig: 预处理后的文件路径
         config: *_config.json文件路径
         config_dep: *_config_dep.json文件路径
         display: 是否显示终端信息，可加快识别速度
+        jobs: 语法分析进程数, 默认单进程
+        simplify: 化简预编译的依赖表达式, 检查结果不变, 默认不化简
+        help: 为False时跳过help文本, 需要时由load_help生成单独的help文件
     返回值: None
     """
-    ParseKconfig(Kconfig, config, config_dep, display)
+    from .config_yacc import ParseKconfig
+    ParseKconfig(Kconfig, config, config_dep, display, jobs=jobs, simplify=simplify, help=help)
 
 
 def check(dep_path, config_path, file_path, save_file) -> None:
@@ -105,10 +204,70 @@ def check(dep_path, config_path, file_path, save_file) -> None:
     Checker(dep_path, config_path, file_path, save_file)
 
 
+def batch_check(dep_path, config_path, file_paths, save_files, chunk=1024) -> list:
+    """ 使用同一版本的解析结果批量检查配置文件, 检查结果与check逐个检查时相同
+        安装numpy时每chunk个配置文件的依赖条件以矩阵形式一起计算
+    参数：
+        dep_path: Kconfig解析后生成的_dep.json文件
+        config_path: Kconfig解析后生成的_config.json文件
+        file_paths: 待检查内核配置文件列表
+        save_files: 与file_paths对应的_error.json文件列表, 若无错误则文件不存在
+        chunk: 每次一起计算的配置文件数量
+    返回值: 读取或检查时出错的文件列表, 出错的文件不影响其余文件的检查
+    """
+    from .batch import BatchChecker
+    return BatchChecker(dep_path, config_path, file_paths, save_files, chunk)
+
+
+def check_baseline(dep_path, config_path, file_path, save_file) -> None:
+    """ 与check相同地检查配置文件, 并保留检查状态用于之后的recheck
+    参数：
+        dep_path: Kconfig解析后生成的_dep.json文件
+        config_path: Kconfig解析后生成的_config.json文件
+        file_path: 待检查内核配置文件
+        save_file: 输出检查结果_error.json文件，包含所有错误项，若无错误则文件不存在
+    """
+    from .incremental import IncrementalChecker
+    IncrementalChecker(dep_path, config_path, file_path, save_file)
+
+
+def recheck(changes, save_file=None) -> dict:
+    """ 修改check_baseline检查过的配置文件中少量配置项的取值, 只重新检查受影响的配置项
+    参数：
+        changes: {配置项名称(不含CONFIG_前缀) : 新取值}, 取值为None时删除该配置项
+        save_file: 输出检查结果_error.json文件, 若无错误则删除该文件, 为None时不写入
+    返回值: 与修改前相比新增、消失、变化的错误, 见incremental.Recheck
+    check_baseline之后调用过check、batch_check时抛出RuntimeError, 需要重新调用check_baseline
+    """
+    from .incremental import Recheck
+    return Recheck(changes, save_file)
+
+
+def build_expr(config_dep, simplify=False) -> None:
+    """ 由已有的_dep.json生成预编译的依赖表达式tag_arch_expr.json, 用于早期版本的解析结果
+    参数：
+        config_dep: *_config_dep.json文件路径
+        simplify: 化简依赖表达式
+    """
+    from .expr import build_expr as inner_build_expr
+    inner_build_expr(config_dep, simplify=simplify)
+
+
+def build_knowledge(config, config_dep, db) -> None:
+    """ 根据解析结果生成SQLite知识库, 查询单个配置项时不需要读取完整的json文件
+    参数：
+        config: *_config.json文件路径
+        config_dep: *_config_dep.json文件路径
+        db: 知识库保存路径
+    """
+    from .knowledge import build_knowledge as inner_build_knowledge
+    inner_build_knowledge(config, config_dep, db)
+
+
 def make_dict(dep_data, flag) -> dict:
     """ 查询配置项的子类、父类
     参数：
-        dep_data: 待查询配置项
+        dep_data: 待查询配置项, load_json或load_dep读取的_dep.json
         flag: 布尔类型
             True 查询子类
             False 查询父类
@@ -117,6 +276,7 @@ def make_dict(dep_data, flag) -> dict:
     """
     getFather = {}
     getKid = {}
+    dep_data = inner_expand_dep(dep_data)
     for name in dep_data:
         for detail in dep_data[name]:
             temp = inner_get_word(detail['rev_select']) + inner_get_word(detail['dep'])
@@ -0,0 +1,536 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+批量检查, 使用同一版本的解析结果检查大量.config文件
+
+主函数为BatchChecker(dep_path, config_path, file_paths, save_files, chunk=1024)
+    * 解析结果与预编译的依赖表达式只读取一次
+    * 每chunk个.config文件的取值组成矩阵(配置项 × .config文件), y、m、n分别为2、1、0, 不存在时为n
+    * 只包含配置项、y/m/n、$()、!、&&、||、括号的依赖条件(组条件 && dep), 对这一组.config文件逐元素计算:
+      && 取最小值, || 取最大值, ! 为2减去取值, =、!=比较编码
+    * rev_select、restrict按check.py对[]内if条件的处理方式(条件不成立时删除该项或取y)逐元素计算
+    * 其余表达式(大小比较、range、字符串), 以及取值不是y、m、n的.config文件仍按check.py计算
+
+每个.config文件仍按check.py的流程检查, 计算表达式时按原顺序读取其中的配置项(可能递归检查该配置项),
+只是直接使用矩阵的计算结果, 因此检查结果以及错误信息的顺序与Checker逐个检查时相同
+
+numpy为可选依赖, 未安装时不使用矩阵, 只共用读取的解析结果
+"""
+
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .check import check_values, get_expr, get_group_expr, load_rules, read_config, reset_check, reset_GLOAL
+from .check import write_result
+from .progress import PROGRESS
+from .simplify import evaluation_order, is_name
+
+
+CODE = {'y': 2, 'm': 1, 'n': 0}
+VALUE = {2: 'y', 1: 'm', 0: 'n'}
+
+
+class Skip(Exception):
+    """ 表达式包含不能逐元素计算的写法 """
+
+
+def compile_word(word):
+    """ 单个WORD, 只接受配置项名称与y/m/n """
+    if word[0] == 'WORD' and word[1] in CODE:
+        return ('const', CODE[word[1]])
+    if word[0] == 'WORD' and is_name(word[1]):
+        return ('name', word[1])
+    return None
+
+
+# 表达式树: ('name', 配置项名称) | ('const', 取值) | ('not', 子树) | ('and', [子树]) | ('or', [子树])
+#          | ('equal', 子树, 子树, 是否为!=)
+#          | ('select', [(子树, if条件表达式序号)]) | ('restrict', 配置项名称, [(类型, 子树, if条件表达式序号)])
+def parse_or(words, pos):
+    (node, pos) = parse_and(words, pos)
+    nodes = [node]
+    while pos < len(words) and words[pos][0] == 'OR':
+        (node, pos) = parse_and(words, pos + 1)
+        nodes.append(node)
+    return (nodes[0] if len(nodes) == 1 else ('or', nodes), pos)
+
+
+def parse_and(words, pos):
+    (node, pos) = parse_factor(words, pos)
+    nodes = [node]
+    while pos < len(words) and words[pos][0] == 'AND':
+        (node, pos) = parse_factor(words, pos + 1)
+        nodes.append(node)
+    return (nodes[0] if len(nodes) == 1 else ('and', nodes), pos)
+
+
+def parse_factor(words, pos):
+    if pos >= len(words):
+        raise Skip()
+    if words[pos][0] != 'NOT':
+        return parse_unit(words, pos)
+    pos += 1
+    if pos >= len(words) or words[pos][0] == 'NOT':
+        raise Skip()
+    (node, end) = parse_unit(words, pos)
+    # check.py中! SP_WORD同样取y
+    if words[pos][0] == 'SP_WORD':
+        return (node, end)
+    return (('not', node), end)
+
+
+def parse_unit(words, pos):
+    (type, value) = words[pos]
+    compare = pos + 1 < len(words) and words[pos + 1][1] in ('=', '!=', '<', '<=', '>', '>=')
+    if type == 'SP_WORD':
+        if compare and pos + 2 >= len(words):
+            raise Skip()
+        return (('const', 2), pos + 3 if compare else pos + 1)
+    if type == 'WORD' and not compare:
+        node = compile_word(words[pos])
+        if node is not None:
+            return (node, pos + 1)
+    if type == 'WORD' and compare and words[pos + 1][1] in ('=', '!=') and pos + 2 < len(words):
+        # handle_op按原始字符串比较, 取值均为y、m、n时与比较编码一致; 大小比较的字符串顺序与编码不同, 不处理
+        (left, right) = (compile_word(words[pos]), compile_word(words[pos + 2]))
+        if left is not None and right is not None:
+            return (('equal', left, right, words[pos + 1][1] == '!='), pos + 3)
+    if type == 'OPEN_PARENT':
+        (node, pos) = parse_or(words, pos + 1)
+        if pos >= len(words) or words[pos][0] != 'CLOSE_PARENT':
+            raise Skip()
+        return (node, pos + 1)
+    raise Skip()
+
+
+def compile_expr(words):
+    """ 编译单词序列, 不能逐元素计算时返回None """
+    try:
+        (node, pos) = parse_or(words, 0)
+    except Skip:
+        return None
+    if pos != len(words):
+        return None
+    return node
+
+
+def tree_names(node, result):
+    """ 表达式树中的配置项名称, 不包括if条件 """
+    if node[0] == 'name':
+        result.add(node[1])
+    elif node[0] == 'not':
+        tree_names(node[1], result)
+    elif node[0] == 'equal':
+        tree_names(node[1], result)
+        tree_names(node[2], result)
+    elif node[0] in ('and', 'or'):
+        for item in node[1]:
+            tree_names(item, result)
+    elif node[0] == 'select':
+        for (item, _) in node[1]:
+            tree_names(item, result)
+    elif node[0] == 'restrict':
+        result.add(node[1])
+        for (_, item, _) in node[2]:
+            tree_names(item, result)
+    return result
+
+
+def split_condition(words, pos):
+    """ pos处为[]时返回([]内的单词序列, []之后的位置), 否则返回(None, pos) """
+    if pos >= len(words) or words[pos][0] != 'OPEN_BRACKET':
+        return (None, pos)
+    end = pos + 1
+    while end < len(words) and words[end][0] != 'CLOSE_BRACKET':
+        end += 1
+    if end >= len(words):
+        raise Skip()
+    return (words[pos + 1:end], end + 1)
+
+
+def split_terms(words, parse):
+    """ 按顶层的||拆分rev_select、restrict, parse(words, pos)返回(项, 下一位置) """
+    terms = []
+    pos = 0
+    while True:
+        (term, pos) = parse(words, pos)
+        terms.append(term)
+        if pos == len(words):
+            return terms
+        if words[pos][0] != 'OR':
+            raise Skip()
+        pos += 1
+
+
+def to_words(tokens):
+    return [(tok.type, tok.value) for tok in tokens]
+
+
+def is_conjunction(words):
+    """ 最外层是否只以&&连接, 与check.is_conjunction对check_expr结果的判断一致 """
+    depth = 0
+    for (type, _) in words:
+        if type == 'OPEN_PARENT':
+            depth += 1
+        elif type == 'CLOSE_PARENT':
+            depth -= 1
+        elif type == 'OR' and depth == 0:
+            return False
+    return True
+
+
+class Compiler:
+    """
+    依赖表达式的编译结果, 在各组.config文件之间共用
+
+    属性包括:
+        * exprs: [(表达式树, 涉及的配置项名称)]
+        * selects: {(配置项名称, 定义序号) : (表达式序号, 读取顺序)}, 不能逐元素计算时为None
+        * restricts: {(配置项名称, 定义序号) : (表达式序号, [各项的读取顺序])}, 不能逐元素计算时为None
+        * depends: {(配置项名称, 定义序号) : (组条件序号, 组条件读取顺序, 组条件表达式序号, dep读取顺序, 表达式序号)}
+        * groups: {组条件序号 : (组条件表达式序号, 读取顺序, 单词序列)}, 组条件不能逐元素计算或不是以&&连接时为None
+    """
+    def __init__(self) -> None:
+        self.exprs = []
+        self.selects = {}
+        self.restricts = {}
+        self.depends = {}
+        self.groups = {}
+
+    def add(self, node, names=()):
+        self.exprs.append((node, tree_names(node, set(names))))
+        return len(self.exprs) - 1
+
+    def condition(self, words):
+        """ []内的if条件, 返回值: (表达式序号, 读取顺序), 没有if条件时表达式序号为None """
+        if words is None:
+            return (None, [])
+        node = compile_expr(words)
+        if node is None:
+            raise Skip()
+        return (self.add(node), evaluation_order(words))
+
+    def condition_names(self, conditions):
+        return [name for expr in conditions if expr is not None for name in self.exprs[expr][1]]
+
+    def select(self, config_name, index, tokens):
+        key = (config_name, index)
+        if key not in self.selects:
+            words = to_words(tokens)
+            try:
+                self.selects[key] = self.compile_select(words)
+            except Skip:
+                self.selects[key] = None
+        return self.selects[key]
+
+    def compile_select(self, words):
+        """ rev_select为"配置项[if条件]"以||连接, check_expr先读取配置项再计算if条件 """
+        def parse(words, pos):
+            node = compile_word(words[pos]) if pos < len(words) else None
+            if node is None:
+                raise Skip()
+            (condition, pos) = split_condition(words, pos + 1)
+            return ((node, self.condition(condition)[0]), pos)
+        terms = split_terms(words, parse)
+        names = self.condition_names([expr for (_, expr) in terms])
+        return (self.add(('select', terms), names), evaluation_order(words))
+
+    def restrict(self, config_name, index, tokens):
+        key = (config_name, index)
+        if key not in self.restricts:
+            words = to_words(tokens)
+            try:
+                self.restricts[key] = self.compile_restrict(config_name, words)
+            except Skip:
+                self.restricts[key] = None
+        return self.restricts[key]
+
+    def compile_restrict(self, config_name, words):
+        """ restrict为"( 取值 )[if条件]"以||连接, 取值的写法与check_restrict的分支对应:
+            * word: 单个配置项或y/m/n, 先计算if条件, 条件成立时才读取配置项并与自身取值比较
+            * sp: 单个SP_WORD, 取y
+            * not: ! 配置项, 先读取配置项, 取反后与自身取值比较
+            * expr: 其余表达式, 先读取其中的配置项, 取计算结果
+        返回值: (表达式序号, [(if条件表达式序号, if条件前读取, if条件读取顺序, if条件成立时读取)])
+        """
+        def parse(words, pos):
+            if pos >= len(words) or words[pos][0] != 'OPEN_PARENT':
+                raise Skip()
+            end = pos + 1
+            depth = 0
+            while end < len(words) and (depth > 0 or words[end][0] != 'CLOSE_PARENT'):
+                depth += {'OPEN_PARENT': 1, 'CLOSE_PARENT': -1}.get(words[end][0], 0)
+                end += 1
+            if end >= len(words):
+                raise Skip()
+            temp = words[pos + 1:end]
+            (condition, pos) = split_condition(words, end + 1)
+            (expr, condition_names) = self.condition(condition)
+            before = []
+            after = None
+            if len(temp) == 1 and temp[0][0] == 'SP_WORD':
+                (kind, node) = ('sp', ('const', 2))
+            elif len(temp) == 1:
+                (kind, node) = ('word', compile_word(temp[0]))
+                if node is not None and node[0] == 'name':
+                    after = node[1]
+            elif len(temp) == 2 and temp[0][0] == 'NOT' and temp[1][0] == 'SP_WORD':
+                (kind, node) = ('not', ('const', 2))
+            elif len(temp) == 2 and temp[0][0] == 'NOT':
+                (kind, node) = ('not', compile_word(temp[1]))
+                if node is not None:
+                    (node, before) = (('not', node), evaluation_order(temp))
+            elif len(temp) > 2:
+                (kind, node) = ('expr', compile_expr(temp))
+                before = evaluation_order(temp)
+            else:
+                node = None
+            if node is None:
+                raise Skip()
+            return (((kind, node, expr), (expr, before, condition_names, after)), pos)
+        terms = split_terms(words, parse)
+        names = self.condition_names([item[0][2] for item in terms])
+        node = ('restrict', config_name, [item[0] for item in terms])
+        return (self.add(node, names), [item[1] for item in terms])
+
+    def group(self, group):
+        """ 组条件为多项以&&连接时check_group将其合并为一个值, 与整体计算的结果一致 """
+        if group not in self.groups:
+            words = to_words(get_group_expr(group))
+            node = compile_expr(words)
+            if node is None or not is_conjunction(words):
+                self.groups[group] = None
+            else:
+                self.groups[group] = (self.add(node), evaluation_order(words), words)
+        return self.groups[group]
+
+    def depend(self, config_name, index, item):
+        key = (config_name, index)
+        if key not in self.depends:
+            self.depends[key] = self.compile_depend(config_name, index, item)
+        return self.depends[key]
+
+    def compile_depend(self, config_name, index, item):
+        group = item.get('group', -1)
+        words = to_words(get_expr(config_name, index, 'dep', item['dep']))
+        if group < 0:
+            node = compile_expr(words)
+            if node is None:
+                return None
+            return (group, [], None, evaluation_order(words), self.add(node))
+        group_expr = self.group(group)
+        if group_expr is None:
+            return None
+        (group_id, group_names, group_words) = group_expr
+        if len(item['dep']) == 0:
+            return (group, group_names, group_id, [], group_id)
+        # 检查时组条件合并后的结果与dep的check_expr结果以&&连接, 等价于( 组条件 ) && dep
+        node = compile_expr([('OPEN_PARENT', '(')] + group_words + [('CLOSE_PARENT', ')'), ('AND', '&&')] + words)
+        if node is None:
+            return None
+        return (group, group_names, group_id, evaluation_order(words), self.add(node))
+
+
+class BatchValues:
+    """
+    一组.config文件的取值矩阵以及表达式计算结果, 提供给check.py使用
+
+    属性包括:
+        * compiler: 表达式编译结果
+        * values: [read_config的结果], 每个.config文件为一列
+        * column: 当前检查的.config文件序号
+        * rows: {配置项名称 : 各.config文件中的取值}, 取值不是y、m、n时为-1
+        * results: {表达式序号 : 各.config文件中的计算结果}, 涉及的配置项取值不全为y、m、n时为-1
+    """
+    def __init__(self, compiler, values) -> None:
+        self.compiler = compiler
+        self.values = values
+        self.column = 0
+        self.rows = {}
+        self.results = {}
+
+    def row(self, name):
+        result = self.rows.get(name, None)
+        if result is None:
+            result = numpy.fromiter((CODE.get(values.get(name, 'n'), -1) for values in self.values),
+                                    dtype=numpy.int8, count=len(self.values))
+            self.rows[name] = result
+        return result
+
+    def evaluate(self, node):
+        if node[0] == 'name':
+            return self.row(node[1])
+        elif node[0] == 'const':
+            return numpy.full(len(self.values), node[1], dtype=numpy.int8)
+        elif node[0] == 'not':
+            return 2 - self.evaluate(node[1])
+        elif node[0] == 'equal':
+            return ((self.evaluate(node[1]) == self.evaluate(node[2])) != node[3]) * 2
+        elif node[0] == 'and':
+            return numpy.minimum.reduce([self.evaluate(item) for item in node[1]])
+        elif node[0] == 'or':
+            return numpy.maximum.reduce([self.evaluate(item) for item in node[1]])
+        elif node[0] == 'select':
+            return self.evaluate_select(node[1])
+        return self.evaluate_restrict(node[1], node[2])
+
+    def condition(self, expr):
+        """ if条件是否成立, 没有if条件时成立 """
+        if expr is None:
+            return numpy.ones(len(self.values), dtype=bool)
+        return self.array(expr) > 0
+
+    def evaluate_select(self, terms):
+        """ 条件不成立的项被删除, 第一项条件不成立时check_expr的结果为y """
+        result = numpy.zeros(len(self.values), dtype=numpy.int8)
+        for (node, expr) in terms:
+            result = numpy.maximum(result, numpy.where(self.condition(expr), self.evaluate(node), 0))
+        return numpy.where(self.condition(terms[0][1]), result, 2)
+
+    def evaluate_restrict(self, config_name, terms):
+        """ word、sp项条件不成立时取y, not、expr项条件不成立时被删除, 第一项被删除时check_restrict的结果为y """
+        value = self.row(config_name)
+        result = numpy.zeros(len(self.values), dtype=numpy.int8)
+        for (kind, node, expr) in terms:
+            condition = self.condition(expr)
+            if kind == 'sp':
+                item = numpy.full(len(self.values), 2, dtype=numpy.int8)
+            elif kind == 'word':
+                item = numpy.where(condition, (self.evaluate(node) == value) * 2, 2)
+            elif kind == 'not':
+                item = numpy.where(condition, (self.evaluate(node) == value) * 2, 0)
+            else:
+                item = numpy.where(condition, self.evaluate(node), 0)
+            result = numpy.maximum(result, item)
+        if terms[0][0] in ('not', 'expr'):
+            result = numpy.where(self.condition(terms[0][2]), result, 2)
+        return result
+
+    def array(self, expr):
+        """ 第expr个表达式在各.config文件中的计算结果, 涉及的配置项取值不全为y、m、n时为-1 """
+        values = self.results.get(expr, None)
+        if values is None:
+            (node, names) = self.compiler.exprs[expr]
+            values = self.evaluate(node).astype(numpy.int8)
+            for name in names:
+                values[self.row(name) < 0] = -1
+            self.results[expr] = values
+        return values
+
+    def result(self, expr):
+        """ 第expr个表达式在当前.config文件中的计算结果, 不能使用矩阵时返回None """
+        value = self.array(expr)[self.column]
+        return None if value < 0 else VALUE[int(value)]
+
+    def select(self, config_name, index, tokens):
+        """ rev_select的计算结果, 返回值: (读取顺序, 取值), 不能使用矩阵时返回None """
+        compiled = self.compiler.select(config_name, index, tokens)
+        if compiled is None:
+            return None
+        (expr, names) = compiled
+        value = self.result(expr)
+        if value is None:
+            return None
+        return (names, value)
+
+    def restrict(self, config_name, index, tokens):
+        """ 取值限制的检查结果, 返回值: (读取顺序, 是否满足), 不能使用矩阵时返回None
+            word项只在if条件成立时读取配置项, 读取顺序按当前.config文件中if条件的计算结果确定
+        """
+        compiled = self.compiler.restrict(config_name, index, tokens)
+        if compiled is None:
+            return None
+        (expr, terms) = compiled
+        value = self.result(expr)
+        if value is None:
+            return None
+        names = []
+        for (condition, before, condition_names, after) in terms:
+            names.extend(before)
+            names.extend(condition_names)
+            if after is not None and (condition is None or self.array(condition)[self.column] > 0):
+                names.append(after)
+        return (names, value != 'n')
+
+    def depends(self, config_name, index, item):
+        """ 完整依赖条件的计算结果, 返回值: (组条件序号, 组条件读取顺序, 组条件取值, dep读取顺序, 取值),
+            不能使用矩阵时返回None
+        """
+        compiled = self.compiler.depend(config_name, index, item)
+        if compiled is None:
+            return None
+        (group, group_names, group_expr, names, expr) = compiled
+        value = self.result(expr)
+        if value is None:
+            return None
+        group_value = self.result(group_expr) if group >= 0 else None
+        return (group, group_names, group_value, names, value)
+
+
+def BatchChecker(dep_path, config_path, file_paths, save_files, chunk=1024):
+    """ 批量检查入口
+
+    Args:
+        dep_path (str): Kconfig解析后生成的_dep.json文件, 或知识库文件(.db)
+        config_path (str): Kconfig解析后生成的_config.json文件, 或知识库文件(.db)
+        file_paths (list): 待检查内核配置文件列表
+        save_files (list): 与file_paths对应的_error.json文件列表, 没有错误时不生成文件
+        chunk (int): 每组.config文件的数量, 矩阵大小为(涉及的配置项数量 × chunk)
+
+    Returns:
+        list: 读取或检查时出错的文件, 这些文件不生成检查结果, 其余文件继续检查
+    """
+    reset_GLOAL()
+    begin = time.time()
+    load_rules(dep_path, config_path)
+    compiler = None
+    if numpy is not None:
+        compiler = Compiler()
+    else:
+        print("{:<40}".format("[numpy not found]") + "check config files one by one")
+    failed = []
+    for start in range(0, len(file_paths), chunk):
+        paths = []
+        values = []
+        saves = []
+        for (path, save_file) in zip(file_paths[start:start + chunk], save_files[start:start + chunk]):
+            try:
+                values.append(read_config(path))
+            except Exception as error:
+                check_failed(path, error, failed)
+                continue
+            paths.append(path)
+            saves.append(save_file)
+        batch = BatchValues(compiler, values) if compiler is not None and len(values) > 0 else None
+        for (column, path) in enumerate(paths):
+            reset_check()
+            if batch is not None:
+                batch.column = column
+            try:
+                check_values(values[column], batch)
+                write_result(saves[column])
+            except Exception as error:
+                PROGRESS.end()
+                check_failed(path, error, failed)
+    cost = time.time() - begin
+    print("\rCheck time\t\t{}".format(str(cost)))
+    return failed
+
+
+def check_failed(path, error, failed):
+    """ 记录出错的文件, 继续检查其余文件 """
+    print("{:<40}".format("[Check failed]") + path + " => " + type(error).__name__ + ": " + str(error))
+    failed.append(path)
@@ -26,33 +26,73 @@
     * 取值未满足: restrict warning, 配置项取值未满足要求, 通常为default或imply关键字
     * 依赖风险: unmet dependence, 配置项通过select强制启动, 但是依赖未满足
 
-父类配置项错误会影响当前子类配置项的判断, 可利用HAVE_CHECK进一步开发
+配置项的检查结果只与.config中的原始取值有关, 因此每个配置项只计算一次(check_config, 结果保存在CONFIG_RECORD),
+计算时记录读取的配置项与产生的错误; visit_config按记录以显式的栈模拟原先的递归检查,
+先检查被读取的父类配置项, 已处理以及检查中(依赖成环)的配置项由VISITED跳过, 错误信息的内容与顺序保持不变
+HAVE_CHECK只保存各配置项的检查结果, 不参与检查顺序的判断
 """
 
 import re
 import time
 
 from .check_lex import lexer
-from .utils import load_json, write_json_file
+from .expr import load_expr
+from .progress import PROGRESS
+from .utils import full_dep, load_json, split_config, split_dep, write_json_file
 
 CONFIG = None  # _config.json
 CONFIG_DEP = None  # _config_dep.json
 CONFIG_VALUE = {}  # .config文件
-HAVE_CHECK = {}
-LAST_CONFIG = []  # (name, value)
+HAVE_CHECK = {}  # {配置项名称 : 检查结果}
+VISITED = set()  # 本次检查中已处理的配置项
+RECORD = None  # 正在计算的配置项的记录: 读取的配置项名称、组条件序号、(错误信息, 定义序号)
+CONFIG_RECORD = {}  # {配置项名称 : check_config的记录}
+KIDS = None  # 增量检查的反向依赖索引{配置项名称 : 引用该配置项的配置项集合}, 见incremental.py
+GROUP_KIDS = None  # {配置项名称 : 引用该配置项的组条件序号集合}
+VALUE_TEXT = {}  # {配置项名称 : {定义序号 : 错误信息中带取值的依赖表达式}}
 ERROR_CONFIG_FLAG = []
 ERROR_JSON = {}
+EXPR = None  # _expr.json, 预编译的依赖表达式
+TOKENS = {}  # {字符串 : 词法分析结果}, 未预编译的表达式以及括号内的计算结果
+GROUPS = []  # _dep.json的组条件表
+GROUP_STACK = {}  # {组条件序号 : 组条件的计算结果}
+GROUP_RECORD = {}  # {组条件序号 : 第一次计算组条件时读取的配置项}
+GROUP_VISIT = set()  # visit_config已经使用过的组条件序号
+BATCH = None  # 批量检查时rev_select、依赖条件、restrict的矩阵计算结果, 见batch.py
 
 
 def reset_GLOAL():
-    global CONFIG, CONFIG_DEP, CONFIG_VALUE, HAVE_CHECK, LAST_CONFIG, ERROR_CONFIG_FLAG, ERROR_JSON
+    global CONFIG, CONFIG_DEP, EXPR, GROUPS, KIDS, GROUP_KIDS
     CONFIG = None
     CONFIG_DEP = None
+    EXPR = None
+    GROUPS = []
+    KIDS = None
+    GROUP_KIDS = None
+    reset_check()
+
+
+def reset_check():
+    """ 只重置与.config文件有关的状态, 批量检查时解析结果只读取一次 """
+    global CONFIG_VALUE, HAVE_CHECK, RECORD, CONFIG_RECORD, VALUE_TEXT, GROUP_STACK, GROUP_RECORD, BATCH
     CONFIG_VALUE = {}
     HAVE_CHECK = {}
-    LAST_CONFIG = []
+    RECORD = None
+    CONFIG_RECORD = {}
+    VALUE_TEXT = {}
+    GROUP_STACK = {}
+    GROUP_RECORD = {}
+    BATCH = None
+    reset_visit()
+
+
+def reset_visit():
+    """ 只重置检查顺序与错误信息, 保留各配置项的检查记录, 增量检查时按记录重新处理 """
+    global VISITED, ERROR_CONFIG_FLAG, ERROR_JSON, GROUP_VISIT
+    VISITED = set()
     ERROR_CONFIG_FLAG = []
     ERROR_JSON = {}
+    GROUP_VISIT = set()
 
 
 def get_tokens(data):
@@ -69,6 +109,35 @@ def get_tokens(data):
     return result
 
 
+def lex_tokens(data):
+    """ 带缓存的get_tokens, 相同的字符串只进行一次词法分析 """
+    result = TOKENS.get(data, None)
+    if result is None:
+        result = get_tokens(data)
+        TOKENS[data] = result
+    return result
+
+
+def get_expr(config_name, index, key, line):
+    """ 获得配置项第index个定义中key表达式的单词序列
+        优先使用预编译结果, 不存在时对line进行词法分析
+    """
+    if EXPR is not None:
+        result = EXPR.get(config_name, index, key)
+        if result is not None:
+            return result
+    return lex_tokens(line)
+
+
+def get_group_expr(group):
+    """ 获得第group个组条件的单词序列 """
+    if EXPR is not None:
+        result = EXPR.get_group(group)
+        if result is not None:
+            return result
+    return lex_tokens(GROUPS[group])
+
+
 class Error:
     """ 整理错误信息, 打印到*_error.json中
 
@@ -107,8 +176,7 @@ class Error:
         else:
             return None
 
-    def update_value(self, line):
-        words = get_tokens(line)
+    def update_value(self, words):
         result = ''
         for item in words:
             result += ' ' if len(result) > 0 else ''
@@ -120,15 +188,19 @@ class Error:
         return result
 
     def handle_value(self, index):
+        # 预编译的表达式可能经过化简, 错误信息中显示_dep.json中的原表达式
         if index == -1:
             return None
-        config_dep = CONFIG_DEP.get(self.name, None)
-        result = {
-            'rev_select': self.update_value(config_dep[index]['rev_select']),
-            'depends': self.update_value(config_dep[index]['dep']),
-            'restrict': self.update_value(config_dep[index]['restrict']),
-        }
-        return result
+        # 同一.config中结果不变, 再次检查该配置项时直接使用
+        cache = VALUE_TEXT.setdefault(self.name, {})
+        if index not in cache:
+            config_dep = CONFIG_DEP.get(self.name, None)
+            cache[index] = {
+                'rev_select': self.update_value(lex_tokens(config_dep[index]['rev_select'])),
+                'depends': self.update_value(lex_tokens(full_dep(config_dep[index], GROUPS))),
+                'restrict': self.update_value(lex_tokens(config_dep[index]['restrict'])),
+            }
+        return cache[index]
 
 
 def add_error(config_name, error_data, index = -1):
@@ -142,31 +214,38 @@ def add_error(config_name, error_data, index = -1):
         ERROR_JSON[config_name] = node
 
 
-def load_config(path):
-    """ 加载.config配置文件
-        对于配置文件中不存在以及is not set的config取值为n
+def read_config(path):
+    """ 读取.config配置文件, 返回值: {配置项名称 : 取值}
+        对于is not set的config取值为n, 配置文件中不存在的config检查时取值为n
     """
-    global CONFIG_VALUE
+    result = {}
     with open(path, 'r') as file:
         lines = file.readlines()
         name = ''
         for line in lines:
             if line[0:9] == '# CONFIG_':
                 name = line.replace('# CONFIG_','').replace(' is not set\n', '')
-                ptr = CONFIG_VALUE.get(name, None)
+                ptr = result.get(name, None)
                 if not ptr:
-                    CONFIG_VALUE[name] = 'n'
+                    result[name] = 'n'
                 else:
                     print("error, repeat config => " + name + " in .config")
             elif line[:7] == 'CONFIG_':
                 line = line[7:].replace('\n', '')
                 (name, value) = line.split('=', 1)
-                ptr = CONFIG_VALUE.get(name, None)
+                ptr = result.get(name, None)
                 if not ptr:
-                    CONFIG_VALUE[name] = value
+                    result[name] = value
                 else:
                     print("error, repeat config => " + name + " in .config")
-    print("{:<40}".format("[Load config end!]") + "got " + str(len(CONFIG_VALUE)) + " config")
+    print("{:<40}".format("[Load config end!]") + "got " + str(len(result)) + " config")
+    return result
+
+
+def load_config(path):
+    """ 加载.config配置文件 """
+    global CONFIG_VALUE
+    CONFIG_VALUE = read_config(path)
 
 
 def check_MODULES():
@@ -237,26 +316,11 @@ def num2value(num):
         return 'n'
 
 
-def get_last_config_name():
-    global LAST_CONFIG
-    result = []
-    for item in LAST_CONFIG:
-        result.append(item[0])
-    return result
-
-
-def get_last_config_value():
-    global LAST_CONFIG
-    result = []
-    for item in LAST_CONFIG:
-        result.append(item[1])
-    return result
-
-
 def get_config_value(word):
     """ 在配置文件中查找配置项的取值
         若未出现则认为是n
         数字类型也返回string形式
+        读取的配置项记录到RECORD, 由visit_config检查
     """
     if isinstance(word, int):
         return str(word)
@@ -264,13 +328,7 @@ def get_config_value(word):
         return word
     if re.fullmatch('[A-Z0-9_x]+', word):
         if word in CONFIG_VALUE:
-            if word in get_last_config_name():
-                return CONFIG_VALUE[word]
-            if HAVE_CHECK.get(word, None) is None:
-                if CONFIG_DEP.get(word, None) == None:
-                    add_error(word, "lack config => " + word)
-                    return CONFIG_VALUE[word]
-                check_config(CONFIG_DEP[word], word)
+            RECORD.append(word)
             return CONFIG_VALUE[word]
         else:
             return 'n'
@@ -293,7 +351,7 @@ def check_bracket(tokens, index):
             else:
                 value = reduce(check_expr(temp))
                 temp = save.pop()
-                temp += get_tokens(value)
+                temp += lex_tokens(value)
         else:
             temp.append(tokens[index])
         index += 1
@@ -441,6 +499,114 @@ def check_dep(tokens):
     return reduce(stack)
 
 
+def is_conjunction(stack):
+    """ check_expr结果是否为多个值以&&、!连接 """
+    expect = True  # 下一项应为值或!
+    for item in stack:
+        if item == '!' and expect:
+            continue
+        elif item == '&&' and not expect:
+            expect = True
+        elif item not in ['&&', '||', '!'] and expect:
+            expect = False
+        else:
+            return False
+    return not expect
+
+
+def record_group(group, calculate):
+    """ 组条件只计算一次, 第一次计算时读取的配置项单独记录, 由visit_config决定是否检查其中的配置项 """
+    global RECORD
+    if group not in GROUP_STACK:
+        record = RECORD
+        RECORD = []
+        GROUP_STACK[group] = calculate()
+        GROUP_RECORD[group] = RECORD
+        RECORD = record
+    RECORD.append(group)
+    return GROUP_STACK[group]
+
+
+def check_group(group):
+    """ 组条件的计算结果, 每个组条件只计算一次
+        表达式的取值只与.config有关, 第一次计算时已经检查过其中的配置项, 再次计算不会产生新的错误信息
+        "组条件 && 自身依赖"的check_expr结果为两部分的结果以&&连接,
+        组条件为多个括号以&&、!连接时按从左到右的顺序计算, 可以先合并为一个值
+    返回值: check_expr结果
+    """
+    def calculate():
+        stack = check_expr(get_group_expr(group))
+        if len(stack) > 1 and is_conjunction(stack):
+            stack = [reduce(stack)]
+        return stack
+    return record_group(group, calculate)
+
+
+def has_depends(item):
+    """ 配置项定义是否存在依赖条件(组条件或自身依赖) """
+    return item.get('group', -1) >= 0 or len(item['dep']) > 0
+
+
+def check_depends(config_name, index, item):
+    """ 计算配置项第index个定义的完整依赖条件, 结果与对完整依赖条件调用check_dep一致 """
+    group = item.get('group', -1)
+    tokens = get_expr(config_name, index, 'dep', item['dep'])
+    if group < 0:
+        return check_dep(tokens)
+    stack = check_group(group)
+    if len(item['dep']) > 0:
+        stack = stack + ['&&'] + check_expr(tokens)
+    if not len(stack): return 'y'
+    return reduce(stack)
+
+
+def read_values(names):
+    """ 按计算表达式时的顺序读取配置项的取值, 与get_config_value一样记录读取的配置项
+        只记录.config中存在的配置项, 其余配置项取值为n, 读取时没有其他操作
+    """
+    RECORD.extend(name for name in names if name in CONFIG_VALUE)
+
+
+def select_value(config_name, index, tokens):
+    """ rev_select的计算结果, 批量检查时使用矩阵的计算结果 """
+    if BATCH is not None:
+        result = BATCH.select(config_name, index, tokens)
+        if result is not None:
+            (names, value) = result
+            read_values(names)
+            return value
+    return check_select(tokens)
+
+
+def depends_value(config_name, index, item):
+    """ 完整依赖条件的计算结果, 批量检查时使用矩阵的计算结果
+        组条件与check_group一样只在第一次计算时读取其中的配置项
+    """
+    if BATCH is not None:
+        result = BATCH.depends(config_name, index, item)
+        if result is not None:
+            (group, group_names, group_value, names, value) = result
+            if group >= 0:
+                def calculate():
+                    read_values(group_names)
+                    return [group_value]
+                record_group(group, calculate)
+            read_values(names)
+            return value
+    return check_depends(config_name, index, item)
+
+
+def restrict_value(tokens, config_name, config_value, config_index):
+    """ 取值限制的检查结果, 批量检查时使用矩阵的计算结果 """
+    if BATCH is not None:
+        result = BATCH.restrict(config_name, config_index, tokens)
+        if result is not None:
+            (names, value) = result
+            read_values(names)
+            return value
+    return check_restrict(tokens, config_name, config_value, config_index)
+
+
 def check_restrict(tokens, config_name, config_value, config_index):
     """ 检查取值限制是否满足
         restrict表达式中, 格式通常为()[XXX], []内部if表达式形式多样, 需要全面考虑
@@ -512,7 +678,7 @@ def check_restrict(tokens, config_name, config_value, config_index):
                         if left <= config_value and config_value <= right:
                             pass
                         else:
-                            add_error(config_name, "range error", config_index)
+                            RECORD.append(("range error", config_index))
                     stack.append('y')
             else:
                 value = reduce(check_expr(temp))
@@ -522,23 +688,28 @@ def check_restrict(tokens, config_name, config_value, config_index):
     return True if value2num(reduce(stack)) else False
 
 
-def check_config(config_list, config_name): # HAVE_CHECK放在for循环, 检查config时自动查看config取值
+def check_config(config_list, config_name):
     """ 检查配置项是否满足Kconfig约束条件
         检查逻辑：
             select检查
             dep检查
             restrict检查
+        不递归检查读取的配置项, 读取的配置项与错误信息按顺序记录, 由visit_config处理
 
     Args:
         config_list : 配置项约束条件
         config_name : 待检查配置项名称
+
+    Returns:
+        检查过程的记录
     """
-    global HAVE_CHECK, LAST_CONFIG
+    global RECORD
+    RECORD = []
     if CONFIG_VALUE.get(config_name, None) == None or CONFIG_VALUE.get(config_name, None) == 'n':
         HAVE_CHECK[config_name] = True
-        return 'n'
+        return RECORD
     config_value = CONFIG_VALUE.get(config_name, 'n')
-    LAST_CONFIG.append((config_name, config_value))
+    result = None
     if config_name in CONFIG_VALUE:
         index = -1
         error_save = {
@@ -550,79 +721,168 @@ def check_config(config_list, config_name): # HAVE_CHECK放在for循环, 检查c
         for item in config_list:
             index += 1
             if not check_type(item['type'], config_value):
-                HAVE_CHECK[config_name] = False
+                result = False
                 # add_error(config_name, "type error", index)
                 error_save['type error'].append(index)
                 continue
-            select_tokens = get_tokens(item['rev_select'])
-            dep_tokens = get_tokens(item['dep'])
-            if len(select_tokens) and value2num(check_select(select_tokens)):
-                HAVE_CHECK[config_name] = True
-                if len(item['dep']) and not value2num(check_dep(dep_tokens)):
+            select_tokens = get_expr(config_name, index, 'rev_select', item['rev_select'])
+            if len(select_tokens) and value2num(select_value(config_name, index, select_tokens)):
+                result = True
+                if has_depends(item) and not value2num(depends_value(config_name, index, item)):
                     # add_error(config_name, "unmet dependences", index)
                     error_save['unmet dependences'].append(index)
                 elif len(error_save['unmet dependences']):
                     error_save['unmet dependences'].pop()
                 break
-            elif len(dep_tokens) == 0 or value2num(check_dep(dep_tokens)):
-                restrict_tokens = get_tokens(item['restrict'])
+            elif not has_depends(item) or value2num(depends_value(config_name, index, item)):
+                restrict_tokens = get_expr(config_name, index, 'restrict', item['restrict'])
                 if len(error_save['depends error']):
                     error_save['depends error'].pop()
-                if len(restrict_tokens) == 0 or check_restrict(restrict_tokens, config_name, config_value, index):
-                    HAVE_CHECK[config_name] = True
+                if len(restrict_tokens) == 0 or restrict_value(restrict_tokens, config_name, config_value, index):
+                    result = True
                     if len(error_save['restrict warning']):
                         error_save['restrict warning'].pop()
                 else:
-                    HAVE_CHECK[config_name] = False
+                    result = False
                     # add_error(config_name, "restrict warning", index)
                     error_save['restrict warning'].append(index)
             else:
-                HAVE_CHECK[config_name] = False
+                result = False
                 # add_error(config_name, "depends error", index)
                 error_save['depends error'].append(index)
-            if HAVE_CHECK[config_name]:
+            if result:
                 break
         # 看error_save有无错误，有则填入
         if len(error_save['depends error']):
-            add_error(config_name, "depends error", error_save['depends error'][0])
+            RECORD.append(("depends error", error_save['depends error'][0]))
         if len(error_save['restrict warning']):  
-            add_error(config_name, "restrict warning", error_save['restrict warning'][0])
+            RECORD.append(("restrict warning", error_save['restrict warning'][0]))
         if len(error_save['unmet dependences']):
-            add_error(config_name, "unmet dependences", error_save['unmet dependences'][0])
+            RECORD.append(("unmet dependences", error_save['unmet dependences'][0]))
     else:
         # 如果未检查且不在.config文件, 默认是正确的
-        HAVE_CHECK[config_name] = True
-    LAST_CONFIG.pop()
+        result = True
+    if result is not None:
+        HAVE_CHECK[config_name] = result
+    return RECORD
+
+
+def visit_config(config_name):
+    """ 按递归检查的顺序处理配置项, 每个配置项第一次检查时调用check_config
+        记录中读取的配置项若尚未检查则先检查该配置项, 检查中的配置项(依赖成环)直接使用取值;
+        不在Kconfig中的配置项每次读取都产生lack config => 错误;
+        组条件在第一次使用完成后不再读取其中的配置项, 读取过程中再次使用时与check_group一样重新读取
+        处理顺序与错误信息与原先在get_config_value中递归调用check_config时相同, 使用显式的栈避免递归深度限制
+    """
+    VISITED.add(config_name)
+    stack = [(config_name, get_record(config_name), 0)]
+    while len(stack):
+        (name, record, index) = stack[-1]
+        if index == len(record):
+            stack.pop()
+            if type(name) is int:
+                GROUP_VISIT.add(name)
+            continue
+        stack[-1] = (name, record, index + 1)
+        item = record[index]
+        if type(item) is str:
+            if item in VISITED:
+                continue
+            if CONFIG_DEP.get(item, None) == None:
+                add_error(item, "lack config => " + item)
+            else:
+                VISITED.add(item)
+                stack.append((item, get_record(item), 0))
+        elif type(item) is tuple:
+            add_error(name, item[0], item[1])
+        elif item not in GROUP_VISIT:
+            stack.append((item, GROUP_RECORD[item], 0))
+
+
+def forget(names, groups):
+    """ 删除配置项与组条件的检查记录, 增量检查时重新计算 """
+    for name in names:
+        CONFIG_RECORD.pop(name, None)
+        VALUE_TEXT.pop(name, None)
+        HAVE_CHECK.pop(name, None)
+    for group in groups:
+        GROUP_STACK.pop(group, None)
+        GROUP_RECORD.pop(group, None)
+
+
+def get_record(config_name):
+    """ 配置项的检查记录, 每个配置项只计算一次 """
+    record = CONFIG_RECORD.get(config_name, None)
+    if record is None:
+        record = check_config(CONFIG_DEP[config_name], config_name)
+        CONFIG_RECORD[config_name] = record
+    return record
 
 
 def Checker(dep_path, config_path, file_path, save_file):
     """ 检查功能入口
 
     Args:
-        dep_path (str): Kconfig解析后生成的_dep.json文件
-        config_path (str): Kconfig解析后生成的_config.json文件
+        dep_path (str): Kconfig解析后生成的_dep.json文件, 或知识库文件(.db)
+        config_path (str): Kconfig解析后生成的_config.json文件, 或知识库文件(.db)
         file_path (str): 待检查内核配置文件
         save_file (str): 输出检查结果_error.json文件
     """
     
     reset_GLOAL()
-    global CONFIG, CONFIG_DEP, CONFIG_VALUE, HAVE_CHECK
     begin = time.time()
     load_config(file_path)
-    CONFIG_DEP = load_json(dep_path)
-    CONFIG = load_json(config_path)
+    load_rules(dep_path, config_path)
+    check_values(CONFIG_VALUE)
+    cost = time.time() - begin
+    print("\rCheck time\t\t{}".format(str(cost)))
+    write_result(save_file)
+
+
+def load_rules(dep_path, config_path):
+    """ 读取解析结果以及预编译的依赖表达式, 参数与Checker相同 """
+    global CONFIG, CONFIG_DEP, EXPR, GROUPS
+    # 知识库只读取.config中涉及的配置项, 使用知识库时才导入sqlite3
+    if dep_path.endswith('.db') or config_path.endswith('.db'):
+        from .knowledge import KnowledgeBase
+    if dep_path.endswith('.db'):
+        kb = KnowledgeBase(dep_path)
+        (CONFIG_DEP, GROUPS) = (kb.dep(), kb.groups())
+    else:
+        (CONFIG_DEP, GROUPS) = split_dep(load_json(dep_path))
+    CONFIG = KnowledgeBase(config_path).config() if config_path.endswith('.db') else \
+        split_config(load_json(config_path))[0]
+    # 解析阶段生成的预编译表达式, 不存在时检查过程中进行词法分析
+    EXPR = load_expr(dep_path)
+
+
+def check_values(values, batch=None):
+    """ 检查一个.config文件的全部取值, 调用前需要load_rules, 批量检查时先调用reset_check
+    参数:
+        values: read_config的结果
+        batch: 批量检查时的矩阵计算结果, 见batch.py
+    """
+    global CONFIG_VALUE, BATCH
+    CONFIG_VALUE = values
+    BATCH = batch
     check_MODULES()
+    PROGRESS.begin('check', 'check => ', False)
     for name in CONFIG_VALUE:
+        PROGRESS.update(name)
         if CONFIG_VALUE[name] == 'n':
             HAVE_CHECK[name] = True
+            VISITED.add(name)
             continue
         elif CONFIG_DEP.get(name, None) == None:
             add_error(name, "lack config")
             continue
-        check_config(CONFIG_DEP[name], name)
-    cost = time.time() - begin
-    print("\rCheck time\t\t{}".format(str(cost)))
-    global ERROR_JSON
+        visit_config(name)
+    PROGRESS.end()
+    BATCH = None
+
+
+def write_result(save_file):
+    """ 写入检查结果, 没有错误时不生成文件 """
     if len(ERROR_JSON) > 0:
         print("{:<40}".format("[Prepare write check result]") + "file => " + save_file)
         write_json_file(ERROR_JSON, save_file)
@@ -9,7 +9,7 @@
 # OR FIT FOR A PARTICULAR PURPOSE.
 # See the Mulan PSL v2 for more details.
 # **********************************************************************/
-import ply.lex as lex
+from .tables import build_lexer
 ##############################################
 # 针对dep词法的简化版lex程序
 # 跳过$开始的单词
@@ -86,5 +86,5 @@ def t_WORD(t):
     return t
 
 
-lexer = lex.lex()
+lexer = build_lexer(__name__, 'check_lextab')
 
@@ -0,0 +1,11 @@
+# check_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'CLOSE_BRACKET', 'CLOSE_PARENT', 'EQUAL', 'GREATER', 'GREATER_EQUAL', 'LESS', 'LESS_EQUAL', 'NOT', 'OPEN_BRACKET', 'OPEN_PARENT', 'OR', 'QUOTE_WORD', 'SP_WORD', 'UNEQUAL', 'WORD'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_SPWORD>\\$\\{\\{.*\\}\\})|(?P<t_QUOTE_WORD>".*?")|(?P<t_WORD>[A-Za-z0-9_-]+)|(?P<t_OR>\\|\\|)|(?P<t_AND>&&)|(?P<t_CLOSE_BRACKET>\\])|(?P<t_CLOSE_PARENT>\\))|(?P<t_GREATER_EQUAL>>=)|(?P<t_LESS_EQUAL><=)|(?P<t_OPEN_BRACKET>\\[)|(?P<t_OPEN_PARENT>\\()|(?P<t_UNEQUAL>!=)|(?P<t_EQUAL>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_NOT>!)', [None, ('t_SPWORD', 'SPWORD'), ('t_QUOTE_WORD', 'QUOTE_WORD'), ('t_WORD', 'WORD'), (None, 'OR'), (None, 'AND'), (None, 'CLOSE_BRACKET'), (None, 'CLOSE_PARENT'), (None, 'GREATER_EQUAL'), (None, 'LESS_EQUAL'), (None, 'OPEN_BRACKET'), (None, 'OPEN_PARENT'), (None, 'UNEQUAL'), (None, 'EQUAL'), (None, 'GREATER'), (None, 'LESS'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_rulesdigest  = 'ac2c7633cfca2c00fc3e2c10e0d8446000a77f4f'
@@ -11,15 +11,25 @@
 # **********************************************************************/
 """ 定义相关数据结构
     辅助解析器进行识别以及保存等相关功能
+
+    节点数量与配置项数量相同, 各类均使用__slots__减少内存占用,
+    __slots__的顺序即写入json文件时的属性顺序, 没有赋值的属性不写入
 """
 
 import json
 
 
+def to_dict(o):
+    """ 将使用__slots__的对象转换为字典, 按__slots__的顺序只保留已赋值的属性 """
+    if hasattr(o, '__dict__'):
+        return o.__dict__
+    return {key: getattr(o, key) for key in o.__slots__ if hasattr(o, key)}
+
+
 class EmployeeEncoder(json.JSONEncoder):
     """辅助自定义类结构写入json文件"""
     def default(self, o):
-        return o.__dict__
+        return to_dict(o)
 
 
 def check_line_and(line):
@@ -46,6 +56,8 @@ class If:
     表示if组关系的数据结构, 辅助node类展示具体信息
     if后跟表达式为depends依赖关系
     """
+    __slots__ = ('type', 'path', 'depends', 'help')
+
     def __init__(self, path, depends) -> None:
         self.type = 'if'
         self.path = path
@@ -72,6 +84,8 @@ class Menu:
         * visibile: menu属性
         * depends: menu属性
     """
+    __slots__ = ('type', 'path', 'name', 'visible', 'depends', 'prompt', 'help')
+
     def __init__(self, path, name) -> None:
         self.type = 'menu'
         self.path = path
@@ -118,8 +132,9 @@ class Choice:
     * optional: 允许当前choice组不选择任何子配置
     * help: 辅助信息
     """
+    __slots__ = ('type', 'path', 'name', 'prompt', 'default', 'depends', 'optional', 'help')
+
     def __init__(self, path, name) -> None:
-        self.type = 'choice'
         self.path = path
         self.name = name
         self.type = ""
@@ -168,10 +183,12 @@ class Config:
     * path: 配置项所在文件的路径信息
     * name: 配置项名称
     * type: 配置项类型, 例如: int, hex, bool, tristate, string
-    * group: 组关系信息
+    * group: 组关系信息, 所在menu、if、choice在组信息表中的序号
     * value:
     * help:
     """
+    __slots__ = ('path', 'name', 'type', 'group', 'value', 'help')
+
     def __init__(self, name, path) -> None:
         self.path = path
         self.name = name
@@ -237,11 +254,15 @@ class Group:
     属性包括：
     * display: 显示控制条件, 指menu的visible或choice的两种显示控制情况
     * depends: 依赖条件, 包括menu和choice的depends以及if组关系
+    * index: 组信息在_config.json组信息表中的序号, 尚未被配置项引用时为-1
     """
+    __slots__ = ('node', 'display', 'depends', 'index')
+
     def __init__(self, node) -> None:
         self.node = node
         self.display = ""
         self.depends = ""
+        self.index = -1
 
     def set_group_display(self, value):
         self.display = check_line_and(self.display)
@@ -258,20 +279,26 @@ class ConfigDep:
     
     属性包括：
     * rev_select: 在子类中保存select语句
-    * dep: 在配置项中保存从根节点到当前配置项的组依赖条件以及配置项依赖条件
+    * dep: 在配置项中保存配置项自身的依赖条件
     * restrict: 
+    * group: 从根节点到当前配置项的组依赖条件在组条件表中的序号, 没有组依赖条件时不设置该属性
 
     若使得config配置项成立, 有两种方式
         1, 通过select语句将子config成立
         2, 通过满足depends语句使得配置项成立
     restrict属性则用于对配置项的取值进行检查, 包括range信息以及显示控制检查
     """
+    __slots__ = ('type', 'rev_select', 'dep', 'restrict', 'group')
+
     def __init__(self) -> None:
         self.type = ""
         self.rev_select = ""
         self.dep = ""
         self.restrict = ""
 
+    def set_group(self, value):
+        self.group = value
+
     def set_select(self, value):
         self.rev_select = check_line_or(self.rev_select)
         self.rev_select += value
@@ -298,11 +325,12 @@ class ConfigDep:
 
 
 class ConfigDepTemp:
-    """用于辅助Config_dep数据存储相关信息"""
+    """用于辅助Config_dep数据存储相关信息, 配置项分析完成后由Node.release_temp释放"""
+    __slots__ = ('display', 'restrict')
+
     def __init__(self) -> None:
         self.display = ""
         self.restrict = []
-        self.imply = []
 
     def set_display(self, value):
         if len(self.display) == 0:
@@ -311,9 +339,6 @@ class ConfigDepTemp:
     def set_restrict(self, value):
         self.restrict.append(value)
 
-    def set_imply(self, value):
-        self.imply.append(value)
-
     def get_default(self):  # default
         return self.restrict
 
@@ -329,21 +354,25 @@ class Node:
         * name: 配置名称, 通常用于config和menu属性
         * type: 用于标记节点类型, 例如config、menu、if、choice
         * path: 当前节点所在文件的路径信息
-        * kids: 若节点为组关键字, 则内部存储子配置项信息
+        * kids: choice组内的配置项, 用于生成组内互斥条件, 其余节点为None
         * detail: 用特定的数据结构存储信息, 数据结构均在上述分析
         * config_dep: 通过给定的数据结构存储配置项的信息, 主要用于config配置项
-        * dep_temp: 用于辅助config_dep存储相关信息
+        * dep_temp: 用于辅助config_dep存储相关信息, 释放后为None
+        * display: dep_temp释放后保留的显示条件, 处理imply时使用
     """
+    __slots__ = ('name', 'type', 'path', 'kids', 'detail', 'config_dep', 'dep_temp', 'display')
+
     def __init__(self, name, type, path) -> None:
         self.name = name
         self.type = type
         self.path = path
 
-        self.kids = []
+        self.kids = [] if type == 'choice' else None
 
-        self.detail = self.gen_detail()
         self.config_dep = self.gen_dep()
+        self.detail = self.gen_detail()
         self.dep_temp = ConfigDepTemp()
+        self.display = ""
 
     ######### function
     def set_name(self, name):
@@ -364,14 +393,12 @@ class Node:
         if self.type == 'comment':
             return None
         elif self.type == 'config' or self.type == 'menuconfig':
-            self.config_dep = ConfigDep()
             return Config(self.name, self.path)
         elif self.type == 'if':
             return If(self.path, self.name)
         elif self.type == 'menu':
             return Menu(self.path, self.name)
         elif self.type == 'choice':
-            self.config_dep = ConfigDep()
             return Choice(self.path, self.name)
 
     def gen_dep(self):
@@ -387,3 +414,130 @@ class Node:
 
     def set_config_group(self, value):
         self.detail.set_group(value)
+
+    def get_display(self):
+        if self.dep_temp is not None:
+            return self.dep_temp.get_display()
+        return self.display
+
+    def release_temp(self):
+        """ 配置项的语句分析完成后释放dep_temp, 只保留imply使用的显示条件 """
+        if self.dep_temp is not None:
+            self.display = self.dep_temp.get_display()
+            self.dep_temp = None
+
+
+########################################################################
+#   表达式树, 语法分析时只建立节点, 需要时才生成字符串
+#   * string: Kconfig中的原始形式, 用于_config.json
+#   * dep: 依赖检查使用的形式, 用于_dep.json
+#   长的depends表达式每次归约都拼接字符串时耗时为平方级, 建树后只拼接一次
+########################################################################
+
+
+def render(expr, dep):
+    """ 生成表达式的字符串, 使用栈代替递归, 长表达式不会超过递归深度
+    参数:
+        expr: 表达式节点
+        dep: True生成dep形式, False生成string形式
+    """
+    parts = []
+    stack = [expr]
+    while len(stack) > 0:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            item.push(stack, dep)
+    return ''.join(parts)
+
+
+class Expr:
+    """ 表达式节点基类, push按逆序将子节点和字符串片段压栈 """
+    __slots__ = ()
+
+    def string(self):
+        return render(self, False)
+
+    def dep(self):
+        return render(self, True)
+
+
+class Symbol(Expr):
+    """ 单个符号, value与dep_value分别为string和dep形式 """
+    __slots__ = ('value', 'dep_value')
+
+    def __init__(self, value, dep_value) -> None:
+        self.value = value
+        self.dep_value = dep_value
+
+    def push(self, stack, dep):
+        stack.append(self.dep_value if dep else self.value)
+
+
+class Not(Expr):
+    """ ! expr """
+    __slots__ = ('expr',)
+
+    def __init__(self, expr) -> None:
+        self.expr = expr
+
+    def push(self, stack, dep):
+        stack.append(self.expr)
+        stack.append('! ')
+
+
+class Binary(Expr):
+    """ left op right, op为比较运算符、&&或|| """
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right) -> None:
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def push(self, stack, dep):
+        stack.append(self.right)
+        stack.append(' ' + self.op + ' ')
+        stack.append(self.left)
+
+
+class Parent(Expr):
+    """ ( expr ) """
+    __slots__ = ('expr',)
+
+    def __init__(self, expr) -> None:
+        self.expr = expr
+
+    def push(self, stack, dep):
+        stack.append(' )')
+        stack.append(self.expr)
+        stack.append('( ')
+
+
+class IfExpr(Expr):
+    """ if expr, string形式为" if expr", dep形式为expr """
+    __slots__ = ('expr',)
+
+    def __init__(self, expr) -> None:
+        self.expr = expr
+
+    def push(self, stack, dep):
+        stack.append(self.expr)
+        if not dep:
+            stack.append(' if ')
+
+
+class Prompt(Expr):
+    """ 类型定义中的提示信息, string形式为"提示信息 if expr", dep形式为expr, 不存在if时为空 """
+    __slots__ = ('value', 'if_expr')
+
+    def __init__(self, value, if_expr) -> None:
+        self.value = value
+        self.if_expr = if_expr
+
+    def push(self, stack, dep):
+        if self.if_expr is not None:
+            stack.append(self.if_expr)
+        if not dep:
+            stack.append(self.value)
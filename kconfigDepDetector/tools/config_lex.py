@@ -9,7 +9,7 @@
 # OR FIT FOR A PARTICULAR PURPOSE.
 # See the Mulan PSL v2 for more details.
 # **********************************************************************/
-import ply.lex as lex
+from .tables import build_lexer
 
 states = (
     ('STRING', 'exclusive'),
@@ -151,30 +151,29 @@ def t_STRING_CONTEXT(t):
 
 ##########################   help   ##########################
 t_HELP_ignore = ''
-help_context = ""
 
 
+# 一次匹配整个help文本: 缩进的各行以及之间的换行, 到下一个不缩进的行为止
+# token的值为各行以换行连接(末尾带换行), 位置为最后的换行处, 行号不变
+# 分析器的keep_help属性为False时不生成help文本, 值为空字符串, clone得到的分析器互不影响
 def t_HELP_CONTEXT(t):
-    r'[\t]+.*'
-    global help_context
-    help_context += t.value
+    r'([\t]+.*)?(\n+[\t]+.*)*\n+'
+    data = t.lexer.lexdata
+    # 文件末尾时help状态不结束; 最后一行缩进且没有换行时同样读取到文件末尾
+    if t.lexer.lexpos >= len(data) or data[t.lexer.lexpos] == '\t':
+        t.lexer.lexpos = len(data)
+        return None
+    body = t.value.rstrip('\n')
+    t.lexpos += len(body)
+    if t.lexer.keep_help:
+        lines = [line for line in body.split('\n') if len(line) > 0]
+        t.value = '\n'.join(lines) + '\n' if len(lines) > 0 else ''
+    else:
+        t.value = ''
+    t.type = 'HELP_CONTEXT'
+    t.lexer.begin('INITIAL')
+    return t
 
 
-def t_HELP_NL(t):
-    r'\n+'
-    global help_context
-    if len(help_context) > 0:
-        help_context += '\n'
-    # 检查换行后是否有缩进
-    for ch in t.lexer.lexdata[t.lexer.lexpos:]:
-        if ch != '\t':
-            t.type = "HELP_CONTEXT"
-            t.value = help_context
-            t.lexer.begin('INITIAL')
-            help_context = ""
-            return t
-        else:
-            break
-
-
-lexer = lex.lex()
+lexer = build_lexer(__name__, 'config_lextab')
+lexer.keep_help = True
@@ -0,0 +1,11 @@
+# config_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BOOL', 'CHOICE', 'CLOSE_PARENT', 'COMMENT', 'CONFIG', 'DEFAULT', 'DEF_BOOL', 'DEF_TRISTATE', 'DEPENDS', 'ENDCHOICE', 'ENDIF', 'ENDMENU', 'ENDPATH', 'EOL', 'EQUAL', 'GREATER', 'GREATER_EQUAL', 'HELP', 'HELP_CONTEXT', 'HEX', 'IF', 'IMPLY', 'INT', 'LESS', 'LESS_EQUAL', 'MAINMENU', 'MENU', 'MENUCONFIG', 'MODULES', 'NOT', 'ON', 'OPEN_PARENT', 'OPTIONAL', 'OR', 'PATH', 'PROMPT', 'QUOTE_WORD', 'RANGE', 'SELECT', 'SOURCE', 'SP_WORD', 'STRING', 'TRISTATE', 'UNEQUAL', 'VISIBILE', 'WORD'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'STRING': 'exclusive', 'HELP': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_SP_WORD>\\$(\\{\\{(.*?)\\}\\})?)|(?P<t_HELP>help)|(?P<t_WORD>[\\.A-Za-z0-9_-]+)|(?P<t_EOL>\\n+)|(?P<t_NEXTLINE>\\\\\\n)|(?P<t_TO_STRING>\\")|(?P<t_ignore_commet>\\# .*)|(?P<t_OR>\\|\\|)|(?P<t_AND>&&)|(?P<t_CLOSE_PARENT>\\))|(?P<t_GREATER_EQUAL>>=)|(?P<t_LESS_EQUAL><=)|(?P<t_OPEN_PARENT>\\()|(?P<t_UNEQUAL>!=)|(?P<t_EQUAL>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_NOT>!)', [None, ('t_SP_WORD', 'SP_WORD'), None, None, ('t_HELP', 'HELP'), ('t_WORD', 'WORD'), ('t_EOL', 'EOL'), ('t_NEXTLINE', 'NEXTLINE'), ('t_TO_STRING', 'TO_STRING'), (None, None), (None, 'OR'), (None, 'AND'), (None, 'CLOSE_PARENT'), (None, 'GREATER_EQUAL'), (None, 'LESS_EQUAL'), (None, 'OPEN_PARENT'), (None, 'UNEQUAL'), (None, 'EQUAL'), (None, 'GREATER'), (None, 'LESS'), (None, 'NOT')])], 'STRING': [('(?P<t_STRING_CONTEXT>.*?")', [None, ('t_STRING_CONTEXT', 'CONTEXT')])], 'HELP': [('(?P<t_HELP_CONTEXT>([\\t]+.*)?(\\n+[\\t]+.*)*\\n+)', [None, ('t_HELP_CONTEXT', 'CONTEXT')])]}
+_lexstateignore = {'HELP': '', 'STRING': '', 'INITIAL': '[ \t]+'}
+_lexstateerrorf = {'INITIAL': 't_ANY_error', 'STRING': 't_ANY_error', 'HELP': 't_ANY_error'}
+_lexstateeoff = {}
+_rulesdigest  = '09df792c26ed79b897fe83a0edfc64566fd2862f'
@@ -1,89 +1,63 @@
 """
 语法分析代码, 借助ply.yacc包实现
-语法识别完成后会生成两个文件, 其文件名格式均为, tag_arch
+语法识别完成后会生成三个文件, 其文件名格式均为, tag_arch
     * tag_arch_config.json: 
-        文件会按照原语句格式进行存储, 存储数据结构为config_class.py的Config类
+        文件会按照原语句格式进行存储, 存储数据结构为config_class.py的Config类,
+        menu、if、choice信息单独保存在组信息表中, 格式见utils.split_config
     * tag_arch_dep.json:
-        文件按照自定义模型抽取配置信息, 存储数据结构为config_class.py的Config_dep类
+        文件按照自定义模型抽取配置信息, 存储数据结构为config_class.py的Config_dep类,
+        组依赖条件单独保存在组条件表中, 格式见utils.split_dep
+    * tag_arch_expr.json:
+        tag_arch_dep.json中依赖表达式的词法分析结果, 检查阶段直接使用, 格式见expr.py
 
-主函数为ParseKconfig(file, config_file, dep_file, folder)
+主函数为ParseKconfig(file, config_file, dep_file, display, tokens=None, jobs=1, simplify=False, help=True)
 其参数含义是：
     * file: 预处理后的Kconfig文件路径
     * config_file: 解析识别后的tag_arch_config.json文件
     * dep_file: 解析识别后的tag_arch_dep.json
-    * folder: 可指定结果保存路, 默认为当前路径下的result文件夹
+    * display: 终端打印开关
+    * tokens: 融合模式下预处理输出的token流, 不再读取file
+    * jobs: 语法分析进程数, 大于1时按endpath分段并行分析, 融合模式下不使用
+    * simplify: 化简tag_arch_expr.json中的依赖表达式, 见simplify.py
+    * help: 为False时跳过help文本, 需要时由ParseHelp生成单独的help文件, 见utils.load_help
+
+解析状态保存在KconfigParser对象中, 每个对象使用自己的词法分析器与语法分析器,
+同一进程内可以在多个线程中同时解析不同版本的Kconfig:
+    with KconfigParser() as kconfig:
+        kconfig.parse(data)
+        kconfig.write(config_file, dep_file)
 """
 
-import os
+import copy
 import ply.yacc as yacc
 import re
+import sys
+import threading
 import time
 
+from concurrent.futures import ProcessPoolExecutor
+
+from . import check_lex
+from . import config_lex
 from .config_class import check_line_and
 from .config_class import Node as config_class_Node
 from .config_class import Group as config_class_Group
+from .config_class import Expr, Symbol, Not, Binary, Parent, IfExpr, Prompt
 from .config_lex import *
+from .expr import get_expr_path, write_expr
+from .progress import PROGRESS
+from .simplify import tristate_names
+from .token_stream import TokenStream
 # import tools.config_lex as config_lex
+from .utils import CONFIG_VERSION, DEP_VERSION
 from .utils import load_Kconfig as utils_load_Kconfig
 from .utils import write_json_file as utils_write_json_file
 
 
-display_switch = True
 CONFIGDEP_FLAG = False
 
 
 ##########################      function      ##########################
-def set_last_node(node, type):
-    global last_node
-    last_node = node
-
-
-def set_last_node_dep():
-    """ 处理上一个config的dep信息 """
-    global last_node
-    group_end = GROUP[-1] if len(GROUP) > 0 else None
-    if last_node.type == 'mainmenu':
-        return
-    # 组关系关键字在Group里填写
-    elif last_node.type == 'choice':
-        dis = ""
-        for item in GROUP[1:]:
-            if item.node.detail is not None:
-                if len(item.display) > 0:
-                    dis = check_line_and(dis) + '( ' + item.display + ' )'
-        if len(dis) > 0:
-            default = group_end.node.dep_temp.get_default() if group_end else None
-            for item in default:
-                if len(item) > 1:
-                    group_end.node.config_dep.set_restrict(
-                        item[0], '!(' + dis + ') && (' + item[1] + ')')
-                else:
-                    group_end.node.config_dep.set_restrict(
-                        item[0], '!(' + dis + ')')
-    elif last_node.type == 'config':
-        if group_end and group_end.node.type == 'choice' and group_end.node.detail.type == '':
-            group_end.node.set_detail_type(last_node.detail.type)
-        dis = ""
-        for item in GROUP[1:]:
-            if item.node.detail is not None:
-                if len(item.display) > 0:
-                    dis = check_line_and(dis) + '( ' + item.display + ' )'
-
-        if len(last_node.dep_temp.get_display()) > 0:
-            dis = check_line_and(dis) + last_node.dep_temp.get_display()
-        else:
-            dis = check_line_and(dis) + 'y'
-
-        default = last_node.dep_temp.get_default()
-        if len(dis) > 0:
-            for item in default:
-                if len(item) > 1:
-                    last_node.config_dep.set_restrict(
-                        item[0], '!(' + dis + ') && (' + item[1] + ')')
-                else:
-                    last_node.config_dep.set_restrict(item[0], '!(' + dis + ')')
-
-
 def check_spword(char):
     if len(char) > 2 and char[0] == '"' and char[1] == '$':
         return "SP_WORD"
@@ -91,80 +65,25 @@ def check_spword(char):
         return "SP_WORD"
 
 
-def set_groupDep_configDep(node):
-    result = []
-    for item in GROUP:
-        if item.node.detail is not None:
-            result.append(item.node.detail)
-    if node.type == 'config':
-        node.set_config_group(result)
-
-    dep = ""
-    for item in GROUP[1:]:
-        if item.node.detail is not None:
-            if len(item.node.detail.get_depends()) > 0:
-                if item.node.detail.get_depends()[1] == '"' and item.node.detail.get_depends()[-1] == '"':
-                    dep = check_line_and(dep) + item.node.detail.get_depends()
-                else:
-                    dep = check_line_and(dep) + '( ' + item.node.detail.get_depends() + ' )'
-
-    node.config_dep.set_depends(dep)
-    return node
-
-
-##########################      yacc        ##########################
-SELECT = {}  # {(father, kid) : [if_expr]}
-
-
-def update_select(kid, if_expr):
-    if len(if_expr) > 0:
-        if_expr = '[' + if_expr + ']'
-    else:
-        if_expr = ""
-    father = last_node.name
-    key = (father, kid)
-    if SELECT.get(key, None):
-        SELECT[key].append(if_expr)
-    else:
-        SELECT[key] = [if_expr]
-
-
-IMPLY = {}  # {(father, kid) : [group + config_dis + if_expr]}
+def describe(func, p):
+    """ 生成当前语法规则的显示文本, 只在需要刷新进度时调用 """
+    line = ""
+    for item in p:
+        if isinstance(item, str):
+            if item != '\n':
+                line += item.replace('\n\t\t', ' ').replace(
+                    '\t\t', '').replace('\n', '') + ' '
+        elif isinstance(item, Expr):
+            line += item.string() + ' '
+    if len(line) == 0:
+        return None
+    if len(func + ' : ' + line) > 50:
+        return line[:50] + '...'
+    return func + ' : ' + line
 
 
-def update_imply(kid, imply_if):
-    key = (last_node.name, kid)
-    if IMPLY.get(key, None):
-        IMPLY[key].append(imply_if)
-    else:
-        IMPLY[key] = [imply_if]
-
-display_count = -1
-
 def test_print(func, p):
-    global display_count
-    display_count += 1
-    if display_count == 0 and display_switch:
-        line = ""
-        for item in p:
-            if isinstance(item, str):
-                if item != '\n':
-                    line += item.replace('\n\t\t', ' ').replace(
-                        '\t\t', '').replace('\n', '') + ' '
-            elif isinstance(item, dict):
-                line += item['string'] + ' '
-        if len(line) > 0:
-            if len(func + ' : ' + line) > 50:
-                result = func + ' : ' + line
-                result = line[:50] + '...'
-            else:
-                result = func + ' : ' + line
-            rows, columns = os.popen('stty size', 'r').read().split()
-            print(("\rparse => " + result).ljust(int(columns) - 30),
-                  end='\r',
-                  flush=True)
-    else:
-        display_count = -1 if display_count == 100 else display_count
+    PROGRESS.update(describe, func, p)
 
 def handle_quote(target):
     if target is None:
@@ -175,29 +94,65 @@ def handle_quote(target):
     return target
 
 
-##########################      grammar     ##########################
-PATH_STACK = []
+##########################      parallel    ##########################
+# 语句的语法分析与对解析状态的修改分开: p_函数只根据token生成参数, KconfigParser的do_方法修改状态
+# 并行解析时子进程只记录(do_方法, 参数), 由主进程按原顺序执行, 结果与单进程解析一致
+# ply只能调用模块中的p_函数, 当前线程正在使用的KconfigParser保存在LOCAL中
+LOCAL = threading.local()
 
-root = config_class_Node("root", "root", 'root')
-last_node = root
-all_node = {}
 
-GROUP = []
+def apply(func, *args):
+    kconfig = LOCAL.kconfig
+    if kconfig.record is None:
+        func(kconfig, *args)
+    else:
+        kconfig.record.append((func, args))
 
 
-def reset_data():
-    global root, last_node, all_node, choice_index, choice_index_list, SELECT, IMPLY, PATH_STACK, GROUP
-    root = config_class_Node("root", "root", 'root')
-    GROUP = [config_class_Group(root)]
-    last_node = root
-    all_node = {}
-    choice_index = 0
-    choice_index_list = []
-    SELECT = {}
-    IMPLY = {}
-    PATH_STACK = []
+def split_point(data, pos):
+    """ 查找pos之后的分段位置, 不存在时返回文本长度
+        分段位置在endpath语句及其后的换行之后, 且下一行为path语句:
+        ply需要读取下一个token才会执行endpath语句, 下一个token有误时单进程解析会丢弃该语句,
+        path语句总是合法的, 因此与分段后读取到文本末尾的结果一致
+    """
+    while True:
+        end = data.find('\nendpath\n', pos)
+        if end < 0:
+            return len(data)
+        end += len('\nendpath\n')
+        while end < len(data) and data[end] == '\n':
+            end += 1
+        if data[end:end + 5] in ('path\t', 'path '):
+            return end
+        pos = end - 1
+
+
+def split_segments(data, count):
+    """ 将预处理文本分为大约count段
+        语法规则中各语句相互独立, group等上下文只在do_方法中使用, 因此可以分段进行语法分析
+    返回值: [(开始位置, 结束位置)]
+    """
+    size = len(data) // count + 1
+    result = []
+    begin = 0
+    while begin < len(data):
+        end = split_point(data, begin + size)
+        result.append((begin, end))
+        begin = end
+    return result
 
 
+def parse_segment(data, help=True):
+    """ 子进程中分析一段文本
+    返回值: (记录的语句, 该段的行数), 语法错误中的行号、位置相对于该段开始
+    """
+    kconfig = KconfigParser(record=[], help=help)
+    kconfig.lexer.lineno = 0
+    kconfig.run(data, kconfig.lexer)
+    return (kconfig.record, kconfig.lexer.lineno)
+
+
+##########################      grammar     ##########################
 PRECEDENCE = (
     ('left', 'OR'),
     ('left', 'AND'),
@@ -247,7 +202,7 @@ def p_path_stmt(p):
     path_stmt : PATH QUOTE_WORD EOL
     """
     p[2] = handle_quote(p[2])
-    PATH_STACK.append(p[2])
+    apply(KconfigParser.do_path, p[2])
 
     test_print("path_stmt", p)
 
@@ -256,10 +211,7 @@ def p_endpath_stmt(p):
     """
     endpath_stmt : ENDPATH EOL
     """
-    if len(PATH_STACK) > 0:
-        PATH_STACK.pop()
-    else:
-        print("parse error => path")
+    apply(KconfigParser.do_endpath)
 
     test_print("endpath_stmt", p)
 
@@ -269,10 +221,7 @@ def p_mainmenu_stmt(p):
     mainmenu_stmt : MAINMENU QUOTE_WORD EOL
     """
     p[2] = handle_quote(p[2])
-    global root
-    root.set_type(p[1])
-    root.set_name(p[2])
-    root.set_path(PATH_STACK[-1])
+    apply(KconfigParser.do_mainmenu, p[1], p[2])
 
     test_print("mainmenu_stmt", p)
 
@@ -285,27 +234,7 @@ def p_config_stmt(p):
     config_stmt : CONFIG WORD EOL
                 | MENUCONFIG WORD EOL
     """
-    set_last_node_dep()
-
-    node = config_class_Node(p[2], p[1], PATH_STACK[-1])
-
-    node = set_groupDep_configDep(node)
-
-    Father = GROUP[-1]
-    Father.node.kids.append(node)
-
-    # if Father.node.type == 'choice' and Father.node.detail.type == 'tristate':
-    #     node.config_dep.set_restrict('! y', '')
-
-    set_last_node(node, 'config')
-
-    # 记录需要打印数据，可能有重名config情况
-    global all_node
-    item = all_node.get(p[2], None)
-    if not item:
-        all_node[p[2]] = [node]
-    else:
-        all_node[p[2]].append(node)
+    apply(KconfigParser.do_config, p[1], p[2])
 
     test_print("config_stmt " + p[1], p)
 
@@ -314,12 +243,8 @@ def p_comment(p):
     """
     comment_stmt : COMMENT QUOTE_WORD EOL
     """
-    set_last_node_dep()
-
     p[2] = handle_quote(p[2])
-    node = config_class_Node(p[2], p[1], PATH_STACK[-1])
-
-    set_last_node(node, p[1])
+    apply(KconfigParser.do_comment, p[1], p[2])
 
     test_print("comment_stmt", p)
 
@@ -329,14 +254,8 @@ def p_menu(p):  # depends visible
     """
     menu_stmt : MENU QUOTE_WORD EOL
     """
-    set_last_node_dep()
-
     p[2] = handle_quote(p[2])
-    node = config_class_Node(p[2], p[1], PATH_STACK[-1])
-
-    set_last_node(node, p[1])
-
-    GROUP.append(config_class_Group(node))
+    apply(KconfigParser.do_menu, p[1], p[2])
 
     test_print("menu_stmt", p)
 
@@ -345,41 +264,17 @@ def p_if(p):
     """
     if_stmt : IF expr EOL
     """
-    set_last_node_dep()
-
-    node = config_class_Node(p[2]['string'], p[1], PATH_STACK[-1])
-    set_last_node(node, p[1])
-
-    group = config_class_Group(node)
-    group.set_group_dep(p[2]['dep'])
-    GROUP.append(group)
+    apply(KconfigParser.do_if, p[1], p[2].string(), p[2].dep())
 
     test_print("if_stmt", p)
 
 
-choice_index = 0
-choice_index_list = []
-
-
 def p_choice(p):  # type prompt depends
     """
     choice_stmt : CHOICE WORD EOL
                 | CHOICE EOL
     """
-    set_last_node_dep()
-
-    global choice_index, choice_index_list
-    node = config_class_Node('choice' + str(choice_index), p[1], PATH_STACK[-1])
-    choice_index_list.append(choice_index)
-    choice_index += 1
-    if p[2] != '\n':
-        node.set_detail_value('prompt', p[2])
-
-    node = set_groupDep_configDep(node)
-
-    set_last_node(node, p[1])
-
-    GROUP.append(config_class_Group(node))
+    apply(KconfigParser.do_choice, p[1], p[2])
 
     test_print("choice_stmt", p)
 
@@ -390,36 +285,7 @@ def p_groupend_stmt(p):
                 | ENDIF EOL
                 | ENDCHOICE EOL
     """
-    target = GROUP.pop()
-
-    if target.node.type == 'menu' and p[1] == 'endmenu':
-        pass
-    elif target.node.type == 'if' and p[1] == 'endif':
-        pass
-    elif target.node.type == 'choice' and p[1] == 'endchoice':
-        ####################################################
-        #
-        # 实现choice组内互斥放在depends依赖里判断
-        #
-        ####################################################
-        choice = target.node.detail
-        child = target.node.kids
-
-        if choice.type == 'bool':
-            for item in child:
-                choice_config = '( ' + item.name
-                for tmp in child:
-                    if tmp != item:
-                        choice_config = check_line_and(choice_config)
-                        choice_config += ' !' + tmp.name
-                choice_config += ' )'
-                item.config_dep.set_depends(choice_config)
-
-        elif choice.type == 'tristate':
-            pass
-        else:
-            print("warming, the choice group in {} has no type define! ".format(
-                GROUP[-1].node.path))
+    apply(KconfigParser.do_groupend, p[1])
 
     test_print("groupend_stmt " + p[1], p)
 
@@ -436,19 +302,7 @@ def p_type_option(p):
         p[0] = None
     else:
         p[1] = handle_quote(p[1])
-
-        string = None
-        dep = None
-        if p[2] is None:
-            string = p[1]
-            dep = ""
-        else:
-            string = p[1] + p[2]['string']
-            dep = p[2]['dep']
-        p[0] = {
-            'string': string,
-            'dep': dep,
-        }
+        p[0] = Prompt(p[1], p[2])
 
     test_print("prompt_stmt_opt", p)
 
@@ -461,19 +315,10 @@ def p_type_stmt(p):  # config choice
             | BOOL prompt_stmt_opt EOL
             | TRISTATE prompt_stmt_opt EOL
     """
-    last_node.set_detail_type(p[1])
-    if GROUP[-1].node.type == 'choice' and GROUP[-1].node.detail.type == "":
-        GROUP[-1].node.set_detail_type(p[1])
-    if p[2] is not None:
-        last_node.set_detail_value("prompt", p[2]['string'])
-
-        if last_node.type == "choice":
-            target = GROUP[-1]
-            if target.node.type != 'choice':
-                raise
-            target.set_group_display(p[2]['dep'])
-        elif last_node.type == 'config':
-            last_node.dep_temp.set_display(p[2]['dep'])
+    if p[2] is None:
+        apply(KconfigParser.do_type, p[1], None, None)
+    else:
+        apply(KconfigParser.do_type, p[1], p[2].string(), p[2].dep())
 
     test_print("type_stmt", p)
 
@@ -485,19 +330,9 @@ def p_prompt_stmt(p):  # choice comment config
     p[2] = handle_quote(p[2])
 
     if p[3] is None:
-        last_node.set_detail_value("prompt", p[2])
+        apply(KconfigParser.do_prompt, p[2], None, None)
     else:
-        last_node.set_detail_value("prompt", p[2] + p[3]['string'])
-
-        if last_node.type == "choice":
-            target = GROUP[-1]
-            if target.node.type != 'choice':
-                raise
-            target.set_group_display(p[3]['dep'])
-        elif last_node.type == 'comment':
-            pass
-        elif last_node.type == 'config':
-            last_node.dep_temp.set_display(p[3]['dep'])
+        apply(KconfigParser.do_prompt, p[2], p[3].string(), p[3].dep())
 
     test_print("prompt_stmt", p)
 
@@ -509,7 +344,7 @@ def p_help_stmt(p):  # config choice
     """
     help_context = p[2].replace('\n\t\t', ' ').replace('\t\t',
                                                        '').replace('\n', '')
-    last_node.set_help(help_context)
+    apply(KconfigParser.do_help, help_context)
 
     test_print("help_stmt", p)
 
@@ -518,19 +353,7 @@ def p_depends_stmt(p):  # config choice comment menu
     """
     depends_stmt : DEPENDS ON expr EOL
     """
-    last_node.set_detail_value('depends', p[3]['string'])
-
-    if last_node.type == "menu" or last_node.type == "choice":
-        target = GROUP[-1]
-        if target.node.type != last_node.type:
-            raise
-        target.set_group_dep(p[3]['dep'])
-        if last_node.type == "choice":
-            last_node.config_dep.set_depends('(' + p[3]['dep'] + ')')
-    elif last_node.type == 'comment':
-        pass
-    elif last_node.type == 'config' or last_node.type == 'menuconfig':
-        last_node.config_dep.set_depends('(' + p[3]['dep'] + ')')
+    apply(KconfigParser.do_depends, p[3].string(), p[3].dep())
 
     test_print("depends_stmt", p)
 
@@ -544,34 +367,9 @@ def p_select_imply_stmt(p):  # config
     p[2] = handle_quote(p[2])
 
     if p[3] is None:
-        last_node.set_detail_value(p[1], p[2])
-        if last_node.type == 'config' or last_node.type == 'menuconfig':
-            if p[1] == 'select':
-                update_select(p[2], '')
-            else:
-                target = all_node.get(p[2], None)
-                if target is None:
-                    # last_node.dep_temp.set_imply([p[2], ''])
-                    update_imply(p[2], '')
-
-                else:
-                    for item in target:
-                        # 加子配置项的 ！dis
-                        item.config_dep.set_restrict(last_node.name, '')
+        apply(KconfigParser.do_select_imply, p[1], p[2], None, None)
     else:
-        last_node.set_detail_value(p[1], p[2] + ' ' + p[3]['string'])
-        if last_node.type == 'config' or last_node.type == 'menuconfig':
-            if p[1] == 'select':
-                update_select(p[2], p[3]['dep'])
-            else:
-                target = all_node.get(p[2], None)
-                if target is None:
-                    # last_node.dep_temp.set_imply([p[2], p[3]['dep']])
-                    update_imply(p[2], p[3]['dep'])
-                else:
-                    for item in target:
-                        # 加子配置项的 ！dis
-                        item.config_dep.set_restrict(last_node.name, p[3]['dep'])
+        apply(KconfigParser.do_select_imply, p[1], p[2], p[3].string(), p[3].dep())
 
     test_print("select_imply_stmt " + p[1], p)
 
@@ -580,18 +378,12 @@ def p_range_stmt(p):  # config
     """
     range_stmt : RANGE symbol symbol if_expr EOL
     """
-
+    string = '(' + p[2].string() + ' ' + p[3].string() + ')'
+    dep = p[2].dep() + ' ' + p[3].dep()
     if p[4] is None:
-        last_node.set_detail_value(
-            p[1], '(' + p[2]['string'] + ' ' + p[3]['string'] + ')')
-        last_node.config_dep.set_restrict(p[2]['dep'] + ' ' + p[3]['dep'], '')
-
+        apply(KconfigParser.do_range, p[1], string, dep, None, None)
     else:
-        last_node.set_detail_value(
-            p[1],
-            '(' + p[2]['string'] + ' ' + p[3]['string'] + ')' + p[4]['string'])
-        last_node.config_dep.set_restrict(p[2]['dep'] + ' ' + p[3]['dep'],
-                                         p[4]['dep'])
+        apply(KconfigParser.do_range, p[1], string, dep, p[4].string(), p[4].dep())
 
     test_print("range_stmt", p)
 
@@ -600,7 +392,7 @@ def p_optional(p):  # choice
     """
     optional_stmt : OPTIONAL EOL
     """
-    last_node.set_detail_value('optional', True)
+    apply(KconfigParser.do_optional)
 
     test_print("optional_stmt", p)
 
@@ -611,30 +403,10 @@ def p_default_stmt(p):  # config choice
                 | DEF_BOOL expr if_expr EOL
                 | DEF_TRISTATE expr if_expr EOL
     """
-    # bool的choice完成组内config的互斥条件
-    if p[1] == 'def_bool':
-        last_node.set_detail_type('bool')
-        if GROUP[-1].node.type == 'choice' and GROUP[-1].node.detail.type == "":
-            GROUP[-1].node.set_detail_type('bool')
-    elif p[1] == 'def_tristate':
-        last_node.set_detail_type('tristate')
-        if GROUP[-1].node.type == 'choice' and GROUP[-1].node.detail.type == "":
-            GROUP[-1].node.set_detail_type('tristate')
-
-    if last_node.detail.type == "" and re.fullmatch('[0-9]+', p[2]['string']):
-        last_node.set_detail_type('int')
-    elif last_node.detail.type == "" and p[2]['string'][:2] == '0x':
-        last_node.set_detail_type('hex')
-
-    if p[3] is None or p[3] == '\n':
-        last_node.set_detail_value("default", p[2]['string'])
-        if last_node.type == 'choice' or last_node.type == 'config':
-            last_node.dep_temp.set_restrict([p[2]['dep']])
+    if p[3] is None:
+        apply(KconfigParser.do_default, p[1], p[2].string(), p[2].dep(), None, None)
     else:
-        last_node.set_detail_value("default",
-                                  p[2]['string'] + ' ' + p[3]['string'])
-        if last_node.type == 'choice' or last_node.type == 'config':
-            last_node.dep_temp.set_restrict([p[2]['dep'], p[3]['dep']])
+        apply(KconfigParser.do_default, p[1], p[2].string(), p[2].dep(), p[3].string(), p[3].dep())
 
     test_print("default_stmt", p)
 
@@ -643,14 +415,7 @@ def p_visible_stmt(p):
     """
     visible_stmt : VISIBILE if_expr EOL
     """
-
-    last_node.set_detail_value('prompt', p[2]['string'])
-
-    if last_node.type == "menu" and p[2] is not None:
-        target = GROUP[-1]
-        if target.node.type != 'menu':
-            raise
-        target.set_group_display(p[2]['dep'])
+    apply(KconfigParser.do_visible, p[2].string(), p[2].dep())
 
     test_print("visible_stmt", p)
 
@@ -659,7 +424,7 @@ def p_modules_stmt(p):
     """
     modules_stmt : MODULES EOL
     """
-    last_node.set_detail_value("modules", True)
+    apply(KconfigParser.do_modules)
 
     test_print("modules_stmt", p)
 
@@ -692,10 +457,7 @@ def p_symbol(p):
         if re.fullmatch(r'-?[0-9]+', p[1][1:-1]) or \
                 (len(p[1]) == 1 and (p[1][1] == 'y' or p[1][1] == 'm' or p[1][1] == 'n')):
             dep = handle_quote(p[1])
-    p[0] = {
-        'string': string,
-        'dep': dep,
-    }
+    p[0] = Symbol(string, dep)
 
     test_print("symbol", p)
 
@@ -705,19 +467,10 @@ def p_if_expr(p):
     if_expr : IF expr
             | empty
     """
-    string = None
-    dep = None
     if len(p) > 1 and p[1] != None:
-        dep = p[2]['dep']
-        string = " if " + p[2]['string']
-
-    if string is None and dep is None:
-        p[0] = None
+        p[0] = IfExpr(p[2])
     else:
-        p[0] = {
-            'string': string,
-            'dep': dep,
-        }
+        p[0] = None
     test_print("if_expr", p)
 
 
@@ -736,27 +489,17 @@ def p_expr(p):
         | expr OR expr
 	    | expr AND expr
     """
-    string = None
-    dep = None
+    # 只建立表达式树, 需要时再生成字符串
     if len(p) == 2:
-        string = p[1]['string']
-        dep = p[1]['dep']
+        p[0] = p[1]
     elif len(p) == 3 and p[1] == '!':
-        string = '! ' + p[2]['string']
-        dep = '! ' + p[2]['dep']
+        p[0] = Not(p[2])
     else:
         if p[2] == '<' or p[2] == '<=' or p[2] == '>' or p[2] == '>=' or p[
                 2] == '=' or p[2] == '!=' or p[2] == '||' or p[2] == '&&':
-            string = p[1]['string'] + ' ' + p[2] + ' ' + p[3]['string']
-            dep = p[1]['dep'] + ' ' + p[2] + ' ' + p[3]['dep']
+            p[0] = Binary(p[2], p[1], p[3])
         elif p[1] == '(' and p[3] == ')':
-            string = '( ' + p[2]['string'] + ' )'
-            dep = '( ' + p[2]['dep'] + ' )'
-
-    p[0] = {
-        'string': string,
-        'dep': dep,
-    }
+            p[0] = Parent(p[2])
 
     test_print("expr", p)
 
@@ -789,90 +532,571 @@ def p_empty(p):
 def p_error(p):
     if p is not None:
         if p.type != 'EOL':
-            print("Syntax error!", end=" ")
-            print(p)
+            apply(KconfigParser.syntax_error, p.type, p.value, p.lineno, p.lexpos)
             # print(p.lexer.lexdata[p.lexer.lexpos - 30:p.lexer.lexpos + 30])
 
-parser = yacc.yacc()
 
+parser = yacc.yacc(debug=False)
+
+
+##########################      parser      ##########################
+class KconfigParser:
+    """
+    一次Kconfig解析的全部状态, 不同对象之间互不影响, 可以在多个线程中同时使用
+
+    属性包括:
+        * root: 树结构的根节点
+        * last_node: 最近一条config、menu等语句生成的节点, 后续属性语句作用于该节点
+        * all_node: {配置项名称 : [节点]}, 同名配置项可能有多个
+        * group: 当前所在的组(menu、if、choice)栈, 第一项为root
+        * select: {(father, kid) : [if_expr]}
+        * imply: {(father, kid) : [group + config_dis + if_expr]}
+        * path_stack: 当前所在的Kconfig文件路径栈
+        * choice_index: 下一个choice的编号
+        * groups: {组依赖条件 : 序号}, 相同的组依赖条件只保存一次
+        * details: 被配置项引用的menu、if、choice信息, 即_config.json的组信息表
+        * record: 并行解析的子进程中记录的语句, 为None时直接执行
+        * help: 是否保存help文本, 为False时词法分析跳过help文本, _config.json中help均为空
+        * lexer: config_lex分析器的副本
+        * expr_lexer: check_lex分析器的副本, 用于预编译依赖表达式
+        * parser: ply语法分析器的副本, 分析过程中的栈保存在该对象上
+    """
+    def __init__(self, record=None, help=True) -> None:
+        self.root = config_class_Node("root", "root", 'root')
+        self.last_node = self.root
+        self.all_node = {}
+        self.group = [config_class_Group(self.root)]
+        self.select = {}
+        self.imply = {}
+        self.path_stack = []
+        self.choice_index = 0
+        self.choice_index_list = []
+        self.groups = {}
+        self.details = []
+        self.record = record
+        self.help = help
+        self.lexer = config_lex.lexer.clone()
+        self.lexer.begin('INITIAL')
+        self.lexer.keep_help = help
+        self.expr_lexer = check_lex.lexer.clone()
+        self.parser = copy.copy(parser)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """ 释放解析结果与分析器, 之后不能再使用该对象 """
+        self.root = None
+        self.last_node = None
+        self.all_node = None
+        self.group = None
+        self.select = None
+        self.imply = None
+        self.path_stack = None
+        self.choice_index_list = None
+        self.groups = None
+        self.details = None
+        self.record = None
+        self.lexer = None
+        self.expr_lexer = None
+        self.parser = None
+
+    ##########################      parse      ##########################
+    def run(self, data, lexer):
+        """ 以本对象为当前线程的解析状态执行语法分析 """
+        last = getattr(LOCAL, 'kconfig', None)
+        LOCAL.kconfig = self
+        try:
+            self.parser.parse(data, lexer=lexer)
+        finally:
+            LOCAL.kconfig = last
+
+    def parse(self, data, jobs=1):
+        """ 分析预处理后的文本, jobs大于1时按endpath分段并行分析 """
+        if jobs > 1:
+            self.parse_parallel(data, jobs)
+        else:
+            self.run(data, self.lexer)
+
+    def parse_tokens(self, tokens):
+        """ 融合模式, 直接分析预处理输出的token流 """
+        self.run(None, TokenStream(tokens, self.lexer))
+
+    def parse_parallel(self, data, jobs):
+        """ 多进程分析预处理文本, 按顺序执行各段记录的语句
+            各段的行号从self.lexer的行号继续计数, 与单进程解析时一致
+        """
+        segments = split_segments(data, jobs * 4)
+        lineno = self.lexer.lineno
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            texts = [data[begin:end] for (begin, end) in segments]
+            results = executor.map(parse_segment, texts, [self.help] * len(texts))
+            for ((records, lines), (begin, end)) in zip(results, segments):
+                for (func, args) in records:
+                    if func is KconfigParser.syntax_error:
+                        args = (args[0], args[1], args[2] + lineno, args[3] + begin)
+                    func(self, *args)
+                    PROGRESS.update(self.current_path)
+                lineno += lines
+        self.lexer.lineno = lineno
+
+    def current_path(self):
+        return self.path_stack[-1] if len(self.path_stack) > 0 else None
+
+    ##########################      function      ##########################
+    def set_last_node(self, node, type):
+        # 组结束后的语句仍然作用于上一个配置项, 因此在切换到下一个节点时才释放dep_temp
+        last_node = self.last_node
+        if last_node.type == 'config' or last_node.type == 'menuconfig':
+            last_node.release_temp()
+        self.last_node = node
+
+    def set_last_node_dep(self):
+        """ 处理上一个config的dep信息 """
+        last_node = self.last_node
+        group_end = self.group[-1] if len(self.group) > 0 else None
+        if last_node.type == 'mainmenu':
+            return
+        # 组关系关键字在Group里填写
+        elif last_node.type == 'choice':
+            dis = ""
+            for item in self.group[1:]:
+                if item.node.detail is not None:
+                    if len(item.display) > 0:
+                        dis = check_line_and(dis) + '( ' + item.display + ' )'
+            if len(dis) > 0:
+                default = group_end.node.dep_temp.get_default() if group_end else None
+                for item in default:
+                    if len(item) > 1:
+                        group_end.node.config_dep.set_restrict(
+                            item[0], '!(' + dis + ') && (' + item[1] + ')')
+                    else:
+                        group_end.node.config_dep.set_restrict(
+                            item[0], '!(' + dis + ')')
+        elif last_node.type == 'config':
+            if group_end and group_end.node.type == 'choice' and group_end.node.detail.type == '':
+                group_end.node.set_detail_type(last_node.detail.type)
+            dis = ""
+            for item in self.group[1:]:
+                if item.node.detail is not None:
+                    if len(item.display) > 0:
+                        dis = check_line_and(dis) + '( ' + item.display + ' )'
+
+            if len(last_node.dep_temp.get_display()) > 0:
+                dis = check_line_and(dis) + last_node.dep_temp.get_display()
+            else:
+                dis = check_line_and(dis) + 'y'
+
+            default = last_node.dep_temp.get_default()
+            if len(dis) > 0:
+                for item in default:
+                    if len(item) > 1:
+                        last_node.config_dep.set_restrict(
+                            item[0], '!(' + dis + ') && (' + item[1] + ')')
+                    else:
+                        last_node.config_dep.set_restrict(item[0], '!(' + dis + ')')
+
+    def set_groupDep_configDep(self, node):
+        # 组信息第一次被引用时加入组信息表, 配置项只记录序号
+        if node.type == 'config':
+            result = []
+            for item in self.group:
+                if item.node.detail is not None:
+                    if item.index < 0:
+                        item.index = len(self.details)
+                        self.details.append(item.node.detail)
+                    result.append(item.index)
+            node.set_config_group(result)
+
+        dep = ""
+        for item in self.group[1:]:
+            if item.node.detail is not None:
+                if len(item.node.detail.get_depends()) > 0:
+                    if item.node.detail.get_depends()[1] == '"' and item.node.detail.get_depends()[-1] == '"':
+                        dep = check_line_and(dep) + item.node.detail.get_depends()
+                    else:
+                        dep = check_line_and(dep) + '( ' + item.node.detail.get_depends() + ' )'
+
+        # 组依赖条件写入组条件表, 配置项只记录序号
+        if len(dep) > 0:
+            if dep not in self.groups:
+                self.groups[dep] = len(self.groups)
+            node.config_dep.set_group(self.groups[dep])
+        return node
+
+    def update_select(self, kid, if_expr):
+        if len(if_expr) > 0:
+            if_expr = '[' + if_expr + ']'
+        else:
+            if_expr = ""
+        father = self.last_node.name
+        key = (father, kid)
+        if self.select.get(key, None):
+            self.select[key].append(if_expr)
+        else:
+            self.select[key] = [if_expr]
+
+    def update_imply(self, kid, imply_if):
+        key = (self.last_node.name, kid)
+        if self.imply.get(key, None):
+            self.imply[key].append(imply_if)
+        else:
+            self.imply[key] = [imply_if]
+
+    ##########################      statement      ##########################
+    def do_path(self, path):
+        self.path_stack.append(sys.intern(path))
+
+    def do_endpath(self):
+        if len(self.path_stack) > 0:
+            self.path_stack.pop()
+        else:
+            print("parse error => path")
+
+    def do_mainmenu(self, type, name):
+        self.root.set_type(type)
+        self.root.set_name(name)
+        self.root.set_path(self.path_stack[-1])
+
+    def do_config(self, type, name):
+        self.set_last_node_dep()
+
+        # 配置项名称在all_node、select、imply以及各节点中共用同一个字符串
+        name = sys.intern(name)
+        node = config_class_Node(name, type, self.path_stack[-1])
+
+        node = self.set_groupDep_configDep(node)
+
+        Father = self.group[-1]
+        if Father.node.kids is not None:
+            Father.node.kids.append(node)
+
+        # if Father.node.type == 'choice' and Father.node.detail.type == 'tristate':
+        #     node.config_dep.set_restrict('! y', '')
+
+        self.set_last_node(node, 'config')
+
+        # 记录需要打印数据，可能有重名config情况
+        item = self.all_node.get(name, None)
+        if not item:
+            self.all_node[name] = [node]
+        else:
+            self.all_node[name].append(node)
+
+    def do_comment(self, type, name):
+        self.set_last_node_dep()
 
-######################### handle dep function #########################
-def handle_select(target, lack_config):
-    for item in target:
-        father = item[0]
-        kid = item[1]
-        kid_ptr = all_node.get(kid, None)
-        if kid_ptr is not None:
-            for index in target[item]:
-                if len(index) == 0:
-                    for ptr in kid_ptr:
-                        ptr.config_dep.set_select(father)
+        node = config_class_Node(name, type, self.path_stack[-1])
+
+        self.set_last_node(node, type)
+
+    def do_menu(self, type, name):
+        self.set_last_node_dep()
+
+        node = config_class_Node(name, type, self.path_stack[-1])
+
+        self.set_last_node(node, type)
+
+        self.group.append(config_class_Group(node))
+
+    def do_if(self, type, string, dep):
+        self.set_last_node_dep()
+
+        node = config_class_Node(string, type, self.path_stack[-1])
+        self.set_last_node(node, type)
+
+        group = config_class_Group(node)
+        group.set_group_dep(dep)
+        self.group.append(group)
+
+    def do_choice(self, type, name):
+        self.set_last_node_dep()
+
+        node = config_class_Node('choice' + str(self.choice_index), type, self.path_stack[-1])
+        self.choice_index_list.append(self.choice_index)
+        self.choice_index += 1
+        if name != '\n':
+            node.set_detail_value('prompt', name)
+
+        node = self.set_groupDep_configDep(node)
+
+        self.set_last_node(node, type)
+
+        self.group.append(config_class_Group(node))
+
+    def do_groupend(self, keyword):
+        target = self.group.pop()
+
+        if target.node.type == 'menu' and keyword == 'endmenu':
+            pass
+        elif target.node.type == 'if' and keyword == 'endif':
+            pass
+        elif target.node.type == 'choice' and keyword == 'endchoice':
+            ####################################################
+            #
+            # 实现choice组内互斥放在depends依赖里判断
+            #
+            ####################################################
+            choice = target.node.detail
+            child = target.node.kids
+
+            if choice.type == 'bool':
+                for item in child:
+                    choice_config = '( ' + item.name
+                    for tmp in child:
+                        if tmp != item:
+                            choice_config = check_line_and(choice_config)
+                            choice_config += ' !' + tmp.name
+                    choice_config += ' )'
+                    item.config_dep.set_depends(choice_config)
+
+            elif choice.type == 'tristate':
+                pass
+            else:
+                print("warming, the choice group in {} has no type define! ".format(
+                    self.group[-1].node.path))
+            # 组内互斥条件生成后不再需要子配置项列表
+            target.node.kids = None
+
+    def do_type(self, type, prompt, display):
+        last_node = self.last_node
+        last_node.set_detail_type(type)
+        if self.group[-1].node.type == 'choice' and self.group[-1].node.detail.type == "":
+            self.group[-1].node.set_detail_type(type)
+        if prompt is not None:
+            last_node.set_detail_value("prompt", prompt)
+
+            if last_node.type == "choice":
+                target = self.group[-1]
+                if target.node.type != 'choice':
+                    raise
+                target.set_group_display(display)
+            elif last_node.type == 'config':
+                last_node.dep_temp.set_display(display)
+
+    def do_prompt(self, prompt, if_string, if_dep):
+        last_node = self.last_node
+        if if_string is None:
+            last_node.set_detail_value("prompt", prompt)
+        else:
+            last_node.set_detail_value("prompt", prompt + if_string)
+
+            if last_node.type == "choice":
+                target = self.group[-1]
+                if target.node.type != 'choice':
+                    raise
+                target.set_group_display(if_dep)
+            elif last_node.type == 'comment':
+                pass
+            elif last_node.type == 'config':
+                last_node.dep_temp.set_display(if_dep)
+
+    def do_help(self, help_context):
+        self.last_node.set_help(help_context)
+
+    def do_depends(self, string, dep):
+        last_node = self.last_node
+        last_node.set_detail_value('depends', string)
+
+        if last_node.type == "menu" or last_node.type == "choice":
+            target = self.group[-1]
+            if target.node.type != last_node.type:
+                raise
+            target.set_group_dep(dep)
+            if last_node.type == "choice":
+                last_node.config_dep.set_depends('(' + dep + ')')
+        elif last_node.type == 'comment':
+            pass
+        elif last_node.type == 'config' or last_node.type == 'menuconfig':
+            last_node.config_dep.set_depends('(' + dep + ')')
+
+    def do_select_imply(self, keyword, name, if_string, if_dep):
+        last_node = self.last_node
+        name = sys.intern(name)
+        if if_string is None:
+            last_node.set_detail_value(keyword, name)
+            if_dep = ''
+        else:
+            last_node.set_detail_value(keyword, name + ' ' + if_string)
+        if last_node.type == 'config' or last_node.type == 'menuconfig':
+            if keyword == 'select':
+                self.update_select(name, if_dep)
+            else:
+                target = self.all_node.get(name, None)
+                if target is None:
+                    self.update_imply(name, if_dep)
                 else:
-                    for ptr in kid_ptr:
-                        ptr.config_dep.set_select(father + index)
+                    for item in target:
+                        # 加子配置项的 ！dis
+                        item.config_dep.set_restrict(last_node.name, if_dep)
+
+    def do_range(self, keyword, string, dep, if_string, if_dep):
+        last_node = self.last_node
+        if if_string is None:
+            last_node.set_detail_value(keyword, string)
+            last_node.config_dep.set_restrict(dep, '')
         else:
-            if kid not in lack_config:
-                lack_config.append(kid)
-    return lack_config
-
-
-def handle_imply(target, lack_config):
-    for item in target:
-        father = item[0]
-        kid = item[1]
-        kid_node = all_node.get(kid, None)
-        # 增加imply的group_dis
-        if kid_node is not None:
-            for restrict in target[item]:
-                for ptr in kid_node:
-                    kid_dis = ptr.dep_temp.get_display()
-                    if_expr = ''
-                    if len(kid_dis) > 0:
-                        kid_dis = '!( ' + kid_dis + ' )'
-                    if len(restrict) > 0:
-                        kid_dis = check_line_and(kid_dis)
-                        if_expr = kid_dis + restrict
-                    ptr.config_dep.set_imply('( ' + father + ' )', if_expr)
+            last_node.set_detail_value(keyword, string + if_string)
+            last_node.config_dep.set_restrict(dep, if_dep)
+
+    def do_optional(self):
+        self.last_node.set_detail_value('optional', True)
+
+    def do_default(self, keyword, string, dep, if_string, if_dep):
+        last_node = self.last_node
+        # bool的choice完成组内config的互斥条件
+        if keyword == 'def_bool':
+            last_node.set_detail_type('bool')
+            if self.group[-1].node.type == 'choice' and self.group[-1].node.detail.type == "":
+                self.group[-1].node.set_detail_type('bool')
+        elif keyword == 'def_tristate':
+            last_node.set_detail_type('tristate')
+            if self.group[-1].node.type == 'choice' and self.group[-1].node.detail.type == "":
+                self.group[-1].node.set_detail_type('tristate')
+
+        if last_node.detail.type == "" and re.fullmatch('[0-9]+', string):
+            last_node.set_detail_type('int')
+        elif last_node.detail.type == "" and string[:2] == '0x':
+            last_node.set_detail_type('hex')
+
+        if if_string is None:
+            last_node.set_detail_value("default", string)
+            if last_node.type == 'choice' or last_node.type == 'config':
+                last_node.dep_temp.set_restrict([dep])
         else:
-            if kid not in lack_config:
-                lack_config.append(kid)
-    return lack_config
-
-
-def ParseKconfig(file, config_file, dep_file, display):
-    global display_switch
-    display_switch = display
-
-    reset_data()
-    begin = time.time()
-    parser.parse(utils_load_Kconfig(file), lexer=lexer)
-    
-    cost = time.time() - begin
-    print("\nParse time\t\t{}".format(str(cost)))
-    print("{:<40}".format("[Got All Config!]"))
-
-    all_config = {}
-    all_config_dep = {}
-    for item in all_node:
-        node_type = all_node[item][0].type
-        if node_type == 'config' or node_type == 'menuconfig':
-            all_config[item] = []
-            all_config_dep[item] = []
-            for tmp in all_node[item]:
-                all_config[item].append(tmp.detail)
-                all_config_dep[item].append(tmp.config_dep)
-        if node_type == 'choice':
-            all_config_dep[item] = []
-            for tmp in all_node[item]:
-                all_config_dep[item].append(tmp.config_dep)
-
-    print("{:<40}".format("[Prepare write AllConfig]") + "file => " +
-          config_file)
-    utils_write_json_file(all_config, config_file)
-
-    print("{:<40}".format("[Prepare write AllConfigDep]") + "file => " +
-          dep_file)
-    lack_config = handle_select(SELECT, [])
-    lack_config = handle_imply(IMPLY, lack_config)
-    utils_write_json_file(all_config_dep, dep_file)
+            last_node.set_detail_value("default", string + ' ' + if_string)
+            if last_node.type == 'choice' or last_node.type == 'config':
+                last_node.dep_temp.set_restrict([dep, if_dep])
+
+    def do_visible(self, string, dep):
+        last_node = self.last_node
+        last_node.set_detail_value('prompt', string)
+
+        if last_node.type == "menu":
+            target = self.group[-1]
+            if target.node.type != 'menu':
+                raise
+            target.set_group_display(dep)
+
+    def do_modules(self):
+        self.last_node.set_detail_value("modules", True)
+
+    def syntax_error(self, type, value, lineno, lexpos):
+        print("Syntax error!", end=" ")
+        print("LexToken(%s,%r,%d,%d)" % (type, value, lineno, lexpos))
+
+    ######################### handle dep function #########################
+    def handle_select(self, target, lack_config):
+        for item in target:
+            father = item[0]
+            kid = item[1]
+            kid_ptr = self.all_node.get(kid, None)
+            if kid_ptr is not None:
+                for index in target[item]:
+                    if len(index) == 0:
+                        for ptr in kid_ptr:
+                            ptr.config_dep.set_select(father)
+                    else:
+                        for ptr in kid_ptr:
+                            ptr.config_dep.set_select(father + index)
+            else:
+                if kid not in lack_config:
+                    lack_config.append(kid)
+        return lack_config
+
+    def handle_imply(self, target, lack_config):
+        for item in target:
+            father = item[0]
+            kid = item[1]
+            kid_node = self.all_node.get(kid, None)
+            # 增加imply的group_dis
+            if kid_node is not None:
+                for restrict in target[item]:
+                    for ptr in kid_node:
+                        kid_dis = ptr.get_display()
+                        if_expr = ''
+                        if len(kid_dis) > 0:
+                            kid_dis = '!( ' + kid_dis + ' )'
+                        if len(restrict) > 0:
+                            kid_dis = check_line_and(kid_dis)
+                            if_expr = kid_dis + restrict
+                        ptr.config_dep.set_imply('( ' + father + ' )', if_expr)
+            else:
+                if kid not in lack_config:
+                    lack_config.append(kid)
+        return lack_config
+
+    def write(self, config_file, dep_file, simplify=False):
+        """ 处理select、imply关系并写入解析结果, 只能调用一次 """
+        all_node = self.all_node
+        all_config = {}
+        all_config_dep = {}
+        for item in all_node:
+            node_type = all_node[item][0].type
+            if node_type == 'config' or node_type == 'menuconfig':
+                all_config[item] = []
+                all_config_dep[item] = []
+                for tmp in all_node[item]:
+                    all_config[item].append(tmp.detail)
+                    all_config_dep[item].append(tmp.config_dep)
+            if node_type == 'choice':
+                all_config_dep[item] = []
+                for tmp in all_node[item]:
+                    all_config_dep[item].append(tmp.config_dep)
+
+        print("{:<40}".format("[Prepare write AllConfig]") + "file => " +
+              config_file)
+        utils_write_json_file({'version': CONFIG_VERSION, 'help': self.help, 'groups': self.details,
+                               'config': all_config}, config_file, True)
+
+        print("{:<40}".format("[Prepare write AllConfigDep]") + "file => " +
+              dep_file)
+        lack_config = self.handle_select(self.select, [])
+        lack_config = self.handle_imply(self.imply, lack_config)
+        groups = list(self.groups)
+        utils_write_json_file({'version': DEP_VERSION, 'groups': groups, 'config': all_config_dep}, dep_file, True)
+
+        all_expr = {}
+        for item in all_config_dep:
+            all_expr[item] = [(tmp.rev_select, tmp.dep, tmp.restrict) for tmp in all_config_dep[item]]
+        names = None
+        if simplify:
+            names = tristate_names({item: [tmp.type for tmp in all_config_dep[item]] for item in all_config_dep})
+        write_expr(all_expr, get_expr_path(dep_file), self.expr_lexer, groups, names)
+
+    def write_help(self, help_file):
+        """ 只写入配置项的help文本{配置项名称 : [help]}, 与_config.json中的help一致 """
+        all_help = {}
+        for item in self.all_node:
+            if self.all_node[item][0].type in ('config', 'menuconfig'):
+                all_help[item] = [tmp.detail.help for tmp in self.all_node[item]]
+        print("{:<40}".format("[Prepare write ConfigHelp]") + "file => " + help_file)
+        utils_write_json_file(all_help, help_file, True)
+
+
+def ParseKconfig(file, config_file, dep_file, display, tokens=None, jobs=1, simplify=False, help=True):
+    with KconfigParser(help=help) as kconfig:
+        begin = time.time()
+        if tokens is None:
+            PROGRESS.begin('parse', 'parse => ', display)
+            kconfig.parse(utils_load_Kconfig(file), jobs)
+            PROGRESS.end()
+        else:
+            # 融合模式, 与预处理同时进行, 进度并入预处理阶段
+            kconfig.parse_tokens(tokens)
+
+        cost = time.time() - begin
+        print("\nParse time\t\t{}".format(str(cost)))
+        print("{:<40}".format("[Got All Config!]"))
+
+        kconfig.write(config_file, dep_file, simplify)
+
 
+def ParseHelp(file, help_file, jobs=1):
+    """ 重新分析预处理后的文件, 只写入help文本, 用于解析时跳过help的结果 """
+    with KconfigParser() as kconfig:
+        kconfig.parse(utils_load_Kconfig(file), jobs)
+        kconfig.write_help(help_file)
@@ -0,0 +1,206 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+依赖表达式的预编译结果, 保存在_dep.json同一目录下的tag_arch_expr.json中
+同一内核版本的rev_select、dep、restrict表达式不会变化, 在解析阶段完成词法分析,
+检查阶段直接读取单词序列, 不需要再调用check_lex
+
+文件格式:
+    {
+        "version": 版本,
+        "types": 单词类型表,
+        "values": 单词取值表, 相同的配置项名称只保存一次,
+        "expr": {配置项名称 : [[rev_select, dep, restrict], ...]},
+        "groups": [组条件]
+    }
+每个表达式为[类型序号, 取值序号, 类型序号, 取值序号, ...], 词法分析失败的表达式为null,
+检查时再按原方式处理
+dep只包含配置项自身的依赖, 组条件与_dep.json的组条件表一一对应, 版本1没有groups
+生成时可以先对单词序列进行化简(见simplify.py), 检查结果不变, 错误信息中仍显示_dep.json中的原表达式
+"""
+
+import json
+import os
+
+from . import check_lex
+from .check_lex import tokens as TYPES
+from .simplify import simplify_condition, simplify_expr, tristate_names
+from .utils import load_json, split_dep
+
+
+EXPR_VERSION = 2
+EXPR_VERSIONS = (1, 2)  # 可以读取的版本, 版本1与早期格式的_dep.json对应
+KEYS = {'rev_select': 0, 'dep': 1, 'restrict': 2}
+
+
+class Token:
+    """ 与check_lex输出的单词具有相同的type、value属性 """
+    __slots__ = ('type', 'value')
+
+    def __init__(self, type, value) -> None:
+        self.type = type
+        self.value = value
+
+
+def get_expr_path(dep_path):
+    """ 根据_dep.json(或知识库.db)路径获得预编译结果路径 """
+    if dep_path.endswith('_dep.json'):
+        return dep_path[:-len('_dep.json')] + '_expr.json'
+    return os.path.splitext(dep_path)[0] + '_expr.json'
+
+
+def lex_expr(line, lexer):
+    """ 使用check_lex分析器lexer对表达式进行词法分析, 返回[(类型, 取值)], 失败时返回None """
+    result = []
+    try:
+        lexer.input(line)
+        while True:
+            tok = lexer.token()
+            if not tok:
+                break
+            result.append((tok.type, tok.value))
+    except Exception:
+        return None
+    return result
+
+
+def write_expr(all_expr, expr_path, lexer=None, groups=(), names=None):
+    """ 编译全部依赖表达式并写入文件
+    参数:
+        all_expr: {配置项名称 : [(rev_select, dep, restrict)]}
+        expr_path: 保存路径
+        lexer: 使用的check_lex分析器, 默认使用check_lex.lexer的副本
+        groups: _dep.json的组条件表
+        names: bool、tristate配置项名称集合, 指定时化简表达式,
+            dep与组条件整体化简, rev_select、restrict只化简[]内的条件
+    """
+    if lexer is None:
+        lexer = check_lex.lexer.clone()
+    type_index = {name: index for (index, name) in enumerate(TYPES)}
+    values = []
+    value_index = {}
+    lines = {}
+    if names is not None:
+        reduces = (simplify_condition, simplify_expr, simplify_condition)
+    else:
+        reduces = (None, None, None)
+
+    def compile(line, reduce):
+        key = (line, reduce)
+        if key not in lines:
+            words = lex_expr(line, lexer)
+            if words is not None and reduce is not None:
+                words = reduce(words, names)
+            if words is not None:
+                code = []
+                for (type, value) in words:
+                    if value not in value_index:
+                        value_index[value] = len(values)
+                        values.append(value)
+                    code.append(type_index[type])
+                    code.append(value_index[value])
+                words = code
+            lines[key] = words
+        return lines[key]
+
+    result = {}
+    for name in all_expr:
+        result[name] = [[compile(line, reduce) for (line, reduce) in zip(item, reduces)] for item in all_expr[name]]
+    data = {'version': EXPR_VERSION, 'types': TYPES, 'values': values, 'expr': result,
+            'groups': [compile(line, reduces[1]) for line in groups]}
+    print("{:<40}".format("[Prepare write DepExpr]") + "file => " + expr_path)
+    temp = expr_path + '.tmp'
+    with open(temp, 'w') as file:
+        json.dump(data, file, separators=(',', ':'))
+    os.replace(temp, expr_path)
+
+
+def build_expr(dep_path, expr_path=None, simplify=False):
+    """ 由已有的_dep.json生成预编译结果, 用于解析阶段未生成该文件的历史结果, simplify为True时化简表达式 """
+    (dep, groups) = split_dep(load_json(dep_path))
+    all_expr = {}
+    for name in dep:
+        all_expr[name] = [(item['rev_select'], item['dep'], item['restrict']) for item in dep[name]]
+    names = tristate_names({name: [item['type'] for item in dep[name]] for name in dep}) if simplify else None
+    write_expr(all_expr, expr_path or get_expr_path(dep_path), groups=groups, names=names)
+
+
+class ExprTable:
+    """
+    预编译结果, 按配置项名称读取时才生成单词序列, 相同的单词共用一个Token对象
+
+    属性包括:
+        * types: 单词类型表
+        * values: 单词取值表
+        * expr: 编码后的表达式
+        * groups: 编码后的组条件
+        * tokens: {(类型序号, 取值序号) : Token}
+        * cache: {配置项名称 : [[rev_select, dep, restrict]]}
+    """
+    def __init__(self, data) -> None:
+        self.types = data['types']
+        self.values = data['values']
+        self.expr = data['expr']
+        self.groups = data.get('groups', [])
+        self.tokens = {}
+        self.cache = {}
+
+    def decode(self, code):
+        if code is None:
+            return None
+        result = []
+        for i in range(0, len(code), 2):
+            key = (code[i], code[i + 1])
+            token = self.tokens.get(key, None)
+            if token is None:
+                token = Token(self.types[code[i]], self.values[code[i + 1]])
+                self.tokens[key] = token
+            result.append(token)
+        return result
+
+    def get(self, name, index, key):
+        """ 查询配置项第index个定义的表达式, 不存在时返回None
+        参数:
+            key: rev_select、dep或restrict
+        """
+        if name not in self.cache:
+            self.cache[name] = [[self.decode(code) for code in item] for item in self.expr.get(name, [])]
+        item = self.cache[name]
+        if index >= len(item):
+            return None
+        return item[index][KEYS[key]]
+
+    def get_group(self, group):
+        """ 查询第group个组条件, 不存在时返回None """
+        if group >= len(self.groups):
+            return None
+        return self.decode(self.groups[group])
+
+
+def load_expr(dep_path):
+    """ 读取与dep_path对应的预编译结果
+        文件不存在、版本不一致或早于_dep.json时返回None
+    参数:
+        dep_path: _dep.json文件路径, 或知识库文件(.db)
+    """
+    expr_path = get_expr_path(dep_path)
+    if not os.path.exists(expr_path):
+        return None
+    # 知识库由_dep.json生成, 与同一目录下的_dep.json比较
+    source = expr_path[:-len('_expr.json')] + '_dep.json'
+    if os.path.exists(source) and os.path.getmtime(expr_path) < os.path.getmtime(source):
+        return None
+    data = load_json(expr_path)
+    if data.get('version', None) not in EXPR_VERSIONS:
+        return None
+    print("{:<40}".format("[Load dep expr]") + "file => " + expr_path)
+    return ExprTable(data)
@@ -0,0 +1,143 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+增量检查, 修改.config中少量配置项的取值后只重新计算受影响的配置项
+
+主函数为IncrementalChecker(dep_path, config_path, file_path, save_file)、Recheck(changes, save_file)
+    * IncrementalChecker与Checker相同地完整检查一次, 保留各配置项的检查记录(见check.visit_config),
+      并建立反向依赖索引: 与tools.make_dict的子类关系相同, 另外包括restrict中的配置项
+    * Recheck修改取值后, 只删除修改的配置项、其子类、检查记录中读取过修改配置项的配置项以及相关组条件的记录,
+      再按检查记录重新处理检查顺序; 其余配置项不再计算, 错误信息的内容与顺序与完整检查修改后的.config相同
+
+check.py的检查状态为模块级变量, 同一时间只保留一个.config文件的增量检查状态,
+IncrementalChecker之后调用Checker、BatchChecker等会替换检查状态, 此时Recheck报错, 需要重新调用IncrementalChecker
+"""
+
+import importlib
+import os
+import time
+
+from .utils import get_word
+
+# tools/__init__.py中的check为同名函数, 直接取得模块以访问检查状态
+checker = importlib.import_module('.check', __package__)
+
+BASELINE = None  # 增量检查的基准: (dep_path, config_path, file_path, 检查状态check.CONFIG_RECORD)
+
+
+def make_index():
+    """ 由rev_select、dep、组条件以及restrict建立反向依赖索引, 保存在check.KIDS、check.GROUP_KIDS中,
+        reset_GLOAL重新读取解析结果时一并清除
+    """
+    kids = {}
+    group_kids = {}
+    group_words = []
+    for (group, line) in enumerate(checker.GROUPS):
+        words = get_word(line)
+        group_words.append(words)
+        for word in words:
+            group_kids.setdefault(word, set()).add(group)
+    for name in checker.CONFIG_DEP:
+        for item in checker.CONFIG_DEP[name]:
+            words = get_word(item['rev_select']) + get_word(item['dep']) + get_word(item['restrict'])
+            if item.get('group', -1) >= 0:
+                words += group_words[item['group']]
+            for word in words:
+                kids.setdefault(word, set()).add(name)
+    checker.KIDS = kids
+    checker.GROUP_KIDS = group_kids
+
+
+def check_state():
+    """ 确认check.py中仍然是IncrementalChecker的检查状态, 否则抛出RuntimeError """
+    if BASELINE is None:
+        raise RuntimeError("No baseline for recheck, call IncrementalChecker first")
+    if checker.KIDS is None or checker.CONFIG_RECORD is not BASELINE[3]:
+        raise RuntimeError("Baseline of " + BASELINE[2] + " was replaced by another check, call IncrementalChecker again")
+
+
+def affected(names):
+    """ 需要重新计算的配置项与组条件
+        检查记录中的读取与取值有关(例如restrict中if条件成立时才读取), 与静态的引用关系一起确定
+    返回值: (配置项名称集合, 组条件序号集合)
+    """
+    groups = set()
+    for name in names:
+        groups |= checker.GROUP_KIDS.get(name, set())
+    for (group, record) in checker.GROUP_RECORD.items():
+        if not names.isdisjoint(record):
+            groups.add(group)
+    result = set(names)
+    for name in names:
+        result |= checker.KIDS.get(name, set())
+    keys = names | groups
+    for (name, record) in checker.CONFIG_RECORD.items():
+        if not keys.isdisjoint(record):
+            result.add(name)
+    return (result, groups)
+
+
+def IncrementalChecker(dep_path, config_path, file_path, save_file):
+    """ 完整检查.config文件并保留增量检查所需的状态, 参数与Checker相同 """
+    global BASELINE
+    BASELINE = None
+    checker.Checker(dep_path, config_path, file_path, save_file)
+    make_index()
+    BASELINE = (dep_path, config_path, file_path, checker.CONFIG_RECORD)
+
+
+def Recheck(changes, save_file=None):
+    """ 修改配置项取值后重新检查, 调用前需要IncrementalChecker
+
+    Args:
+        changes (dict): {配置项名称(不含CONFIG_前缀) : 新取值}, 取值为None时从.config中删除该配置项,
+                        新增的配置项与追加在.config末尾时相同
+        save_file (str): 输出检查结果_error.json文件, 没有错误时删除该文件; 为None时不写入
+
+    Returns:
+        dict: 与修改前相比的变化, {'added': 新增错误的配置项, 'removed': 错误消失的配置项,
+              'changed': 错误信息变化的配置项, 'checked': 重新计算的配置项数量}
+
+    Raises:
+        RuntimeError: 没有调用IncrementalChecker, 或检查状态已被其他检查替换
+    """
+    check_state()
+    begin = time.time()
+    (names, groups) = affected(set(changes))
+    for (name, value) in changes.items():
+        if value is None:
+            checker.CONFIG_VALUE.pop(name, None)
+        else:
+            checker.CONFIG_VALUE[name] = value
+    checker.forget(names, groups)
+    before = checker.ERROR_JSON
+    checker.reset_visit()
+    checker.check_values(checker.CONFIG_VALUE)
+    after = checker.ERROR_JSON
+    result = {
+        'added': [name for name in after if name not in before],
+        'removed': [name for name in before if name not in after],
+        'changed': [name for name in after if name in before and error_data(after[name]) != error_data(before[name])],
+        'checked': len([name for name in names if name in checker.CONFIG_RECORD]),
+    }
+    cost = time.time() - begin
+    print("{:<40}".format("[Recheck end]") + "{} configs checked, {} errors, time {:.4f}".format(
+        result['checked'], len(after), cost))
+    if save_file is not None:
+        if len(after) == 0 and os.path.exists(save_file):
+            os.remove(save_file)
+        checker.write_result(save_file)
+    return result
+
+
+def error_data(error):
+    return (error.error, error.value, error.dep_value)
@@ -0,0 +1,239 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+SQLite知识库, 将_config.json和_dep.json整理到一个带索引的数据库文件(tag_arch.db)中
+查询单个配置项时不需要读取完整的json文件
+
+数据表包括:
+    * meta: 知识库版本等信息
+    * config: 配置项定义, 对应_config.json, 每个定义一行
+        (name, idx, path, type, prompt, help, detail), detail为_config.json中定义的json字符串,
+        版本3开始其中的group为组信息序号
+    * dep: 配置项依赖, 对应_dep.json, 每个定义一行
+        (name, idx, type, rev_select, dep, restrict, data), dep为合并组条件后的完整依赖条件,
+        data为_dep.json中依赖信息的json字符串
+    * group_dep: _dep.json的组条件表, 版本1的知识库没有该表
+        (id, dep)
+    * group_detail: _config.json的组信息表, 版本3之前的知识库没有该表
+        (id, detail), detail为menu、if、choice信息的json字符串
+    * edge: 配置项之间的关系
+        (kind, src, dst)
+        - select/imply: src通过select/imply关键字影响dst
+        - father: dst出现在src的反向select或依赖中, 即dst为src的父类配置项
+"""
+
+import json
+import os
+import re
+import sqlite3
+
+from . import check_lex
+from .utils import full_dep, get_word, load_json, split_config, split_dep
+
+
+KB_VERSION = 3
+
+SCHEMA = '''
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE config (name TEXT, idx INTEGER, path TEXT, type TEXT, prompt TEXT, help TEXT, detail TEXT);
+CREATE TABLE dep (name TEXT, idx INTEGER, type TEXT, rev_select TEXT, dep TEXT, restrict TEXT, data TEXT);
+CREATE TABLE edge (kind TEXT, src TEXT, dst TEXT);
+CREATE TABLE group_dep (id INTEGER PRIMARY KEY, dep TEXT);
+CREATE TABLE group_detail (id INTEGER PRIMARY KEY, detail TEXT);
+CREATE INDEX config_name ON config (name);
+CREATE INDEX dep_name ON dep (name);
+CREATE INDEX edge_src ON edge (src, kind);
+CREATE INDEX edge_dst ON edge (dst, kind);
+'''
+
+
+def build_knowledge(config_path, dep_path, db_path):
+    """ 根据_config.json和_dep.json生成知识库
+    参数:
+        config_path: _config.json文件路径
+        dep_path: _dep.json文件路径
+        db_path: 知识库保存路径
+    """
+    data = load_json(config_path)
+    (config, details) = split_config(data)
+    # 解析时跳过help的结果, 与get_help相同地从help文件读取, 不存在时按需生成
+    helps = None
+    if not data.get('help', True):
+        from . import load_help as make_help
+        helps = make_help(config_path)
+        if helps is None:
+            print("{:<40}".format("[WARMING]") + "Knowledge base without help text => " + db_path)
+    (dep, groups) = split_dep(load_json(dep_path))
+    temp = db_path + '.tmp'
+    if os.path.exists(temp):
+        os.remove(temp)
+    db = sqlite3.connect(temp)
+    db.executescript(SCHEMA)
+    db.execute('INSERT INTO meta VALUES (?, ?)', ('version', str(KB_VERSION)))
+
+    rows = []
+    edges = []
+    for name in config:
+        for (idx, item) in enumerate(config[name]):
+            rows.append((name, idx, item['path'], item['type'], item['value']['prompt'],
+                         item['help'] if helps is None else helps[name][idx], json.dumps(item)))
+            for kind in ('select', 'imply'):
+                for line in item['value'][kind]:
+                    edges.append((kind, name, re.split(r'\s+if\s+', line.strip(), 1)[0].strip()))
+    db.executemany('INSERT INTO config VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    # 父类关系与tools.make_dict一致, 使用单独的分析器以便多个线程同时生成知识库
+    rows = []
+    seen = set()
+    lexer = check_lex.lexer.clone()
+    group_words = [get_word(line, lexer) for line in groups]
+    for name in dep:
+        for (idx, item) in enumerate(dep[name]):
+            rows.append((name, idx, item['type'], item['rev_select'], full_dep(item, groups), item['restrict'],
+                         json.dumps(item)))
+            words = get_word(item['rev_select'], lexer)
+            if item.get('group', -1) >= 0:
+                words += group_words[item['group']]
+            for father in words + get_word(item['dep'], lexer):
+                if (name, father) not in seen:
+                    seen.add((name, father))
+                    edges.append(('father', name, father))
+    db.executemany('INSERT INTO dep VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+    db.executemany('INSERT INTO edge VALUES (?, ?, ?)', edges)
+    db.executemany('INSERT INTO group_dep VALUES (?, ?)', enumerate(groups))
+    db.executemany('INSERT INTO group_detail VALUES (?, ?)', [(idx, json.dumps(item)) for (idx, item) in enumerate(details)])
+    db.commit()
+    db.close()
+    os.replace(temp, db_path)
+    print("{:<40}".format("[Write knowledge base]") + "file => " + db_path)
+
+
+class Table:
+    """
+    按配置项名称逐个读取知识库的只读字典, 用于替代load_json读取的完整字典
+    读取过的配置项缓存在内存中
+    """
+    def __init__(self, kb, table) -> None:
+        self.kb = kb
+        self.table = table
+        self.cache = {}
+
+    def get(self, name, default=None):
+        if name not in self.cache:
+            self.cache[name] = self.kb.query_json(self.table, name)
+        value = self.cache[name]
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+class KnowledgeBase:
+    """
+    知识库查询接口, 第一次查询时才打开数据库
+
+    属性包括:
+        * path: 知识库文件路径
+        * db: sqlite3连接
+    """
+    def __init__(self, path) -> None:
+        self.path = path
+        self.db = None
+
+    def connect(self):
+        if self.db is None:
+            self.db = sqlite3.connect('file:' + self.path + '?mode=ro', uri=True)
+        return self.db
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def query_json(self, table, name):
+        """ 查询配置项的全部定义, 返回值与json文件中的列表一致, 不存在时返回None """
+        column = 'detail' if table == 'config' else 'data'
+        rows = self.connect().execute(
+            'SELECT ' + column + ' FROM ' + table + ' WHERE name = ? ORDER BY idx', (name,)).fetchall()
+        if len(rows) == 0:
+            return None
+        return [json.loads(row[0]) for row in rows]
+
+    def config(self):
+        """ 按需读取的_config.json """
+        return Table(self, 'config')
+
+    def dep(self):
+        """ 按需读取的_dep.json """
+        return Table(self, 'dep')
+
+    def version(self):
+        rows = self.connect().execute("SELECT value FROM meta WHERE key = 'version'").fetchall()
+        return int(rows[0][0])
+
+    def groups(self):
+        """ _dep.json的组条件表, 版本1的知识库中依赖条件是完整的, 返回空表 """
+        if self.version() < 2:
+            return []
+        return [row[0] for row in self.connect().execute('SELECT dep FROM group_dep ORDER BY id')]
+
+    def config_groups(self):
+        """ _config.json的组信息表, 版本3之前的知识库中group为组信息本身, 返回空表 """
+        if self.version() < 3:
+            return []
+        return [json.loads(row[0]) for row in self.connect().execute('SELECT detail FROM group_detail ORDER BY id')]
+
+    def get_help(self, name):
+        rows = self.connect().execute('SELECT help FROM config WHERE name = ? ORDER BY idx', (name,))
+        return [row[0] for row in rows]
+
+    def get_edge(self, kind, src=None, dst=None):
+        """ 查询配置项关系, 按src或dst筛选 """
+        if src is not None:
+            rows = self.connect().execute(
+                'SELECT dst FROM edge WHERE src = ? AND kind = ? ORDER BY rowid', (src, kind))
+        else:
+            rows = self.connect().execute(
+                'SELECT src FROM edge WHERE dst = ? AND kind = ? ORDER BY rowid', (dst, kind))
+        return [row[0] for row in rows]
+
+    def get_father(self, name):
+        return self.get_edge('father', src=name)
+
+    def get_kid(self, name):
+        return self.get_edge('father', dst=name)
+
+    def all_help(self):
+        """ 全部配置项的help信息, {name : [help]} """
+        result = {}
+        for (name, help) in self.connect().execute('SELECT name, help FROM config ORDER BY rowid'):
+            result.setdefault(name, []).append(help)
+        return result
+
+    def all_edge(self, kind, flag):
+        """ 全部配置项关系, 与tools.make_dict返回值一致
+        参数:
+            flag: True以dst为键(子类), False以src为键(父类)
+        """
+        result = {}
+        for (src, dst) in self.connect().execute('SELECT src, dst FROM edge WHERE kind = ? ORDER BY rowid', (kind,)):
+            if flag:
+                result.setdefault(dst, []).append(src)
+            else:
+                result.setdefault(src, []).append(dst)
+        return result
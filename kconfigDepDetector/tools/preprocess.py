@@ -12,22 +12,36 @@
 """
 预处理程序
 
-主函数为Preprocessing(root, target, file)
+主函数为Preprocessing(root, target, file, display, jobs)
+同时处理多个体系架构时使用preprocessing_archs(root, targets, files, ...),
+每个Kconfig文件只进行一次词法分析, 各架构只重新展开source语句
 其参数含义为
-    * root: Linux内核路径
+    * root: Linux内核路径, 也可以是内核源码压缩包
     * target: 目标架构, 例如x86、mips
     * file: 预处理结果保存路径
+    * display: 终端打印开关
+    * jobs: 词法分析进程数, 大于1时使用多进程预先完成所有Kconfig文件的词法分析
+    * cache: 词法分析缓存文件路径, 仅重新分析发生变化的Kconfig文件
+    * rev: git版本, 指定时root为git仓库, 直接读取该版本的Kconfig文件而不需要检出
+    * discover: Kconfig文件发现方式
+        - walk: 遍历整个源码目录, 未被source引用的Kconfig文件也会被处理(默认)
+        - source: 只从顶层Kconfig出发沿source语句查找, 不遍历目录
 
 预处理过程不会检查Kconfig文件编写规范,
 若出现“There is an unknown error. Note the error message above!”
 需要人工检查Kconfig相关信息
 """
 
-import os
-import ply.lex as lex
 import re
 import time
 
+from concurrent.futures import ProcessPoolExecutor
+
+from .progress import PROGRESS
+from .provider import FileProvider, open_provider
+from .tables import build_lexer
+from .token_cache import TokenCache
+
 
 ERROR_FLAG = False
 display_switch = False
@@ -130,7 +144,7 @@ def t_WRONG_NL(t):
 
 
 def t_WRONG_error(t):
-    print(PATH[len(PATH) - 1] + " => WRONG Illegal charactor '%s'" % t.value[-10:20])
+    print(CURRENT + " => WRONG Illegal charactor '%s'" % t.value[-10:20])
     global ERROR_FLAG
     ERROR_FLAG = True
     t.lexer.skip(1)
@@ -144,7 +158,7 @@ def t_BOOLEAN(t):
 
 
 def t_error(t):
-    print(PATH[len(PATH) - 1] + " initial Illegal charactor '%s'" % t.value[-10:20])
+    print(CURRENT + " initial Illegal charactor '%s'" % t.value[-10:20])
     global ERROR_FLAG
     ERROR_FLAG = True
     t.lexer.skip(1)
@@ -254,7 +268,7 @@ def t_SP_END(t):
 
 
 def t_SP_error(t):
-    print(PATH[len(PATH) - 1] + " => SP Illegal charactor '%s'" % t.value[-10:20])
+    print(CURRENT + " => SP Illegal charactor '%s'" % t.value[-10:20])
     global ERROR_FLAG
     ERROR_FLAG = True
     t.lexer.skip(1)
@@ -295,7 +309,7 @@ def t_STRING_CONTEXT(t):
 
 def t_STRING_NL(t):
     r'\n+'
-    print(PATH[len(PATH) - 1] + " => string multi-line strings not supported\n")
+    print(CURRENT + " => string multi-line strings not supported\n")
     t.lexer.begin('INITIAL')
     global string_context
     t.value = '"' + string_context + '"'
@@ -305,7 +319,7 @@ def t_STRING_NL(t):
 
 
 def t_STRING_error(t):
-    print(PATH[len(PATH) - 1] + " => string Illegal charactor '%s'" % t.value[-10:20])
+    print(CURRENT + " => string Illegal charactor '%s'" % t.value[-10:20])
     global ERROR_FLAG
     ERROR_FLAG = True
     t.lexer.skip(1)
@@ -313,88 +327,51 @@ def t_STRING_error(t):
 
 ##########################   help   ##########################
 t_HELP_ignore = ''
-help_context = ""
-
-
-def get_word(line):
-    result = ""
-    index = 0
-    while index < len(line):
-        if re.match(r'\S', line[index]):
-            # if line[index] != ' ' and line[index] != '\t' and line[index] != '\n':
-            break
-        index += 1
-    while index < len(line):
-        # if line[index] != ' ' and line[index] != '\t' and line[index] != '\n':
-        if re.match(r'\S', line[index]):
-            result += line[index]
-            index += 1
-        else:
-            break
-    return (result, index)
-
-
-def get_eol(line):
-    index = 0
-    while index < len(line):
-        if line[index] == '\n':
-            return True
-        elif line[index] == ' ' or line[index] == '\t':
-            index += 1
-        elif re.match(r'\S', line[index]):
-            return False
-
-
-def check_help_end(data):
-    if len(data) == 0:
+help_context = []  # 当前help文本的片段, 结束时合并
+
+HELP_WORD = re.compile(r'\s*(\S*)')
+HELP_NAME = re.compile(r'[A-Za-z0-9_-]+')
+HELP_EOL = re.compile(r'[^\S\n]*\n')
+HELP_LETTER = re.compile(r'[a-zA-Z]')
+
+
+def check_help_end(data, pos=0):
+    """ 判断help文本是否在当前行结束
+        直接在原文本上从pos开始向后匹配, 不复制剩余文本, 只检查下一个非空行的前两个单词
+    参数:
+        data: Kconfig文件内容
+        pos: 当前help行之后的位置
+    返回值: 下一个非空行为“config 名称”, 或不缩进且不是config开头时返回True
+    """
+    end = len(data)
+    while pos < end and data[pos] == '\n':
+        pos += 1
+    if pos >= end:
         return True
-    i = 0
-    while i < len(data):
-        if data[i] == '\t' or data[i] == ' ':
-            (word, tmp1) = get_word(data[i:len(data)])
-            if word == 'config':
-                (word, tmp2) = get_word(data[i + tmp1:len(data)])
-                if re.fullmatch(r'[A-Za-z0-9_-]+', word) and get_eol(
-                        data[i + tmp1 + tmp2:len(data)]):
-                    return True
-                else:
-                    return False
-            else:
-                return False
-        elif data[i] == '\n':
-            i += 1
-            continue
-        else:
-            (word, tmp1) = get_word(data[i:len(data)])
-            if word == 'config':
-                (word, tmp2) = get_word(data[i + tmp1:len(data)])
-                if re.fullmatch(r'[A-Za-z0-9_-]+', word) and get_eol(
-                        data[i + tmp1 + tmp2:len(data)]):
-                    return True
-                else:
-                    return False
-            else:
-                break
-    return True
+    indent = data[pos] == '\t' or data[pos] == ' '
+    word = HELP_WORD.match(data, pos)
+    if word.group(1) != 'config':
+        return not indent
+    name = HELP_WORD.match(data, word.end())
+    if HELP_NAME.fullmatch(name.group(1)) and HELP_EOL.match(data, name.end()):
+        return True
+    return False
 
 
 def t_HELP_CONTEXT(t):
     r'[\S ]+'
     global help_context
-    if check_help_end(t.lexer.lexdata[t.lexer.lexpos:t.lexer.lexlen]):
+    if check_help_end(t.lexer.lexdata, t.lexer.lexpos):
         t.type = "HELP_CONTEXT"
-        t.value = help_context + t.value
-        index = 0
-        while index < len(t.value):
-            if re.fullmatch('[a-zA-Z]', t.value[index]):
-                # if t.value[index] == r'[a-zA-Z]':
-                break
-            index += 1
+        help_context.append(t.value)
+        t.value = ''.join(help_context)
+        letter = HELP_LETTER.search(t.value)
+        index = letter.start() if letter else len(t.value)
         t.value = '\t\t' + t.value[index:]
         t.lexer.begin('INITIAL')
-        help_context = ""
+        help_context = []
         return t
-    help_context += t.value
+    help_context.append(t.value)
 
 
 def t_HELP_WHITESPACE(t):
@@ -406,13 +383,13 @@ def t_HELP_NL(t):
     r'\n+'
     global help_context
     if len(help_context) > 0:
-        help_context += '\n\t\t'
+        help_context.append('\n\t\t')
     else:
-        help_context += '\t\t'
+        help_context.append('\t\t')
 
 
 def t_HELP_error(t):
-    print(PATH[len(PATH) - 1] +
+    print(CURRENT +
           " => help Illegal charactor '%s'" % t.value[-10:20])
     global ERROR_FLAG
     ERROR_FLAG = True
@@ -443,7 +420,7 @@ def t_SOURCE_DOT(t):
 
 
 def t_SOURCE_error(t):
-    print(PATH[len(PATH) - 1] + " => source Illegal charactor '%s'" % t.value[-10:20])
+    print(CURRENT + " => source Illegal charactor '%s'" % t.value[-10:20])
     global ERROR_FLAG
     ERROR_FLAG = True
     t.lexer.skip(1)
@@ -457,26 +434,22 @@ def t_SOURCE_error(t):
 #     return t
 ##############################################################
 
-lexer = lex.lex()
+lexer = build_lexer(__name__, 'preprocess_lextab')
 
 ##########################  other   ##########################
 NOT_PARSE = [
     'scripts/kconfig', '/scripts/Kconfig.include'
 ]
-PATH = []
-
-DIS_COUNT = -1
-def dis(file, root):
-    global DIS_COUNT
-    DIS_COUNT += 1
-    if DIS_COUNT == 0 and display_switch:
-        rows, columns = os.popen('stty size', 'r').read().split()
-        print("\rread file => " + file.replace(root, '').ljust(int(columns) - 30), end='\r', flush=True)
-    elif DIS_COUNT == 10:
-        DIS_COUNT = -1
+VISITED = set()  # 已经读取过的Kconfig文件(相对路径)
+CURRENT = ''  # 当前正在分析的Kconfig文件, 用于打印错误信息
+LEXED = {}  # {file : token列表}, 多进程词法分析的结果
+KEEP = False  # 为True时LEXED中的结果在读取后保留, 供其他体系架构使用
+LEX_ERROR = set()  # 出现词法错误的文件
+CACHE = None  # TokenCache, 词法分析缓存
+PROVIDER = FileProvider()  # 源码读取方式
 
 def not_parse(file_path, root):
-    if file_path.replace(root, '') in PATH:
+    if file_path.replace(root, '') in VISITED:
         return True
     for item in NOT_PARSE:
         if item in file_path:
@@ -484,163 +457,392 @@ def not_parse(file_path, root):
     return False
 
 
+def reset_lexer():
+    """ 重置词法分析器状态, 保证每个Kconfig文件都从INITIAL状态开始分析 """
+    global string_context, string_flag, sp_count, sp_context, help_context
+    string_context = ""
+    string_flag = ''
+    sp_count = 0
+    sp_context = ''
+    help_context = []
+    lexer.begin('INITIAL')
+
+
+def lex_file(root, file, data=None):
+    """ 对单个Kconfig文件进行词法分析
+    参数:
+        root: 内核源码路径
+        file: Kconfig文件路径
+        data: 文件内容, 为None时通过PROVIDER读取
+    返回值: (类型, 值)形式的token列表, 首尾为PATH和ENDPATH标记
+    """
+    res = []
+    res.append(("PATH", "path"))
+    res.append(("QUOTE_WORD", '"' + file.replace(root, '') + '"'))
+    res.append(("EOL", "\\n"))
+
+    if data is None:
+        data = PROVIDER.read(file)
+    data = data.replace(u'\xa0', ' ')
+    reset_lexer()
+    lexer.input(data)
+    while True:
+        tok = lexer.token()
+        if not tok:
+            break
+        if tok.type == 'COLON_EQUAL':
+            res.pop()
+        elif tok.type == "EOL":
+            res.append(("EOL", '\n'))
+        else:
+            res.append((tok.type, tok.value))
+    res.append(("EOL", "\\n"))
+    res.append(("ENDPATH", "endpath"))
+    res.append(("EOL", "\\n"))
+    return res
+
+
+def lex_one(root, file, data=None):
+    """ 词法分析单个文件, 并单独记录该文件是否出现词法错误
+    返回值: (token列表, 是否出现词法错误)
+    """
+    global ERROR_FLAG
+    save = ERROR_FLAG
+    ERROR_FLAG = False
+    res = lex_file(root, file, data)
+    error = ERROR_FLAG
+    ERROR_FLAG = save or error
+    return (res, error)
+
+
+def lex_worker(task):
+    """ 词法分析子进程入口
+    参数:
+        task: (root, file, data), data为None时子进程自行读取文件
+    返回值: (file, token列表, 是否出现词法错误)
+    """
+    global CURRENT
+    (root, file, data) = task
+    # 错误信息中打印当前文件路径
+    CURRENT = file.replace(root, '')
+    (res, error) = lex_one(root, file, data)
+    return (file, res, error)
+
+
+def pre_lex(root, files, jobs, executor=None):
+    """ 使用进程池并行完成Kconfig文件的词法分析, 结果保存在LEXED中
+        合并阶段仍按source顺序串行展开, 保证输出与单进程一致
+    参数:
+        root: 内核源码路径
+        files: 待分析的Kconfig文件列表
+        jobs: 进程数
+        executor: 已创建的进程池, 为None时新建
+    """
+    global ERROR_FLAG
+    tasks = []
+    for file in files:
+        if not_parse(file, root) or file in LEXED:
+            continue
+        # 缓存命中的文件不需要重新分析
+        if CACHE is not None:
+            res = get_cache(file)
+            if res is not None:
+                LEXED[file] = res
+                continue
+        # 子进程无法共享的读取方式(例如git进程)由主进程读取文件内容
+        data = None if PROVIDER.local else PROVIDER.read(file)
+        tasks.append((root, file, data))
+    if len(tasks) == 0:
+        return
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pre_lex(root, files, jobs, executor)
+        return
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    for (file, res, error) in executor.map(lex_worker, tasks, chunksize=chunksize):
+        LEXED[file] = res
+        if CACHE is not None:
+            CACHE.put(file, res, error)
+        if error:
+            LEX_ERROR.add(file)
+            ERROR_FLAG = True
+
+
+def pre_lex_source(root, target, jobs):
+    """ source发现方式下的并行词法分析
+        从顶层Kconfig开始逐层分析, 每一层被source引用的文件并行分析
+    参数:
+        root: 内核源码路径
+        target: 体系架构
+        jobs: 进程数
+    """
+    files = [root + '/Kconfig']
+    seen = set(files)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        while len(files) > 0:
+            pre_lex(root, files, jobs, executor)
+            sources = []
+            for file in files:
+                for path in get_sources(LEXED.get(file, []), target):
+                    fullpath = root + '/' + path
+                    if fullpath not in seen:
+                        seen.add(fullpath)
+                        sources.append(fullpath)
+            files = sources
+
+
+def get_cache(file):
+    """ 读取缓存中的词法分析结果, 缓存失效时返回None """
+    global ERROR_FLAG
+    entry = CACHE.get(file)
+    if entry is None:
+        return None
+    if entry['error']:
+        LEX_ERROR.add(file)
+        ERROR_FLAG = True
+    return entry['tokens']
+
+
 def read_data(root, file):
-    global PATH
+    global CURRENT, ERROR_FLAG
     if not_parse(file, root):
         return []
-    dis(file, root)
-    PATH.append(file.replace(root, ''))
-    res = []
-    res.append("PATH path")
-    res.append("QUOTE_WORD \"" + file.replace(root, '') + '"')
-    res.append("EOL \\n")
-
-    with open(file, 'r', errors='ignore') as file:
-        data = file.read()
-        data = data.replace(u'\xa0', ' ')
-        lexer.input(data)
-        while True:
-            tok = lexer.token()
-            if not tok:
-                break
-            if tok.type == 'COLON_EQUAL':
-                res.pop()
-            elif tok.type == "WORD":
-                res.append('WORD ' + tok.value)
-            elif tok.type == "QUOTE_WORD":
-                res.append('QUOTE_WORD ' + tok.value)
-            elif tok.type == "EOL":
-                res.append('EOL \n')
-            else:
-                res.append(tok.type + ' ' + tok.value)
-    res.append("EOL \\n")
-    res.append("ENDPATH endpath")
-    res.append("EOL \\n")
+    CURRENT = file.replace(root, '')
+    VISITED.add(CURRENT)
+    PROGRESS.update(CURRENT)
+    if file in LEXED:
+        if file in LEX_ERROR:
+            ERROR_FLAG = True
+        return LEXED[file] if KEEP else LEXED.pop(file)
+    res = None
+    if CACHE is not None:
+        res = get_cache(file)
+    if res is None:
+        (res, error) = lex_one(root, file)
+        if CACHE is not None:
+            CACHE.put(file, res, error)
+        if error:
+            LEX_ERROR.add(file)
+    if KEEP:
+        LEXED[file] = res
     return res
 
 
-def write_file(file_name, result):
-    target = [
-        'mainmenu',
-        'menuconfig',
-        'menu',
-        'endmenu',
-        'endif',
-        'choice',
-        'endchoice',
-        'config',
-        'comment',
-        'path',
-        'endpath',
-    ]
-    with open(file_name, 'w') as file:
-        index = 0
-        while index < len(result):
-            if get_type(result[index]) == "EOL":
-                file.write('\n')
-                while index + 1 < len(result):
-                    if get_type(result[index + 1]) == "EOL":
-                        index += 1
-                    else:
-                        break
-            elif get_type(result[index]) == "HELP":
-                file.write('\t')
-                file.write(get_value(result[index]))
-                file.write('\n')
-            elif get_type(result[index]) == "HELP_CONTEXT":
-                file.write(get_value(result[index]))
-                file.write('\n')
-            elif get_type(result[index]) == "IF":
-                if get_type(result[index - 1]) != "EOL" and get_type(
-                        result[index - 1]) != "HELP_CONTEXT":
-                    file.write('\t')
-                file.write(get_value(result[index]))
-            elif get_value(result[index]) not in target:
-                file.write('\t')
-                file.write(get_value(result[index]))
-            else:
-                file.write(get_value(result[index]))
-            index += 1
+WRITE_BUFFER = 4096  # 写文件时每次合并写入的片段数量
+# 写入.Kconfig文件时不缩进的关键字
+NO_INDENT = {
+    'mainmenu',
+    'menuconfig',
+    'menu',
+    'endmenu',
+    'endif',
+    'choice',
+    'endchoice',
+    'config',
+    'comment',
+    'path',
+    'endpath',
+}
 
 
-def get_type(target):
-    res = target.split(' ', 1)
-    return res[0]
+def tee_file(file_name, result):
+    """ 将token流写入.Kconfig文件, 同时原样输出token
+        逐个读取token并合并为较大的块写入文件, 不需要保存完整的token列表
+    参数:
+        file_name: .Kconfig文件路径
+        result: (类型, 值)形式的token序列
+    返回值: token生成器
+    """
+    with open(file_name, 'w') as file:
+        buffer = []
+        last = None
+        for (type, value) in result:
+            yield (type, value)
+            if type == "EOL":
+                # 连续的换行只保留一个
+                if last != "EOL":
+                    buffer.append('\n')
+            elif type == "HELP":
+                buffer.append('\t' + value + '\n')
+            elif type == "HELP_CONTEXT":
+                buffer.append(value + '\n')
+            elif type == "IF":
+                if last != "EOL" and last != "HELP_CONTEXT":
+                    buffer.append('\t')
+                buffer.append(value)
+            elif value not in NO_INDENT:
+                buffer.append('\t' + value)
+            else:
+                buffer.append(value)
+            last = type
+            if len(buffer) >= WRITE_BUFFER:
+                file.write(''.join(buffer))
+                buffer = []
+        file.write(''.join(buffer))
 
 
-def get_value(target):
-    res = target.split(' ', 1)
-    if len(res) > 1:
-        return res[1]
-    else:
-        return None
+def write_file(file_name, result):
+    """ 将token流写入.Kconfig文件 """
+    for item in tee_file(file_name, result):
+        pass
 
 
-def handle_source(root, file, target, result):
-    if not_parse(file, root):
-        return result
+def handle_source(root, file, target):
+    """ 按顺序输出Kconfig文件的token, 遇到source语句时递归展开被引用的文件
+        展开在读到source语句时进行, 与原先拼接token列表的顺序一致,
+        但不再复制整个列表, 同一时刻只保留source链上各文件的token
+    参数:
+        root: 内核源码路径
+        file: Kconfig文件路径
+        target: 体系架构
+    返回值: token生成器
+    """
     res = read_data(root, file)
     index = 0
     while index < len(res):
-        if get_type(res[index]) == "SOURCE" \
-                and get_type(res[index + 1]) == "QUOTE_WORD": # arch/$(SRCARCH)/Kconfig
-            path = get_value(res[index + 1])[1:len(get_value(res[index + 1])) -1]
-            if path.count("$(SRCARCH)") > 0:
-                path = path.replace("$(SRCARCH)", target)
-            if path.count("$SRCARCH") > 0:
-                path = path.replace("$SRCARCH", target)
-            if path.count("$(HEADER_ARCH)") > 0:
-                path = path.replace("$(HEADER_ARCH)", target)
-            tmp = path.split('/')
-            if tmp[0] != 'scripts' and tmp[0] != 'Documentation':
-                fullpath = root + '/' + path
-                if path not in PATH:
-                    tmp = read_data(root, fullpath)
-                    res = res[0:index + 1] + tmp + res[index + 2:len(res)]
-            else:
-                index += 1
-        elif get_type(res[index]) == "DEPENDS" and get_type(res[index + 1]) != "ON":
-            result.append(res[index])
-            result.append('ON on')
+        (type, value) = res[index]
+        if type == "SOURCE" and res[index + 1][0] == "QUOTE_WORD": # arch/$(SRCARCH)/Kconfig
+            path = source_path(res[index + 1][1], target)
+            if path is not None:
+                # 已读取过的文件由read_data中的not_parse过滤
+                yield from handle_source(root, root + '/' + path, target)
+            # 跳过source语句中的路径
+            index += 1
+        elif type == "DEPENDS" and res[index + 1][0] != "ON":
+            yield (type, value)
+            yield ("ON", "on")
         else:
-            result.append(res[index])
+            yield (type, value)
         index += 1
-    return result
 
 
-def traversal(root, path, target, result):
-    if not os.path.exists(path):
+def source_path(value, target):
+    """ 解析source语句中的路径
+    参数:
+        value: source语句中的QUOTE_WORD, 例如"arch/$(SRCARCH)/Kconfig"
+        target: 体系架构
+    返回值: 相对内核源码的路径, 不需要处理的文件返回None
+    """
+    path = value[1:-1]
+    if path.count("$(SRCARCH)") > 0:
+        path = path.replace("$(SRCARCH)", target)
+    if path.count("$SRCARCH") > 0:
+        path = path.replace("$SRCARCH", target)
+    if path.count("$(HEADER_ARCH)") > 0:
+        path = path.replace("$(HEADER_ARCH)", target)
+    tmp = path.split('/')
+    if tmp[0] == 'scripts' or tmp[0] == 'Documentation':
+        return None
+    return path
+
+
+def get_sources(res, target):
+    """ 返回token列表中所有source语句引用的路径 """
+    for index in range(len(res) - 1):
+        if res[index][0] == "SOURCE" and res[index + 1][0] == "QUOTE_WORD":
+            path = source_path(res[index + 1][1], target)
+            if path is not None:
+                yield path
+
+
+def find_kconfig(root, path, target):
+    """ 按遍历顺序依次返回目录下需要处理的Kconfig文件
+        同一目录下先返回Kconfig文件, 再进入子目录
+    参数:
+        root: 内核源码路径
+        path: 当前遍历的目录
+        target: 体系架构
+    """
+    index = PROVIDER.scan_dir(path)
+    if index is None:
         print("Wrong path!" + path)
-        return result
-    files = os.listdir(path)
-
-    for file in files:
-        if re.match(r'Kconfig[\.]*', file):
-            if not not_parse(path + '/' + file, root):
-                result = handle_source(root, path + '/' + file, target, result)
+        return
+    (files, dirs) = index
 
     for file in files:
-        if os.path.isdir(path + '/' + file):
-            if path + '/' + file == root + "/Documentation":
-                continue
-            if path + '/' + file == root + "/scripts":
-                file += '/gcc-plugins'
-            if path + '/' + file == root + "/arch":
-                file += '/' + target
-            result = traversal(root, path + '/' + file, target, result)
+        yield path + '/' + file
 
-    return result
+    for file in dirs:
+        if path + '/' + file == root + "/Documentation":
+            continue
+        if path + '/' + file == root + "/scripts":
+            file += '/gcc-plugins'
+        if path + '/' + file == root + "/arch":
+            file += '/' + target
+        yield from find_kconfig(root, path + '/' + file, target)
 
 
-def preprocessing(root, target, file, display):
-    global PATH, display_switch
-    display_switch = display
-    PATH = []
+def traversal(root, files, target):
+    for file in files:
+        yield from handle_source(root, file, target)
+
+
+def expand(root, target, file, jobs, discover, consume=None):
+    """ 展开一个体系架构的source语句并写入.Kconfig文件
+    参数:
+        root: 内核源码路径
+        target: 体系架构
+        file: 预处理结果保存路径, 融合模式下可以为None
+        jobs: 词法分析进程数
+        discover: Kconfig文件发现方式
+        consume: 融合模式下处理token流的函数consume(target, tokens), 为None时只写入文件
+    """
+    global VISITED, ERROR_FLAG
+    VISITED = set()
+    ERROR_FLAG = False
     begin = time.time()
-    result = traversal(root, root, target, [])
+    PROGRESS.begin('preprocess ' + target, 'read file => ', display_switch)
+    if discover == 'source':
+        files = [root + '/Kconfig']
+        if jobs > 1:
+            pre_lex_source(root, target, jobs)
+    else:
+        files = find_kconfig(root, root, target)
+        if jobs > 1:
+            files = list(files)
+            pre_lex(root, files, jobs)
+    tokens = traversal(root, files, target)
+    if consume is None:
+        # 边展开source边写文件
+        write_file(file, tokens)
+    else:
+        # 融合模式, token流直接交给consume, .Kconfig文件可选
+        if file is not None:
+            tokens = tee_file(file, tokens)
+        consume(target, tokens)
+    PROGRESS.end()
     cost = time.time() - begin
-    write_file(file, result)
     print("\nPreprocessing time\t\t{}".format(str(cost)))
     if ERROR_FLAG:
         print("{:<40}".format("[WARMING]") + "There is an unknown error. Note the error message above!")
 
+
+def preprocessing_archs(root, targets, files, display, jobs=1, cache=None, discover='walk', rev=None, consume=None):
+    """ 一次预处理多个体系架构
+        各架构共用词法分析结果, 与架构无关的Kconfig文件只分析一次
+    参数:
+        targets: 体系架构列表
+        files: 与targets对应的预处理结果保存路径列表
+        consume: 融合模式下处理各体系架构token流的函数, 见expand
+    """
+    global LEXED, KEEP, LEX_ERROR, CACHE, PROVIDER, display_switch
+    display_switch = display
+    LEXED = {}
+    KEEP = len(targets) > 1
+    LEX_ERROR = set()
+    PROVIDER = open_provider(root, rev)
+    CACHE = TokenCache(cache, PROVIDER) if cache else None
+    for (target, file) in zip(targets, files):
+        expand(root, target, file, jobs, discover, consume)
+    LEXED = {}
+    KEEP = False
+    if CACHE is not None:
+        print("{:<40}".format("[Token cache]") + "hit {} miss {} => {}".format(CACHE.hit, CACHE.miss, cache))
+        CACHE.save()
+        CACHE = None
+    PROVIDER.close()
+    PROVIDER = FileProvider()
+
+
+def preprocessing(root, target, file, display, jobs=1, cache=None, discover='walk', rev=None):
+    preprocessing_archs(root, [target], [file], display, jobs, cache, discover, rev)
@@ -0,0 +1,11 @@
+# preprocess_lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BOOL', 'CHOICE', 'CLOSE_PARENT', 'COLON_EQUAL', 'COMMENT', 'CONFIG', 'DEFAULT', 'DEF_BOOL', 'DEF_TRISTATE', 'DEPENDS', 'DOLLER', 'ENDCHOICE', 'ENDIF', 'ENDMENU', 'EOL', 'EQUAL', 'GREATER', 'GREATER_EQUAL', 'HELP', 'HELP_CONTEXT', 'HEX', 'IF', 'IMPLY', 'INT', 'LESS', 'LESS_EQUAL', 'MAINMENU', 'MENU', 'MENUCONFIG', 'MODULES', 'NOT', 'ON', 'OPEN_PARENT', 'OPTIONAL', 'OR', 'PLUS_EQUAL', 'PROMPT', 'QUOTE_WORD', 'RANGE', 'SELECT', 'SOURCE', 'STRING', 'TRISTATE', 'UNEQUAL', 'VISIBILE', 'WORD'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'STRING': 'exclusive', 'HELP': 'exclusive', 'SOURCE': 'exclusive', 'SP': 'exclusive', 'WRONG': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_option>option.*\\n)|(?P<t_COLONEQUAL>:=)|(?P<t_BOOLEAN>boolean)|(?P<t_SOURCE>source)|(?P<t_HELP>help)|(?P<t_WORD>[\\.A-Za-z0-9_-]+)|(?P<t_EOL>\\n+)|(?P<t_NEXTLINE>\\\\\\n)|(?P<t_TO_STRING>\\" | \\\')|(?P<t_DOLLER>\\$\\()|(?P<t_ignore_commet>\\# .*)|(?P<t_OR>\\|\\|)|(?P<t_PLUS_EQUAL>\\+=)|(?P<t_AND>&&)|(?P<t_CLOSE_PARENT>\\))|(?P<t_GREATER_EQUAL>>=)|(?P<t_LESS_EQUAL><=)|(?P<t_OPEN_PARENT>\\()|(?P<t_UNEQUAL>!=)|(?P<t_EQUAL>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_NOT>!)', [None, ('t_option', 'option'), ('t_COLONEQUAL', 'COLONEQUAL'), ('t_BOOLEAN', 'BOOLEAN'), ('t_SOURCE', 'SOURCE'), ('t_HELP', 'HELP'), ('t_WORD', 'WORD'), ('t_EOL', 'EOL'), ('t_NEXTLINE', 'NEXTLINE'), ('t_TO_STRING', 'TO_STRING'), ('t_DOLLER', 'DOLLER'), (None, None), (None, 'OR'), (None, 'PLUS_EQUAL'), (None, 'AND'), (None, 'CLOSE_PARENT'), (None, 'GREATER_EQUAL'), (None, 'LESS_EQUAL'), (None, 'OPEN_PARENT'), (None, 'UNEQUAL'), (None, 'EQUAL'), (None, 'GREATER'), (None, 'LESS'), (None, 'NOT')])], 'STRING': [('(?P<t_STRING_NOTEND>\\\\\\" | \\\\\\\')|(?P<t_STRING_END>\\" | \\\')|(?P<t_STRING_CONTEXT>[^\\n\\r\\"\\\'\\\\])|(?P<t_STRING_NL>\\n+)', [None, ('t_STRING_NOTEND', 'NOTEND'), ('t_STRING_END', 'END'), ('t_STRING_CONTEXT', 'CONTEXT'), ('t_STRING_NL', 'NL')])], 'HELP': [('(?P<t_HELP_CONTEXT>[\\S ]+)|(?P<t_HELP_WHITESPACE>[ \\t]+)|(?P<t_HELP_NL>\\n+)', [None, ('t_HELP_CONTEXT', 'CONTEXT'), ('t_HELP_WHITESPACE', 'WHITESPACE'), ('t_HELP_NL', 'NL')])], 'SOURCE': [('(?P<t_SOURCE_CONTEXT>.*\\n)|(?P<t_SOURCE_DOT>\\")', [None, ('t_SOURCE_CONTEXT', 'CONTEXT'), ('t_SOURCE_DOT', 'DOT')])], 'SP': [('(?P<t_SP_IF>[ |\\t]+if[ |\\t]+)|(?P<t_SP_NL>\\n)|(?P<t_SP_CONTEXT>[^\\n\\(\\)])|(?P<t_SP_BEGIN>\\()|(?P<t_SP_END>\\))', [None, ('t_SP_IF', 'IF'), ('t_SP_NL', 'NL'), ('t_SP_CONTEXT', 'CONTEXT'), ('t_SP_BEGIN', 'BEGIN'), ('t_SP_END', 'END')])], 'WRONG': [('(?P<t_WRONG_NL>.*\\n)', [None, ('t_WRONG_NL', 'NL')])]}
+_lexstateignore = {'HELP': '', 'SOURCE': '', 'SP': '', 'STRING': '', 'WRONG': '', 'INITIAL': '[ \t-]+'}
+_lexstateerrorf = {'HELP': 't_HELP_error', 'SOURCE': 't_SOURCE_error', 'SP': 't_SP_error', 'STRING': 't_STRING_error', 'WRONG': 't_WRONG_error', 'INITIAL': 't_error'}
+_lexstateeoff = {}
+_rulesdigest  = '34e8dcf9941dffb67e596707ca1447618a72c314'
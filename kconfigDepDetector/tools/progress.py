@@ -0,0 +1,124 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+各处理阶段共用的进度显示
+
+    * 终端显示: 仅在标准输出为终端时刷新当前处理的对象, 按时间间隔限制刷新频率,
+      终端宽度只在阶段开始时读取一次
+    * 进度流: 以JSON lines格式写入文件, 供批量任务读取, 每行为一个事件
+        {"event": "begin" | "update" | "end", "phase": 阶段, "count": 已处理数量,
+         "elapsed": 已用时间(秒), "item": 当前处理的对象}
+
+未开启终端显示和进度流时, update只进行一次计数
+"""
+
+import json
+import shutil
+import sys
+import time
+
+
+class Progress:
+    """
+    进度显示
+
+    属性包括:
+        * interval: 最小刷新间隔(秒)
+        * phase: 当前阶段
+        * label: 终端显示的前缀
+        * count: 当前阶段已处理数量
+        * display: 是否在终端显示
+        * stream: 进度流文件
+        * active: 是否需要输出
+    """
+    def __init__(self, interval=0.1) -> None:
+        self.interval = interval
+        self.phase = None
+        self.label = ''
+        self.count = 0
+        self.begin_time = 0
+        self.next_time = 0
+        self.columns = 80
+        self.display = False
+        self.stream = None
+        self.active = False
+
+    def open_stream(self, path):
+        """ 打开进度流, path为'-'时写入标准错误 """
+        self.close_stream()
+        self.stream = sys.stderr if path == '-' else open(path, 'a')
+
+    def close_stream(self):
+        if self.stream is not None and self.stream is not sys.stderr:
+            self.stream.close()
+        self.stream = None
+
+    def begin(self, phase, label, display):
+        """ 开始新的阶段
+        参数:
+            phase: 阶段名称, 例如preprocess、parse
+            label: 终端显示的前缀
+            display: 终端打印开关
+        """
+        self.phase = phase
+        self.label = label
+        self.count = 0
+        self.begin_time = time.monotonic()
+        self.next_time = self.begin_time
+        self.display = display and sys.stdout.isatty()
+        if self.display:
+            self.columns = shutil.get_terminal_size().columns
+        self.active = self.display or self.stream is not None
+        self.write('begin', None)
+
+    def update(self, item, *args):
+        """ 处理一个对象
+        参数:
+            item: 当前处理的对象, 为函数时仅在需要输出时调用item(*args)生成
+        """
+        self.count += 1
+        if not self.active:
+            return
+        now = time.monotonic()
+        if now < self.next_time:
+            return
+        if callable(item):
+            item = item(*args)
+        if not item:
+            return
+        self.next_time = now + self.interval
+        if self.display:
+            print(("\r" + self.label + item).ljust(self.columns - 30), end='\r', flush=True)
+        self.write('update', item)
+
+    def end(self):
+        """ 结束当前阶段 """
+        self.write('end', None)
+        self.phase = None
+        self.active = False
+
+    def write(self, event, item):
+        if self.stream is None:
+            return
+        data = {
+            'event': event,
+            'phase': self.phase,
+            'count': self.count,
+            'elapsed': round(time.monotonic() - self.begin_time, 3),
+        }
+        if item is not None:
+            data['item'] = item
+        self.stream.write(json.dumps(data) + '\n')
+        self.stream.flush()
+
+
+PROGRESS = Progress()
@@ -0,0 +1,268 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+预处理阶段的内核源码读取方式
+
+预处理只需要读取Kconfig文件和遍历目录, 不同的源码来源提供相同的接口
+    * read(file): 读取文件内容
+    * scan_dir(path): 返回目录下的(Kconfig文件列表, 子目录列表), 目录不存在时返回None
+    * stat(file): 判断文件是否变化的签名, 用于词法分析缓存
+    * hash(file): 文件内容哈希, 用于词法分析缓存
+    * close(): 释放资源
+
+文件路径均为"内核源码路径/相对路径"的形式, 与读取本地目录时一致
+    * FileProvider: 本地目录
+    * GitProvider: git仓库中指定版本的文件, 不需要检出
+    * TarProvider: 内核源码压缩包(.tar.gz/.tar.xz等), 不需要解压
+"""
+
+import hashlib
+import io
+import os
+import posixpath
+import re
+import subprocess
+import tarfile
+
+
+def decode(data):
+    """ 按open(file, 'r', errors='ignore')的方式解码文件内容 """
+    return io.TextIOWrapper(io.BytesIO(data), errors='ignore').read()
+
+
+class FileProvider:
+    """
+    读取本地目录中的内核源码
+
+    属性包括:
+        * index: {目录 : (Kconfig文件列表, 子目录列表)}, 本次预处理的目录扫描结果
+    """
+    # 子进程可以直接读取文件
+    local = True
+
+    def __init__(self) -> None:
+        self.index = {}
+
+    def read(self, file):
+        with open(file, 'r', errors='ignore') as data:
+            return data.read()
+
+    def scan_dir(self, path):
+        """ 扫描目录, 结果缓存在index中, 同一次预处理的多个架构不再重复访问文件系统
+            open_provider每次预处理创建新的实例, 源码更新后再次预处理时重新扫描
+            使用os.scandir一次读取目录项及其类型, 不需要对每个目录项调用os.path.isdir
+        参数:
+            path: 目录路径
+        返回值: (Kconfig文件列表, 子目录列表), 目录不存在时返回None
+        """
+        if path not in self.index:
+            try:
+                files = []
+                dirs = []
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if re.match(r'Kconfig[\.]*', entry.name):
+                            files.append(entry.name)
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                self.index[path] = (files, dirs)
+            except FileNotFoundError:
+                self.index[path] = None
+        return self.index[path]
+
+    def stat(self, file):
+        stat = os.stat(file)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def hash(self, file):
+        with open(file, 'rb') as data:
+            return hashlib.sha1(data.read()).hexdigest()
+
+    def close(self):
+        pass
+
+
+class TreeProvider:
+    """
+    在内存中保存目录索引的读取方式, 读取前一次性建立整个源码树的索引
+
+    属性包括:
+        * root: 源码路径
+        * dirs: {相对路径 : (Kconfig文件列表, 子目录列表)}
+    """
+    # 子进程需要由主进程读取文件内容
+    local = False
+
+    def __init__(self, root) -> None:
+        self.root = root
+        self.dirs = {'': ([], [])}
+
+    def add_dir(self, path):
+        """ 向索引中添加目录, 上级目录不存在时一并添加 """
+        if path in self.dirs:
+            return
+        (parent, name) = posixpath.split(path)
+        self.add_dir(parent)
+        self.dirs[path] = ([], [])
+        self.dirs[parent][1].append(name)
+        if re.match(r'Kconfig[\.]*', name):
+            self.dirs[parent][0].append(name)
+
+    def add_file(self, path):
+        """ 向索引中添加文件 """
+        (parent, name) = posixpath.split(path)
+        self.add_dir(parent)
+        if re.match(r'Kconfig[\.]*', name):
+            self.dirs[parent][0].append(name)
+
+    def relpath(self, file):
+        if file == self.root:
+            return ''
+        if file.startswith(self.root + '/'):
+            return posixpath.normpath(file[len(self.root) + 1:])
+        return None
+
+    def scan_dir(self, path):
+        return self.dirs.get(self.relpath(path), None)
+
+    def close(self):
+        pass
+
+
+class GitProvider(TreeProvider):
+    """
+    通过git cat-file --batch读取git仓库中指定版本的内核源码
+
+    属性包括:
+        * rev: 版本, 例如v5.10
+        * blobs: {相对路径 : blob哈希}
+        * process: 常驻的git cat-file进程
+    """
+    def __init__(self, root, rev) -> None:
+        super().__init__(root)
+        self.rev = rev
+        self.blobs = {}
+        self.load_tree()
+        self.process = subprocess.Popen(['git', '-C', root, 'cat-file', '--batch'],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def load_tree(self):
+        """ 通过一次git ls-tree建立目录索引 """
+        data = subprocess.run(['git', '-C', self.root, 'ls-tree', '-r', '-t', '-z', '--full-tree', self.rev],
+                              stdout=subprocess.PIPE, check=True).stdout
+        for item in data.decode('utf-8', errors='ignore').split('\0'):
+            if len(item) == 0:
+                continue
+            (info, path) = item.split('\t', 1)
+            (mode, type, sha) = info.split(' ')
+            if type == 'tree':
+                self.add_dir(path)
+            elif type == 'blob':
+                self.blobs[path] = sha
+                self.add_file(path)
+
+    def read(self, file):
+        sha = self.blobs.get(self.relpath(file), None)
+        if sha is None:
+            raise FileNotFoundError(file)
+        self.process.stdin.write(sha.encode() + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().split()
+        size = int(header[2])
+        data = self.process.stdout.read(size + 1)
+        return decode(data[:size])
+
+    def stat(self, file):
+        return [self.blobs[self.relpath(file)]]
+
+    def hash(self, file):
+        return self.blobs[self.relpath(file)]
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+class TarProvider(TreeProvider):
+    """
+    读取内核源码压缩包, 只顺序读取一次压缩包, 内存中只保存Kconfig文件的内容
+    压缩包内所有文件位于同一顶层目录(例如linux-5.10/)时, 该目录视为源码根目录
+
+    属性包括:
+        * files: {相对路径 : 文件内容}
+        * hashes: {相对路径 : 内容哈希}
+    """
+    def __init__(self, root) -> None:
+        super().__init__(root)
+        self.files = {}
+        self.hashes = {}
+        self.load_tar()
+
+    def load_tar(self):
+        names = []
+        data = {}
+        with tarfile.open(self.root, 'r|*') as tar:
+            for member in tar:
+                name = posixpath.normpath(member.name).lstrip('/')
+                if name == '.':
+                    continue
+                if member.isdir():
+                    names.append((name, True))
+                elif member.isfile():
+                    names.append((name, False))
+                    if re.match(r'Kconfig[\.]*', posixpath.basename(name)):
+                        data[name] = tar.extractfile(member).read()
+        # 去掉公共的顶层目录
+        top = set(name.split('/', 1)[0] for (name, isdir) in names)
+        prefix = ''
+        if len(top) == 1:
+            prefix = top.pop()
+            if all(name.startswith(prefix + '/') for (name, isdir) in names if name != prefix):
+                prefix += '/'
+            else:
+                prefix = ''
+        for (name, isdir) in names:
+            if not name.startswith(prefix) or name + '/' == prefix:
+                continue
+            path = name[len(prefix):]
+            if isdir:
+                self.add_dir(path)
+            else:
+                self.add_file(path)
+                if name in data:
+                    self.files[path] = data[name]
+                    self.hashes[path] = hashlib.sha1(data[name]).hexdigest()
+
+    def read(self, file):
+        data = self.files.get(self.relpath(file), None)
+        if data is None:
+            raise FileNotFoundError(file)
+        return decode(data)
+
+    def stat(self, file):
+        return [self.hashes[self.relpath(file)]]
+
+    def hash(self, file):
+        return self.hashes[self.relpath(file)]
+
+
+def open_provider(root, rev=None):
+    """ 根据参数选择源码读取方式
+    参数:
+        root: 内核源码路径, 为文件时视为源码压缩包
+        rev: git版本, 不为None时从git仓库中读取
+    """
+    if rev is not None:
+        return GitProvider(root, rev)
+    if os.path.isfile(root) and tarfile.is_tarfile(root):
+        return TarProvider(root)
+    return FileProvider()
@@ -0,0 +1,285 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+依赖表达式化简, 在写入预编译结果(_expr.json)之前对单词序列进行处理
+
+化简规则:
+    * 展开多余的括号: ( A ) => A, A && ( B && C ) => A && B && C, ( A && B ) || C => A && B || C,
+      整个表达式为||连接时保留最外层括号
+    * 删除重复项: ( A ) && ( A ) => A, A || B || A => A || B
+    * 常量折叠: SP_WORD在检查时总是取y, 与比较运算一起折叠为y; ! y => n, ! n => y;
+      删除&&中的y以及||中的n
+检查阶段按从左到右的顺序计算表达式, 计算配置项取值时会递归检查该配置项并记录错误,
+因此化简不改变各项的先后顺序, 只删除不会产生新检查的常量和重复项, 检查顺序与错误信息保持不变
+
+检查阶段&&、||的结果只保留y、m、n, 配置项本身的取值(例如int配置项的5)不经过转换,
+对这类取值展开括号、删除常量会改变结果, 因此只有&&、||、!的操作数全部为bool、tristate配置项时才化简
+包含[]、比较运算后跟括号、连续的!等check.py特殊处理的写法时同样保持原样
+
+主函数为simplify_expr(words, names)、simplify_condition(words, names), names为bool、tristate配置项名称集合
+"""
+
+import re
+
+
+TRISTATE = ('bool', 'tristate')
+CONST = {'y': 2, 'm': 1, 'n': 0}
+VALUE = {2: 'y', 1: 'm', 0: 'n'}
+COMPARE = ('EQUAL', 'UNEQUAL', 'LESS', 'LESS_EQUAL', 'GREATER', 'GREATER_EQUAL')
+OPERAND = ('WORD', 'QUOTE_WORD', 'SP_WORD')
+
+
+class Skip(Exception):
+    """ 表达式包含无法化简的写法 """
+
+
+# 表达式结构: [项], 各项以||连接; 项: [因子], 各因子以&&连接; 因子: (是否取反, 单元)
+# 单元: ('word', 单词序列) | ('const', 取值) | ('group', 表达式)
+def parse_or(words, pos, names):
+    (term, pos) = parse_and(words, pos, names)
+    terms = [term]
+    while pos < len(words) and words[pos][0] == 'OR':
+        (term, pos) = parse_and(words, pos + 1, names)
+        terms.append(term)
+    return (terms, pos)
+
+
+def parse_and(words, pos, names):
+    (factor, pos) = parse_factor(words, pos, names)
+    factors = [factor]
+    while pos < len(words) and words[pos][0] == 'AND':
+        (factor, pos) = parse_factor(words, pos + 1, names)
+        factors.append(factor)
+    return (factors, pos)
+
+
+def parse_factor(words, pos, names):
+    if pos >= len(words):
+        raise Skip()
+    if words[pos][0] != 'NOT':
+        (unit, pos) = parse_unit(words, pos, names)
+        return ((False, unit), pos)
+    pos += 1
+    if pos >= len(words) or words[pos][0] == 'NOT':
+        raise Skip()
+    # check.py中! SP_WORD同样取y
+    negative = words[pos][0] != 'SP_WORD'
+    (unit, pos) = parse_unit(words, pos, names)
+    return ((negative, unit), pos)
+
+
+def parse_unit(words, pos, names):
+    (type, value) = words[pos]
+    compare = pos + 2 < len(words) and words[pos + 1][0] in COMPARE and words[pos + 2][0] in OPERAND
+    if type == 'SP_WORD':
+        return (('const', 2), pos + 3 if compare else pos + 1)
+    if type == 'WORD':
+        if compare:
+            return (('word', tuple(words[pos:pos + 3])), pos + 3)
+        if value in CONST:
+            return (('const', CONST[value]), pos + 1)
+        if value not in names:
+            raise Skip()
+        return (('word', (words[pos],)), pos + 1)
+    if type == 'OPEN_PARENT':
+        (terms, pos) = parse_or(words, pos + 1, names)
+        if pos >= len(words) or words[pos][0] != 'CLOSE_PARENT':
+            raise Skip()
+        return (('group', terms), pos + 1)
+    raise Skip()
+
+
+def reduce_terms(terms):
+    """ 化简||连接的各项 """
+    result = []
+    for term in terms:
+        factors = reduce_factors(term)
+        if len(factors) == 1 and not factors[0][0] and factors[0][1][0] == 'group':
+            result.extend(factors[0][1][1])
+        else:
+            result.append(factors)
+    result = unique(result, emit_and)
+    if len(result) > 1:
+        result = [item for item in result if item != [(False, ('const', 0))]] or [[(False, ('const', 0))]]
+    return result
+
+
+def reduce_factors(factors):
+    """ 化简&&连接的各因子 """
+    result = []
+    for (negative, unit) in factors:
+        if unit[0] == 'group':
+            terms = reduce_terms(unit[1])
+            if len(terms) == 1 and not negative:
+                # 只有一项时括号内只包含&&, 直接展开
+                result.extend(terms[0])
+                continue
+            if len(terms) == 1 and len(terms[0]) == 1 and not terms[0][0][0]:
+                unit = terms[0][0][1]
+            else:
+                unit = ('group', terms)
+        if negative and unit[0] == 'const':
+            (negative, unit) = (False, ('const', 2 - unit[1]))
+        result.append((negative, unit))
+    result = unique(result, emit_factor)
+    if len(result) > 1:
+        result = [item for item in result if item != (False, ('const', 2))] or [(False, ('const', 2))]
+    return result
+
+
+def unique(items, emit):
+    """ 删除重复项, 保留第一次出现的位置 """
+    result = []
+    seen = set()
+    for item in items:
+        key = tuple(emit(item))
+        if key not in seen:
+            seen.add(key)
+            result.append(item)
+    return result
+
+
+def emit_or(terms):
+    result = []
+    for term in terms:
+        if len(result) > 0:
+            result.append(('OR', '||'))
+        result.extend(emit_and(term))
+    return result
+
+
+def emit_and(factors):
+    result = []
+    for factor in factors:
+        if len(result) > 0:
+            result.append(('AND', '&&'))
+        result.extend(emit_factor(factor))
+    return result
+
+
+def emit_factor(factor):
+    (negative, unit) = factor
+    result = [('NOT', '!')] if negative else []
+    if unit[0] == 'word':
+        result.extend(unit[1])
+    elif unit[0] == 'const':
+        result.append(('WORD', VALUE[unit[1]]))
+    else:
+        result.append(('OPEN_PARENT', '('))
+        result.extend(emit_or(unit[1]))
+        result.append(('CLOSE_PARENT', ')'))
+    return result
+
+
+def is_name(value):
+    """ 与check.get_config_value一致, 只有配置项名称会读取.config中的取值 """
+    return re.fullmatch('[A-Z0-9_x]+', value) is not None and re.fullmatch('-?[0-9]+', value) is None and \
+        value[0:2] != '0x'
+
+
+def evaluation_order(words):
+    """ check.py计算表达式时读取配置项取值的顺序, 每个配置项只记录第一次
+        check_expr从左到右计算, 遇到括号时由check_bracket计算整个括号,
+        check_bracket先计算内层括号, 括号内其余的配置项在括号结束时才计算
+    """
+    result = []
+    seen = set()
+
+    def visit(items):
+        for (type, value) in items:
+            if type == 'WORD' and is_name(value) and value not in seen:
+                seen.add(value)
+                result.append(value)
+
+    def bracket(pos):
+        temp = []
+        pos += 1
+        while pos < len(words) and words[pos][0] != 'CLOSE_PARENT':
+            if words[pos][0] == 'OPEN_PARENT':
+                pos = bracket(pos)
+            else:
+                temp.append(pos)
+                pos += 1
+        visit(direct_items(temp))
+        return pos + 1
+
+    def direct_items(positions):
+        items = []
+        for pos in positions:
+            if words[pos][0] == 'SP_WORD' or (pos >= 2 and words[pos - 2][0] == 'SP_WORD' and
+                                              words[pos - 1][0] in COMPARE):
+                continue
+            items.append(words[pos])
+        return items
+
+    pos = 0
+    while pos < len(words):
+        if words[pos][0] == 'OPEN_PARENT':
+            pos = bracket(pos)
+        else:
+            visit(direct_items([pos]))
+            pos += 1
+    return result
+
+
+def tristate_names(types):
+    """ 所有定义均为bool、tristate类型的配置项名称
+    参数:
+        types: {配置项名称 : [类型]}
+    """
+    return {name for name in types if all(type in TRISTATE for type in types[name])}
+
+
+def simplify_expr(words, names):
+    """ 化简完整的依赖表达式(dep、组条件), 无法化简时返回原单词序列
+    参数:
+        words: expr.lex_expr的结果[(类型, 取值)]
+        names: bool、tristate配置项名称集合
+    """
+    if words is None or len(words) == 0:
+        return words
+    try:
+        (terms, pos) = parse_or(words, 0, names)
+        if pos != len(words):
+            return words
+        terms = reduce_terms(terms)
+        if len(terms) > 1:
+            # 检查时组条件与dep以&&直接连接, ||连接的结果保留在括号内
+            result = emit_factor((False, ('group', terms)))
+        else:
+            result = emit_or(terms)
+        # 展开括号会改变check_bracket的计算顺序, 顺序变化时保持原样
+        if evaluation_order(result) != evaluation_order(words):
+            return words
+        return result
+    except Skip:
+        return words
+
+
+def simplify_condition(words, names):
+    """ 化简rev_select、restrict中[]内的if条件, 其余部分由check.py按各自的规则处理, 保持原样 """
+    if words is None:
+        return words
+    result = []
+    pos = 0
+    while pos < len(words):
+        if words[pos][0] != 'OPEN_BRACKET':
+            result.append(words[pos])
+            pos += 1
+            continue
+        end = pos + 1
+        while end < len(words) and words[end][0] != 'CLOSE_BRACKET':
+            end += 1
+        result.append(words[pos])
+        result.extend(simplify_expr(words[pos + 1:end], names))
+        pos = end
+    return result
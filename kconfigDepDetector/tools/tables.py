@@ -0,0 +1,115 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+ply词法分析器的缓存表, 与parsetab.py一样随代码提交在tools目录下
+
+ply.lex每次构建词法分析器都要检查全部规则并读取模块源码, 使用缓存表(optimize模式)时直接读取
+    * check_lextab.py: check_lex
+    * config_lextab.py: config_lex
+    * preprocess_lextab.py: preprocess
+optimize模式不检查缓存表与规则是否一致, 因此缓存表中保存词法规则的摘要_rulesdigest(记号、状态、各规则的正则表达式及顺序),
+只使用摘要与当前规则一致的缓存表, 与文件修改时间无关
+tools目录下的缓存表不在运行时改写; 规则修改后在用户缓存目录(KCONFIG_CACHE_DIR, 默认~/.cache/kconfigDepDetector)
+生成缓存表, 更新提交的缓存表使用write_tables
+"""
+
+import hashlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+
+import ply.lex as lex
+
+
+MODULES = {
+    'tools.check_lex': 'check_lextab',
+    'tools.config_lex': 'config_lextab',
+    'tools.preprocess': 'preprocess_lextab',
+}
+
+
+def cache_folder():
+    """ 规则修改后生成的缓存表目录 """
+    folder = os.environ.get('KCONFIG_CACHE_DIR', None)
+    if folder is None:
+        folder = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'kconfigDepDetector')
+    return folder
+
+
+def rules_digest(module):
+    """ 词法规则的摘要, 与ply.lex构建词法分析器时使用的内容相同, 修改注释和动作代码不改变摘要 """
+    info = lex.LexerReflect(dict(vars(module)), log=lex.NullLogger())
+    info.get_all()
+    rules = [lex.__tabversion__, list(info.tokens), info.literals, sorted(info.stateinfo.items()),
+             sorted(info.ignore.items()), sorted((state, f.__name__) for (state, f) in info.errorf.items())]
+    for state in sorted(info.stateinfo):
+        rules.append([(name, lex._get_regex(f)) for (name, f) in info.funcsym[state]])
+        rules.append(info.strsym[state])
+    return hashlib.sha1(repr(rules).encode()).hexdigest()
+
+
+def load_table(path, digest):
+    """ 读取摘要一致的缓存表, 不存在或不一致时返回None """
+    if not os.path.exists(path):
+        return None
+    spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+    table = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(table)
+    except Exception:
+        return None
+    if getattr(table, '_rulesdigest', None) != digest or getattr(table, '_tabversion', None) != lex.__tabversion__:
+        return None
+    return table
+
+
+def write_table(lexer, lextab, folder, digest):
+    """ 写入缓存表并追加规则摘要, 先写入临时文件再替换, 多个进程同时生成时互不影响 """
+    os.makedirs(folder, exist_ok=True)
+    temp = tempfile.mkdtemp(dir=folder)
+    try:
+        lexer.writetab(lextab, temp)
+        with open(os.path.join(temp, lextab + '.py'), 'a') as file:
+            file.write('_rulesdigest  = %s\n' % repr(digest))
+        os.replace(os.path.join(temp, lextab + '.py'), os.path.join(folder, lextab + '.py'))
+    finally:
+        shutil.rmtree(temp, ignore_errors=True)
+
+
+def build_lexer(name, lextab):
+    """ 使用缓存表构建词法分析器, 在定义词法规则的模块末尾调用
+    参数:
+        name: 定义词法规则的模块名称, 即__name__
+        lextab: 缓存表模块名称
+    返回值: ply.lex.Lexer
+    """
+    module = sys.modules[name]
+    digest = rules_digest(module)
+    for folder in (os.path.dirname(module.__file__), cache_folder()):
+        table = load_table(os.path.join(folder, lextab + '.py'), digest)
+        if table is not None:
+            return lex.lex(module=module, optimize=1, lextab=table)
+    lexer = lex.lex(module=module)
+    try:
+        write_table(lexer, lextab, cache_folder(), digest)
+    except OSError:
+        pass
+    return lexer
+
+
+def write_tables():
+    """ 重新生成tools目录下提交的缓存表, 修改词法规则后调用 """
+    for (name, lextab) in MODULES.items():
+        module = importlib.import_module(name)
+        write_table(lex.lex(module=module), lextab, os.path.dirname(module.__file__), rules_digest(module))
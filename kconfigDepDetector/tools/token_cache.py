@@ -0,0 +1,106 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+预处理词法分析结果的持久化缓存
+
+缓存以Kconfig文件路径为键, 保存文件的签名(本地文件为修改时间和大小)、内容哈希以及词法分析结果
+    * 签名未变化时直接使用缓存
+    * 签名变化时计算内容哈希, 哈希一致仍可使用缓存(例如git checkout后仅修改时间变化)
+    * 其余情况需要重新进行词法分析
+签名和哈希由源码读取方式提供, 见provider.py
+
+词法分析器的输出格式发生变化时, 需要同步修改CACHE_VERSION使旧缓存失效
+"""
+
+import json
+import os
+
+
+CACHE_VERSION = 3
+
+
+class TokenCache:
+    """
+    Kconfig文件词法分析结果的缓存
+
+    属性包括:
+        * path: 缓存文件路径
+        * provider: 源码读取方式
+        * data: {Kconfig文件路径 : 缓存项}
+        * hit: 命中次数
+        * miss: 未命中次数
+        * changed: 缓存内容是否需要写回文件
+    """
+    def __init__(self, path, provider) -> None:
+        self.path = path
+        self.provider = provider
+        self.data = {}
+        self.hit = 0
+        self.miss = 0
+        self.changed = False
+        self.load()
+
+    def load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            print("{:<40}".format("[WARMING]") + "Broken token cache, ignore => " + self.path)
+            return
+        if data.get('version', None) == CACHE_VERSION:
+            self.data = data.get('files', {})
+
+    def get(self, file):
+        """ 查找文件的缓存项
+        参数:
+            file: Kconfig文件路径
+        返回值: 缓存项 {'tokens', 'error', ...}, 缓存失效时返回None
+        """
+        entry = self.data.get(file, None)
+        if entry is None:
+            self.miss += 1
+            return None
+        stat = self.provider.stat(file)
+        if entry['stat'] != stat:
+            if entry['hash'] != self.provider.hash(file):
+                self.miss += 1
+                return None
+            entry['stat'] = stat
+            self.changed = True
+        self.hit += 1
+        return entry
+
+    def put(self, file, tokens, error):
+        """ 保存文件的词法分析结果
+        参数:
+            file: Kconfig文件路径
+            tokens: 词法分析结果, (类型, 值)形式的token列表
+            error: 词法分析过程中是否出现错误
+        """
+        self.data[file] = {
+            'stat': self.provider.stat(file),
+            'hash': self.provider.hash(file),
+            'error': error,
+            'tokens': tokens,
+        }
+        self.changed = True
+
+    def save(self):
+        if not self.changed:
+            return
+        temp = self.path + '.tmp'
+        with open(temp, 'w') as file:
+            json.dump({'version': CACHE_VERSION, 'files': self.data}, file, separators=(',', ':'))
+        os.replace(temp, self.path)
+        self.changed = False
@@ -0,0 +1,231 @@
+# **********************************************************************
+# Copyright (c) 2022 Institute of Software, Chinese Academy of Sciences.
+# kconfigDepDetector is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#         http://license.coscl.org.cn/MulanPSL2
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, 
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY
+# OR FIT FOR A PARTICULAR PURPOSE.
+# See the Mulan PSL v2 for more details.
+# **********************************************************************/
+"""
+融合模式下语法分析使用的token来源
+
+预处理输出的token原本由write_file写成.Kconfig文本, 再由config_lex重新词法分析
+TokenStream直接把预处理的token转换为config_lex的token, 结果(类型、值、行号、位置)
+与分析.Kconfig文本时一致:
+    * 以行为单位转换, 每行开始时config_lex处于INITIAL状态
+    * help语句转换为HELP、HELP_CONTEXT, help之后的换行由config_lex的help状态吸收
+    * 无法保证一致的行(例如help之后紧跟缩进的语句、无法识别的取值),
+      按write_file的方式生成文本后交给config_lex分析, 直到下一条不缩进的语句
+"""
+
+import re
+
+from ply.lex import LexToken
+
+from . import config_lex
+from .preprocess import NO_INDENT
+
+
+OPERATOR = {
+    '||': 'OR',
+    '&&': 'AND',
+    '=': 'EQUAL',
+    '!=': 'UNEQUAL',
+    '<': 'LESS',
+    '<=': 'LESS_EQUAL',
+    '>': 'GREATER',
+    '>=': 'GREATER_EQUAL',
+    '!': 'NOT',
+    '(': 'OPEN_PARENT',
+    ')': 'CLOSE_PARENT',
+}
+WORD = re.compile(r'[\.A-Za-z0-9_-]+')
+
+
+def make_token(type, value, lineno, lexpos):
+    tok = LexToken()
+    tok.type = type
+    tok.value = value
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
+
+
+def classify(value):
+    """ 单独出现的value经config_lex分析后的(类型, 相对位置), 结果不是一个token时返回None """
+    if WORD.fullmatch(value):
+        if value.startswith('help'):
+            return None
+        if '.' in value:
+            return ('QUOTE_WORD', 0)
+        return (config_lex.reserved.get(value, 'WORD'), 0)
+    if value in OPERATOR:
+        return (OPERATOR[value], 0)
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"' and '"' not in value[1:-1]:
+        # 引号由TO_STRING规则读取, token从引号后开始
+        return ('QUOTE_WORD', 1)
+    if value.startswith('${{') and value.find('}}') == len(value) - 2:
+        return ('SP_WORD', 0)
+    return None
+
+
+def render(result):
+    """ 按write_file的规则生成每个token对应的文本
+        连续的换行只保留第一个, 其余不生成文本的换行直接跳过
+    返回值: (类型, 值, 文本)生成器
+    """
+    last = None
+    for (type, value) in result:
+        if type == "EOL":
+            if last != "EOL":
+                yield (type, value, '\n')
+        elif type == "HELP":
+            yield (type, value, '\t' + value + '\n')
+        elif type == "HELP_CONTEXT":
+            yield (type, value, value + '\n')
+        elif type == "IF":
+            if last != "EOL" and last != "HELP_CONTEXT":
+                yield (type, value, '\t' + value)
+            else:
+                yield (type, value, value)
+        elif value not in NO_INDENT:
+            yield (type, value, '\t' + value)
+        else:
+            yield (type, value, value)
+        last = type
+
+
+class TokenStream:
+    """
+    供ply.yacc使用的词法分析器, 只需要提供token()方法
+
+    属性包括:
+        * items: 预处理token对应的(类型, 值, 文本)
+        * ahead: 预读的下一项
+        * pending: 已转换、尚未交给yacc的token
+        * lineno: 当前行号, 从origin的行号继续计数
+        * pos: 已转换部分对应的文本长度
+        * origin: 语法分析对象使用的config_lex分析器, 结束时写回行号
+        * lexer: 无法直接转换时使用的origin的副本
+        * relexed: 交给config_lex分析的次数
+    """
+    def __init__(self, result, origin) -> None:
+        self.items = render(result)
+        self.ahead = None
+        self.pending = []
+        self.index = 0
+        self.lineno = origin.lineno
+        self.pos = 0
+        self.origin = origin
+        self.lexer = origin.clone()
+        self.relexed = 0
+
+    def next(self):
+        if self.ahead is not None:
+            item = self.ahead
+            self.ahead = None
+            return item
+        return next(self.items, None)
+
+    def peek(self):
+        if self.ahead is None:
+            self.ahead = next(self.items, None)
+        return self.ahead
+
+    def read_line(self):
+        """ 读取到换行为止的一行, help文本内部的换行不作为行结束 """
+        line = []
+        while True:
+            item = self.next()
+            if item is None:
+                break
+            line.append(item)
+            if item[0] == "EOL":
+                break
+        return line
+
+    def token(self):
+        while self.index >= len(self.pending):
+            self.pending = []
+            self.index = 0
+            line = self.read_line()
+            if len(line) == 0:
+                self.origin.lineno = self.lineno
+                return None
+            if not self.convert(line):
+                self.relex(line)
+        tok = self.pending[self.index]
+        self.index += 1
+        return tok
+
+    def convert(self, line):
+        """ 直接转换一行token, 无法保证与config_lex一致时返回False """
+        result = []
+        lineno = self.lineno
+        pos = self.pos
+        index = 0
+        while index < len(line):
+            (type, value, text) = line[index]
+            if type == "EOL":
+                result.append(make_token('EOL', '\n', lineno, pos))
+                lineno += 1
+            elif type == "HELP":
+                # HELP HELP_CONTEXT EOL, 且下一行不缩进时, help状态在换行处结束
+                if value != 'help' or index + 3 != len(line) or line[index + 1][0] != "HELP_CONTEXT" \
+                        or line[index + 2][0] != "EOL":
+                    return False
+                context = line[index + 1][1]
+                if not context.startswith('\t') or context.count('\n') != context.count('\n\t'):
+                    return False
+                ahead = self.peek()
+                if ahead is None or ahead[2].startswith('\t'):
+                    return False
+                result.append(make_token('HELP', 'help', lineno, pos + 1))
+                pos += len(text)
+                context = context + '\n' if self.lexer.keep_help else ''
+                result.append(make_token('HELP_CONTEXT', context, lineno, pos + len(line[index + 1][1])))
+                pos += len(line[index + 1][2]) + len(line[index + 2][2])
+                break
+            else:
+                indent = text.startswith('\t')
+                if not indent and index > 0:
+                    return False
+                kind = classify(value)
+                if kind is None:
+                    return False
+                result.append(make_token(kind[0], value, lineno, pos + indent + kind[1]))
+            pos += len(text)
+            index += 1
+        self.pending = result
+        self.lineno = lineno
+        self.pos = pos
+        return True
+
+    def relex(self, line):
+        """ 生成文本后由config_lex分析, 一直读取到下一条不缩进的语句
+            分析时附带下一条语句的文本, 使help状态能够正常结束
+        """
+        self.relexed += 1
+        texts = [item[2] for item in line]
+        while self.peek() is not None and self.ahead[2].startswith('\t'):
+            texts.extend(item[2] for item in self.read_line())
+        data = ''.join(texts)
+        end = len(data)
+        if self.peek() is not None:
+            data += self.ahead[2]
+        self.lexer.begin('INITIAL')
+        self.lexer.lineno = self.lineno
+        self.lexer.input(data)
+        result = []
+        while True:
+            tok = self.lexer.token()
+            if not tok or tok.lexpos >= end:
+                break
+            tok.lexpos += self.pos
+            result.append(tok)
+        self.pending = result
+        self.lineno = self.lexer.lineno
+        self.pos += end
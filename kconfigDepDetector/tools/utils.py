@@ -19,15 +19,17 @@
 """
 
 import json
+import os
 import re
 
 from .check_lex import lexer
+from .config_class import to_dict
 
 
 class EmployeeEncoder(json.JSONEncoder):
     """辅助自定义类结构写入json文件"""
     def default(self, o):
-        return o.__dict__
+        return to_dict(o)
 
 
 def load_Kconfig(path):
@@ -55,24 +57,135 @@ def load_json(path):
     return data
 
 
-def write_json_file(data, save_file):
+DEP_VERSION = 2  # _dep.json格式版本, 早期格式没有版本号
+CONFIG_VERSION = 2  # _config.json格式版本, 早期格式没有版本号
+
+
+def split_dep(data):
+    """ 将_dep.json的内容分为配置项依赖和组条件表
+        同一menu/if/choice内的配置项具有相同的组依赖条件, 只在组条件表中保存一次,
+        配置项依赖的group为组条件序号(没有组条件时不存在), dep只包含配置项自身的依赖
+        早期格式的dep为完整依赖条件, 组条件表为空
+    参数:
+        data: load_json读取的_dep.json内容
+    返回值: ({配置项名称 : [依赖]}, [组条件])
+    """
+    if isinstance(data.get('version', None), int):
+        return (data['config'], data['groups'])
+    return (data, [])
+
+
+def full_dep(item, groups):
+    """ 组条件与配置项自身依赖合并后的完整dep, 与早期格式中的dep一致 """
+    group = item.get('group', -1)
+    if group < 0:
+        return item['dep']
+    if len(item['dep']) > 0:
+        return groups[group] + ' && ' + item['dep']
+    return groups[group]
+
+
+def expand_dep(data):
+    """ 转换为早期格式{配置项名称 : [{type, rev_select, dep, restrict}]}, dep为完整依赖条件 """
+    if not isinstance(data.get('version', None), int):
+        return data
+    (config_dep, groups) = split_dep(data)
+    result = {}
+    for name in config_dep:
+        result[name] = []
+        for item in config_dep[name]:
+            item = dict(item)
+            item['dep'] = full_dep(item, groups)
+            item.pop('group', None)
+            result[name].append(item)
+    return result
+
+
+def load_dep(path):
+    """ 读取_dep.json, 返回值为早期格式, 供只处理完整依赖条件的代码使用 """
+    return expand_dep(load_json(path))
+
+
+def split_config(data):
+    """ 将_config.json的内容分为配置项信息和组信息表
+        menu、if、choice信息只在组信息表中保存一次, 配置项的group为组信息序号列表
+        早期格式的group为组信息本身, 组信息表为空
+    参数:
+        data: load_json读取的_config.json内容
+    返回值: ({配置项名称 : [配置项信息]}, [组信息])
+    """
+    if isinstance(data.get('version', None), int):
+        return (data['config'], data['groups'])
+    return (data, [])
+
+
+def expand_config(data):
+    """ 转换为早期格式{配置项名称 : [配置项信息]}, group为组信息本身 """
+    if not isinstance(data.get('version', None), int):
+        return data
+    (config, groups) = split_config(data)
+    result = {}
+    for name in config:
+        result[name] = []
+        for item in config[name]:
+            item = dict(item)
+            item['group'] = [groups[index] for index in item['group']]
+            result[name].append(item)
+    return result
+
+
+def load_config(path):
+    """ 读取_config.json, 返回值为早期格式, 供需要完整组信息的代码使用 """
+    return expand_config(load_json(path))
+
+
+def get_help_path(config_path):
+    """ 解析时跳过help的_config.json对应的help文件路径: tag_arch_config.json => tag_arch_config_help.json """
+    (root, ext) = os.path.splitext(config_path)
+    return root + '_help' + ext
+
+
+def load_help(path, data=None):
+    """ 读取配置项的help文本, 返回值: {配置项名称 : [help]}
+        解析时跳过help的_config.json从get_help_path文件读取, 该文件不存在时返回None
+    参数:
+        path: _config.json文件路径
+        data: 已读取的_config.json内容, 默认重新读取
+    """
+    if data is None:
+        data = load_json(path)
+    if isinstance(data.get('version', None), int) and not data.get('help', True):
+        help_path = get_help_path(path)
+        if not os.path.exists(help_path):
+            return None
+        return load_json(help_path)
+    (config, _) = split_config(data)
+    return {name: [item['help'] for item in config[name]] for name in config}
+
+
+def write_json_file(data, save_file, compact=False):
     """ 借助EmployeeEncoder类将数据写入json文件内
     参数:
         data: 自定义类数据
         save_file: 保存路径
+        compact: 不缩进、不加空格, 用于只由程序读取的文件
     返回值: None
     """
     print("{:<40}".format("[Write json]"))
-    jsonDate = json.dumps(data, indent=4, cls=EmployeeEncoder)
+    if compact:
+        jsonDate = json.dumps(data, separators=(',', ':'), cls=EmployeeEncoder)
+    else:
+        jsonDate = json.dumps(data, indent=4, cls=EmployeeEncoder)
     with open(save_file, 'w') as file:
         file.write(jsonDate)
 
 
-def get_word(line):
+def get_word(line, lexer=lexer):
     """ 获得输入字符串中的配置项名称
 
     参数:
         line (str): 输入字符串
+        lexer: check_lex分析器, 多线程同时使用时传入各自clone的分析器
 
     返回值:
         list: 配置项名称列表
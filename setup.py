@@ -13,6 +13,10 @@ setup(
     install_requires=[
         'ply'
         ],
+    # 批量检查时以矩阵形式计算依赖条件
+    extras_require={
+        'batch': ['numpy']
+    },
     python_requires='>=3',
     url='https://gitee.com/openeuler/kconfigDetector',
     author='sunying',